@@ -0,0 +1,486 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Petits benchmarks de performance (à lancer depuis la racine du projet)
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def bench_import(args):
+    """Measure the cold import time of blueprince.world in a fresh interpreter.
+
+    Parameters:
+    - args: argparse.Namespace with runs and budget_ms
+
+    Returns:
+    - int: process exit code (1 if the median exceeds the budget)
+    """
+    probe = (
+        "import time\n"
+        "t0 = time.perf_counter()\n"
+        "import blueprince.world\n"
+        "t1 = time.perf_counter()\n"
+        "from blueprince.assets import image_cache\n"
+        "print((t1 - t0) * 1000, image_cache.misses)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    timings = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, "-c", probe], env=env,
+                             capture_output=True, text=True, check=True).stdout
+        ms, decodes = out.split()
+        timings.append(float(ms))
+        if int(decodes) != 0:
+            print(f"import decoded {decodes} image(s): catalog is not lazy")
+            return 1
+
+    timings.sort()
+    median = timings[len(timings) // 2]
+    print(f"import blueprince.world: median {median:.1f} ms "
+          f"(min {timings[0]:.1f}, max {timings[-1]:.1f}, budget {args.budget_ms:.0f} ms)")
+    return 0 if median <= args.budget_ms else 1
+
+
+def _init_display(size=(900, 810)):
+    """Open a (possibly headless) window so that convert() has a target format."""
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    sys.path.insert(0, SRC_DIR)
+    import pygame
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+def _room_image_paths():
+    """Return every room PNG under assets/rooms, sorted."""
+    import glob
+    return sorted(glob.glob(os.path.join("assets", "rooms", "*", "*.png")))
+
+
+def bench_blit(args):
+    """Compare blit cost of per-sprite surfaces, before and after conversion, with atlas regions.
+
+    Three cases are timed separately so that each step shows its own gain:
+    unconverted per-sprite surfaces, per-sprite surfaces converted to the
+    display format, and converted atlas regions (built from the PNG files,
+    the asset pack is detached).
+
+    Parameters:
+    - args: argparse.Namespace with frames and size
+
+    Returns:
+    - int: process exit code
+    """
+    import time
+    screen = _init_display()
+    import pygame
+    from blueprince.assets import image_cache, sprite_store, convert_for_display
+
+    paths = _room_image_paths()
+    size = (args.size, args.size)
+
+    def frame_cost(sources):
+        t0 = time.perf_counter()
+        for _ in range(args.frames):
+            for i, (surface, area) in enumerate(sources):
+                screen.blit(surface, ((i % 10) * args.size, (i // 10) * args.size), area)
+        return (time.perf_counter() - t0) * 1000 / args.frames
+
+    def per_sprite():
+        return [(pygame.transform.scale(image_cache.rotated(p, i % 4), size), None) for i, p in enumerate(paths)]
+
+    # 1. Une surface redimensionnée par sprite, au format du PNG
+    unconverted = frame_cost(per_sprite())
+    # 2. Même chose avec les images converties au format de l'écran
+    convert_for_display()
+    converted = frame_cost(per_sprite())
+    # 3. Images converties, régions de l'atlas (sans le pack : tout passe par l'atlas)
+    sprite_store.attach_pack(None)
+    atlas = frame_cost([sprite_store.region(p, i % 4, size) for i, p in enumerate(paths)])
+    print(f"{len(paths)} sprites {size[0]}x{size[1]}, ms/frame: "
+          f"{unconverted:.3f} unconverted surfaces, "
+          f"{converted:.3f} converted surfaces (x{unconverted / converted:.1f}), "
+          f"{atlas:.3f} converted atlas (x{converted / atlas:.2f} vs converted surfaces); "
+          f"atlas {sprite_store.atlas.stats()}")
+    return 0
+
+
+def bench_fonts(args):
+    """Compare Game font creation with SysFont against the cached FontLoader.
+
+    Each variant runs in a fresh interpreter (font enumeration is cached per
+    process by pygame). The FontLoader is measured with an empty cache file
+    first, then with the file written by that first run.
+
+    Parameters:
+    - args: argparse.Namespace with runs
+
+    Returns:
+    - int: process exit code
+    """
+    import tempfile
+    sysfont_probe = (
+        "import pygame, time\n"
+        "pygame.font.init()\n"
+        "t0 = time.perf_counter()\n"
+        "fonts = [pygame.font.SysFont('arial', 28, bold=True),"
+        " pygame.font.SysFont('arial', 22), pygame.font.SysFont('arial', 20)]\n"
+        "print((time.perf_counter() - t0) * 1000)\n"
+    )
+    loader_probe = (
+        "import pygame, sys, time\n"
+        "pygame.font.init()\n"
+        "from blueprince.assets import FontLoader\n"
+        "loader = FontLoader(sys.argv[1])\n"
+        "t0 = time.perf_counter()\n"
+        "fonts = [loader.get('arial', 28, bold=True), loader.get('arial', 22), loader.get('arial', 20)]\n"
+        "print((time.perf_counter() - t0) * 1000)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, PYGAME_HIDE_SUPPORT_PROMPT="1")
+
+    def median_ms(probe, *argv, fresh_cache=None):
+        timings = []
+        for _ in range(args.runs):
+            if fresh_cache and os.path.exists(fresh_cache):
+                os.remove(fresh_cache)
+            out = subprocess.run([sys.executable, "-W", "ignore", "-c", probe, *argv], env=env,
+                                 capture_output=True, text=True, check=True).stdout
+            timings.append(float(out))
+        return sorted(timings)[len(timings) // 2]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, "fonts.json")
+        sysfont = median_ms(sysfont_probe)
+        cold = median_ms(loader_probe, cache_file, fresh_cache=cache_file)
+        warm = median_ms(loader_probe, cache_file)
+    print(f"3 game fonts: SysFont {sysfont:.1f} ms, FontLoader cold {cold:.1f} ms, "
+          f"FontLoader warm {warm:.1f} ms (median of {args.runs})")
+    return 0
+
+
+def bench_restart(args):
+    """Time Game.restart_game (R key) against rebuilding the catalog.
+
+    Parameters:
+    - args: argparse.Namespace with runs and budget_ms
+
+    Returns:
+    - int: process exit code (1 if the median restart exceeds the budget)
+    """
+    import time
+    _init_display()
+    from blueprince.game import Game
+    from blueprince.world import build_room_catalog
+
+    game = Game()
+
+    def median_ms(action):
+        timings = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            action()
+            timings.append((time.perf_counter() - t0) * 1000)
+        return sorted(timings)[len(timings) // 2]
+
+    rebuild = median_ms(build_room_catalog)
+    restart = median_ms(game.restart_game)
+    print(f"build_room_catalog(): {rebuild:.2f} ms, restart_game(): {restart:.2f} ms "
+          f"(median of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    return 0 if restart <= args.budget_ms else 1
+
+
+def bench_memory(args):
+    """Stress the derived-sprite caches over many restarts and report memory.
+
+    Every room image is requested in all 4 orientations at the cell and card
+    sizes on each cycle (worst case, without the asset pack), followed by a
+    restart_game(); derived variants must stay under their byte caps.
+
+    Parameters:
+    - args: argparse.Namespace with cycles, rotated_mb and atlas_mb
+
+    Returns:
+    - int: process exit code (1 if a cap is exceeded)
+    """
+    _init_display()
+    from blueprince.assets import image_cache, memory_report, sprite_store
+    from blueprince.game import Game
+    from blueprince.world import room_kinds
+
+    game = Game()
+    sprite_store.attach_pack(None)  # Pire cas : tout est dérivé des PNG
+    image_cache.rotated_variants.trim(int(args.rotated_mb * 1024 * 1024))
+    sprite_store.atlas.max_bytes = int(args.atlas_mb * 1024 * 1024)
+    paths = [image_cache.normalize(p) for p in _room_image_paths()]
+
+    mb = 1024 * 1024
+    for cycle in range(1, args.cycles + 1):
+        for path in paths:
+            for rot in range(4):
+                for size in ((80, 80), (game.card_size, game.card_size)):
+                    sprite_store.region(path, rot, size)
+        game.restart_game()
+        report = memory_report(room_kinds())
+        print(f"cycle {cycle}: original {report['original'] / mb:.1f} MB, "
+              f"rotated {report['rotated'] / mb:.1f} MB, scaled {report['scaled'] / mb:.1f} MB, "
+              f"atlas pages {report['atlas_pages'] / mb:.1f} MB")
+
+    heaviest = sorted(report["by_kind"].items(), key=lambda kv: -sum(kv[1].values()))[:5]
+    for kind, sizes in heaviest:
+        print(f"  {kind}: " + ", ".join(f"{k} {v / 1024:.0f} KB" for k, v in sizes.items()))
+    print(f"evictions: rotated {image_cache.rotated_variants.evictions}, "
+          f"atlas pages {sprite_store.atlas.evictions}")
+    caps = report["caps"]
+    return 0 if report["rotated"] <= caps["rotated"] and report["atlas_pages"] <= caps["atlas"] else 1
+
+
+def bench_gc(args):
+    """Compare frame times with automatic GC and with idle-time collections.
+
+    Renders frames with a restart_game() every few frames (a new Manor and
+    Player = fresh reference cycles), first under the interpreter's default
+    GC, then with the GCManager installed as in Game.run().
+
+    Parameters:
+    - args: argparse.Namespace with frames and restart_every
+
+    Returns:
+    - int: process exit code
+    """
+    import time
+    _init_display()
+    from blueprince.game import Game
+    from blueprince.gcmanager import GCManager
+
+    game = Game()
+    frame_ms = 1000 / game.fps
+
+    def play(manager):
+        timings = []
+        for frame in range(args.frames):
+            t0 = time.perf_counter()
+            if frame % args.restart_every == 0:
+                game.restart_game()
+            game.render()
+            work = (time.perf_counter() - t0) * 1000
+            timings.append(work)  # Seul le travail de la frame compte, la collecte d'inactivité est hors frame
+            if manager is not None:
+                manager.idle(frame_ms - work)
+        timings.sort()
+        return timings[len(timings) // 2], timings[int(len(timings) * 0.99)], timings[-1]
+
+    observer = GCManager()  # Mesure seulement : le GC automatique reste actif
+    observer.observe()
+    try:
+        before = play(None)
+    finally:
+        observer.stop_observing()
+
+    game.gc_manager.reset_stats()
+    game.gc_manager.install()
+    try:
+        after = play(game.gc_manager)
+    finally:
+        game.gc_manager.uninstall()
+
+    for label, timings, manager in (("automatic GC", before, observer), ("idle-time GC", after, game.gc_manager)):
+        median, p99, worst = timings
+        print(f"{label}: frame median {median:.2f} ms, p99 {p99:.2f} ms, max {worst:.2f} ms")
+        for name, pause in manager.stats()["pauses"].items():
+            print(f"  {name}: {pause['count']} pauses, {pause['total_ms']:.2f} ms total, "
+                  f"max {pause['max_ms']:.2f} ms")
+    print(f"frozen objects: {game.gc_manager.frozen}, forced collections: {game.gc_manager.forced}")
+    return 0
+
+
+def _instance_bytes(obj):
+    """Return the size of an instance plus its __dict__ (if any)."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def bench_catalog(args):
+    """Measure build_room_catalog(): construction time and per-instance memory.
+
+    Parameters:
+    - args: argparse.Namespace with runs
+
+    Returns:
+    - int: process exit code
+    """
+    import time
+    import tracemalloc
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    sys.path.insert(0, SRC_DIR)
+    from blueprince.world import build_room_catalog
+
+    timings = []
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        build_room_catalog()
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+
+    tracemalloc.start()
+    catalog = build_room_catalog()
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pool = [item for room in catalog for item in room.item_pool]
+    shared = {id(item): item for item in pool}.values()  # Prototypes partagés : comptés une fois
+    room_bytes = sum(_instance_bytes(room) for room in catalog)
+    item_bytes = sum(_instance_bytes(item) for item in shared)
+    print(f"build_room_catalog(): median {timings[len(timings) // 2]:.3f} ms "
+          f"(min {timings[0]:.3f}, median of {args.runs}), {traced / 1024:.1f} KB allocated")
+    print(f"{len(catalog)} rooms: {room_bytes / len(catalog):.0f} bytes/instance; "
+          f"{len(pool)} item pool entries -> {len(shared)} distinct items, {item_bytes / 1024:.1f} KB")
+    return 0
+
+
+def bench_simulate(args):
+    """Play random runs on the headless engine and report the throughput.
+
+    Parameters:
+    - args: argparse.Namespace with runs, seed and max_actions
+
+    Returns:
+    - int: process exit code (1 if pygame got imported along the way)
+    """
+    sys.path.insert(0, SRC_DIR)
+    from blueprince.simulate import simulate
+
+    stats = simulate(args.runs, seed=args.seed, max_actions=args.max_actions)
+    outcomes = ", ".join(f"{name} {count}" for name, count in stats["outcomes"].items())
+    print(f"{stats['runs']} runs in {stats['seconds']:.2f} s: {stats['runs_per_s']:.0f} runs/s "
+          f"({stats['actions']:.0f} actions, {stats['rooms_placed']:.1f} rooms placed per run)")
+    print(f"outcomes: {outcomes}")
+    weights = stats["weight_cache"]
+    print(f"room weight cache: {weights['hit_rate']:.0%} hits "
+          f"({weights['hits']} hits, {weights['misses']} misses)")
+    if "pygame" in sys.modules:
+        print("pygame was imported: the engine is not headless")
+        return 1
+    return 0
+
+
+def bench_sampler(args):
+    """Stress WeightedSampler with random weight updates, then time its draws.
+
+    Every trial builds a sampler, applies random set() calls (many of them
+    zeroing slots, as place_room does) and checks that find(0.0) and
+    sample() return a slot of positive weight whenever one exists, with
+    prefix sums matching the weights. The regression case of the leading
+    slots zeroed through set() (rounding left in the tree) is checked first.
+
+    Parameters:
+    - args: argparse.Namespace with trials and seed
+
+    Returns:
+    - int: process exit code (1 if a check fails)
+    """
+    import random
+    import time
+    sys.path.insert(0, SRC_DIR)
+    from blueprince.sampler import WeightedSampler
+
+    # Régression : cases de tête vidées par set(), l'arbre ne doit pas garder de reste d'arrondi
+    sampler = WeightedSampler([0.111, 0.222, 2.667])
+    sampler.set(0, 0.0)
+    sampler.set(1, 0.0)
+    if sampler.find(0.0) != 2 or sampler.prefix(2) != 0.0:
+        print(f"leading zeroed slots: find(0.0) = {sampler.find(0.0)}, prefix(2) = {sampler.prefix(2)}")
+        return 1
+
+    rng = random.Random(args.seed)
+    weights_pool = [0.037, 0.111, 0.333, 1.0, 2.667]  # Poids des pièces (1/3)^rareté x bonus
+    failures = 0
+    for _ in range(args.trials):
+        n = rng.randrange(1, 48)
+        weights = [rng.choice(weights_pool) * rng.randrange(1, 4) for _ in range(n)]
+        sampler = WeightedSampler(weights)
+        for _ in range(rng.randrange(1, 40)):
+            slot = rng.randrange(n)
+            weights[slot] = rng.choice((0.0, 0.0, rng.choice(weights_pool)))
+            sampler.set(slot, weights[slot])
+        live = [slot for slot, w in enumerate(weights) if w > 0]
+        if not live:
+            continue
+        try:
+            first = sampler.find(0.0)
+            drawn = sampler.sample(rng, live[:1])
+        except ValueError as error:
+            failures += 1
+            print(f"n={n}: {error}")
+            continue
+        if first != live[0] or (len(live) > 1 and drawn not in live[1:]) or \
+                abs(sampler.total() - sum(weights)) > 1e-9:
+            failures += 1
+            print(f"n={n}: find(0.0) = {first} (expected {live[0]}), sample = {drawn}")
+
+    sampler = WeightedSampler([1.0] * 5000)
+    t0 = time.perf_counter()
+    for _ in range(20000):
+        sampler.sample(rng, (1, 2500))
+    per_draw = (time.perf_counter() - t0) / 20000 * 1e6
+    print(f"{args.trials} random trials, {failures} failure(s); "
+          f"sample() with 2 exclusions over 5000 slots: {per_draw:.1f} us")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blue Prince performance checks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="cold import time of blueprince.world")
+    p_import.add_argument("--runs", type=int, default=5)
+    p_import.add_argument("--budget-ms", type=float, default=250.0)
+    p_import.set_defaults(func=bench_import)
+
+    p_blit = sub.add_parser("blit", help="blit cost: unconverted, converted, atlas regions")
+    p_blit.add_argument("--frames", type=int, default=200)
+    p_blit.add_argument("--size", type=int, default=80)
+    p_blit.set_defaults(func=bench_blit)
+
+    p_fonts = sub.add_parser("fonts", help="font creation: SysFont vs cached FontLoader")
+    p_fonts.add_argument("--runs", type=int, default=5)
+    p_fonts.set_defaults(func=bench_fonts)
+
+    p_restart = sub.add_parser("restart", help="restart_game latency")
+    p_restart.add_argument("--runs", type=int, default=50)
+    p_restart.add_argument("--budget-ms", type=float, default=10.0)
+    p_restart.set_defaults(func=bench_restart)
+
+    p_memory = sub.add_parser("memory", help="derived sprite memory over many restarts")
+    p_memory.add_argument("--cycles", type=int, default=5)
+    p_memory.add_argument("--rotated-mb", type=float, default=24.0)
+    p_memory.add_argument("--atlas-mb", type=float, default=16.0)
+    p_memory.set_defaults(func=bench_memory)
+
+    p_gc = sub.add_parser("gc", help="frame times with automatic vs idle-time GC")
+    p_gc.add_argument("--frames", type=int, default=600)
+    p_gc.add_argument("--restart-every", type=int, default=10)
+    p_gc.set_defaults(func=bench_gc)
+
+    p_catalog = sub.add_parser("catalog", help="catalog build time and per-instance memory")
+    p_catalog.add_argument("--runs", type=int, default=200)
+    p_catalog.set_defaults(func=bench_catalog)
+
+    p_simulate = sub.add_parser("simulate", help="headless random runs per second (no pygame)")
+    p_simulate.add_argument("--runs", type=int, default=500)
+    p_simulate.add_argument("--seed", type=int, default=0)
+    p_simulate.add_argument("--max-actions", type=int, default=400)
+    p_simulate.set_defaults(func=bench_simulate)
+
+    p_sampler = sub.add_parser("sampler", help="WeightedSampler consistency under updates and draw cost")
+    p_sampler.add_argument("--trials", type=int, default=20000)
+    p_sampler.add_argument("--seed", type=int, default=0)
+    p_sampler.set_defaults(func=bench_sampler)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
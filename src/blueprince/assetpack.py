@@ -0,0 +1,258 @@
+# pre-baked binary pack of room sprites (pre-decoded, pre-rotated, pre-scaled)
+import glob
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+PACK_PATH = os.path.join("assets", "rooms.pack")
+ROOMS_DIR = os.path.join("assets", "rooms")
+
+# Tailles produites par défaut : cellule du manoir (90 - 2*5) et carte de tirage
+CELL_SPRITE_SIZE = (80, 80)
+CARD_SPRITE_SIZE = (90, 90)
+
+MAGIC = b"BPPK"
+VERSION = 2  # 2 : sprites rangés dans des pages (atlas) au lieu d'un tampon par sprite
+PAGE_SIZE = (1024, 1024)
+# BGRA = ordre des octets d'une surface convert_alpha() sur un écran 32 bits little-endian,
+# les surfaces du pack se blittent donc sans conversion de format.
+PIXEL_FORMAT = "BGRA"
+_HEADER = struct.Struct("<4sI")  # magic, index length
+_ALIGN = 16
+
+
+def file_digest(path):
+    """Return the SHA-1 hex digest of a file's content.
+
+    Parameters:
+    - path: str, file path
+
+    Returns:
+    - str: hex digest
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def room_image_paths(rooms_dir=ROOMS_DIR):
+    """Return every room PNG under rooms_dir as normalized relative paths."""
+    return sorted(os.path.normpath(p) for p in glob.glob(os.path.join(rooms_dir, "*", "*.png")))
+
+
+def layout_pages(sprite_sizes, page_size=PAGE_SIZE):
+    """Shelf-pack sprites into atlas pages, like SpriteAtlas does at run time.
+
+    Parameters:
+    - sprite_sizes: list of (width, height)
+    - page_size: tuple[int, int], size of a full page (a larger sprite gets
+      a page of its own size)
+
+    Returns:
+    - tuple[list, list]: (page_index, x, y) per sprite, in input order, and
+      the (width, height) of each page, cut to the height actually used
+    """
+    page_w, page_h = page_size
+    places = [None] * len(sprite_sizes)
+    pages = []
+    current = None  # Page en cours de remplissage
+    x = y = shelf_h = 0
+    # Les plus hauts d'abord : étagères de hauteur homogène
+    for i in sorted(range(len(sprite_sizes)), key=lambda i: -sprite_sizes[i][1]):
+        w, h = sprite_sizes[i]
+        if w > page_w or h > page_h:
+            places[i] = (len(pages), 0, 0)
+            pages.append((w, h))
+            continue
+        if current is not None and x + w > page_w:  # Étagère suivante
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if current is None or y + h > page_h:  # Page suivante
+            current = len(pages)
+            pages.append((page_w, 0))
+            x = y = shelf_h = 0
+        places[i] = (current, x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+        pages[current] = (page_w, max(pages[current][1], y + h))
+    return places, pages
+
+
+def build_pack(pack_path=PACK_PATH, sources=None, sizes=(CELL_SPRITE_SIZE, CARD_SPRITE_SIZE),
+               page_size=PAGE_SIZE):
+    """Write a pack holding every source in 4 orientations at every size.
+
+    Parameters:
+    - pack_path: str, output file
+    - sources: list[str] or None, image paths (default: all room PNGs)
+    - sizes: iterable of (width, height) sprite sizes
+    - page_size: tuple[int, int], atlas page size (see layout_pages)
+
+    Returns:
+    - dict: {"sources", "entries", "pages", "bytes"} summary
+
+    Layout: MAGIC, index length, JSON index, then one raw pixel buffer
+    (PIXEL_FORMAT) per atlas page, aligned on 16 bytes. The index gives the
+    offset and size of each page and the page and rect of each sprite, so
+    the loader blits regions of the mapped pages without copying them. It
+    also stores the SHA-1 of each source so that a stale pack can be
+    detected at load time.
+    """
+    sources = room_image_paths() if sources is None else [os.path.normpath(p) for p in sources]
+    entries = []
+    sprites = []
+    for path in sources:
+        image = pygame.image.load(path)
+        for rot in range(4):
+            rotated = pygame.transform.rotate(image, -90 * rot) if rot else image
+            for size in sizes:
+                entries.append({"path": path, "rot": rot, "size": list(size)})
+                sprites.append(pygame.transform.scale(rotated, size))
+
+    places, page_sizes = layout_pages([sprite.get_size() for sprite in sprites], page_size)
+    pages = [pygame.Surface(size, pygame.SRCALPHA, 32) for size in page_sizes]
+    for entry, sprite, (page_index, x, y) in zip(entries, sprites, places):
+        w, h = sprite.get_size()
+        # Copie exacte (alpha compris) sur la page transparente, comme SpriteAtlas.add
+        pages[page_index].blit(sprite, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        entry["page"] = page_index
+        entry["rect"] = [x, y, w, h]
+
+    blobs = []
+    page_index_entries = []
+    offset = 0
+    for page in pages:
+        data = pygame.image.tobytes(page, PIXEL_FORMAT)
+        page_index_entries.append({"offset": offset, "size": list(page.get_size()), "length": len(data)})
+        padding = -len(data) % _ALIGN
+        blobs.append(data + b"\0" * padding)
+        offset += len(data) + padding
+
+    index = {
+        "version": VERSION,
+        "format": PIXEL_FORMAT,
+        "sources": {path: file_digest(path) for path in sources},
+        "pages": page_index_entries,
+        "entries": entries,
+    }
+    index_bytes = json.dumps(index).encode("utf-8")
+    data_start = _HEADER.size + len(index_bytes)
+    index_bytes += b" " * (-data_start % _ALIGN)  # Données alignées après l'index
+
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, pack_path)  # Jamais de pack à moitié écrit
+    return {"sources": len(sources), "entries": len(entries), "pages": len(pages),
+            "bytes": os.path.getsize(pack_path)}
+
+
+class AssetPack:
+    """Memory-mapped view over a pack written by build_pack().
+
+    Each atlas page is a Surface created with pygame.image.frombuffer
+    directly on the mapping, without copying the pixels; a sprite is a
+    (page, rect) region of it, blitted like a SpriteAtlas region. Sources
+    whose content hash no longer matches the file on disk are left out, so
+    callers fall back to decoding the PNG for them.
+    """
+
+    def __init__(self, path=PACK_PATH, verify=True):
+        """Map the pack file and read its index.
+
+        Parameters:
+        - path: str, pack file
+        - verify: bool, drop entries whose source file changed (default True)
+
+        Raises:
+        - ValueError: if the file is not a pack of a supported version
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not an asset pack")
+        index = json.loads(bytes(self._view[_HEADER.size:_HEADER.size + index_length]))
+        if index.get("version") != VERSION or index.get("format") != PIXEL_FORMAT:
+            self.close()
+            raise ValueError(f"{path}: unsupported pack version")
+        data_start = _HEADER.size + index_length
+
+        self.stale_sources = set()
+        if verify:
+            for source, digest in index["sources"].items():
+                if not os.path.exists(source) or file_digest(source) != digest:
+                    self.stale_sources.add(source)
+
+        # Pages = vues sur le mmap (aucune copie des pixels)
+        self.pages = []
+        for page in index["pages"]:
+            start = data_start + page["offset"]
+            self.pages.append(pygame.image.frombuffer(self._view[start:start + page["length"]],
+                                                      tuple(page["size"]), PIXEL_FORMAT))
+
+        self.entries = {}  # (path, rot, (w, h)) -> (page surface, pygame.Rect)
+        for e in index["entries"]:
+            if e["path"] in self.stale_sources:
+                continue
+            self.entries[(e["path"], e["rot"], tuple(e["size"]))] = (self.pages[e["page"]], pygame.Rect(e["rect"]))
+        self.hits = 0
+
+    def region(self, path, num_rotations, size):
+        """Return the packed sprite as a region of a mapped page, or None if absent.
+
+        Parameters:
+        - path: str, normalized source image path
+        - num_rotations: int, clockwise quarter turns
+        - size: tuple[int, int], sprite size
+
+        Returns:
+        - tuple[pygame.Surface, pygame.Rect] or None: page and area to blit
+          (shared, must not be modified)
+        """
+        found = self.entries.get((path, num_rotations % 4, tuple(size)))
+        if found is not None:
+            self.hits += 1
+        return found
+
+    def bytes(self):
+        """Return the bytes of pixel data mapped by the pages."""
+        return sum(page.get_width() * page.get_height() * 4 for page in self.pages)
+
+    def is_stale(self):
+        """Return True if at least one packed source changed since the build."""
+        return bool(self.stale_sources)
+
+    def close(self):
+        """Release the mapping (surfaces created from it must be dropped first)."""
+        self.pages = []
+        self.entries = {}
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+def load_pack(path=PACK_PATH):
+    """Open the pack at path if it exists and is readable.
+
+    Parameters:
+    - path: str, pack file
+
+    Returns:
+    - AssetPack or None: None when the pack is missing or unreadable (PNG fallback)
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError, struct.error):
+        return None
@@ -0,0 +1,682 @@
+# shared asset caches used by the rooms and the renderer
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+
+
+def to_display_format(surface):
+    """Return a copy of surface in the pixel format of the current display.
+
+    Parameters:
+    - surface: pygame.Surface
+
+    Returns:
+    - pygame.Surface: convert_alpha() copy for per-pixel alpha, convert() otherwise
+
+    Requires pygame.display.set_mode() to have been called.
+    """
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+# Plafonds par défaut des variantes dérivées (modifiables via .max_bytes)
+ROTATED_CACHE_BYTES = 24 * 1024 * 1024  # ~24 orientations 512x512
+ATLAS_CACHE_BYTES = 16 * 1024 * 1024  # 4 pages 1024x1024
+
+
+def surface_bytes(surface):
+    """Return the number of bytes held by a surface's pixel buffer."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceLRU:
+    """Least-recently-used store of surfaces bounded by a total byte size.
+
+    Inserting past max_bytes evicts the oldest entries; the entry just
+    inserted is always kept, even if it alone exceeds the cap.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> surface, du plus ancien au plus récent
+        self.bytes = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the surface under key (marking it recently used), or None."""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+        return surface
+
+    def put(self, key, surface):
+        """Store surface under key, then evict until the cap is respected.
+
+        Parameters:
+        - key: hashable
+        - surface: pygame.Surface
+
+        Returns:
+        - pygame.Surface: the stored surface
+        """
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= surface_bytes(previous)
+        self.entries[key] = surface
+        self.bytes += surface_bytes(surface)
+        self.trim()
+        return surface
+
+    def trim(self, max_bytes=None):
+        """Evict oldest entries until the total fits max_bytes (default: the cap).
+
+        Returns:
+        - int: number of evicted entries
+        """
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        evicted = 0
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, surface = self.entries.popitem(last=False)
+            self.bytes -= surface_bytes(surface)
+            evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Drop every entry (eviction counter kept)."""
+        self.entries.clear()
+        self.bytes = 0
+
+
+class ImageCache:
+    """Process-wide cache of decoded images keyed by file path.
+
+    Every PNG is decoded at most once per process; all callers asking for
+    the same path share the same pygame.Surface. Hit/miss counters make it
+    possible to check that a second Manor() costs zero decodes.
+
+    The rotated orientations (90/180/270 degrees clockwise) of an image are
+    computed on first request and shared by every rotated room copy. They
+    live in a SurfaceLRU capped at max_rotated_bytes, so an evicted
+    orientation is simply recomputed from the original next time.
+    """
+
+    def __init__(self, max_rotated_bytes=ROTATED_CACHE_BYTES):
+        self.surfaces = {}
+        self.rotated_variants = SurfaceLRU(max_rotated_bytes)  # (key, quarter_turns) -> surface
+        self.display_format = False  # True once convert_for_display() has run
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(path):
+        """Return the cache key used for a path (normalized separators)."""
+        return os.path.normpath(path)
+
+    def load(self, path):
+        """Return the shared Surface for path, decoding it on first request.
+
+        Parameters:
+        - path: str, image path (relative to the working directory)
+
+        Returns:
+        - pygame.Surface: shared surface, must not be modified in place
+        """
+        key = self.normalize(path)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = pygame.image.load(key)
+        if self.display_format:
+            surface = to_display_format(surface)
+        self.surfaces[key] = surface
+        return surface
+
+    def preload(self, paths, workers=None, progress=None):
+        """Decode every path not cached yet on a thread pool.
+
+        pygame releases the GIL while decoding, so decodes run concurrently
+        on every available core. Results are stored (and converted to the
+        display format when enabled) on the calling thread, which also
+        receives the progress callbacks and can keep a window alive.
+
+        Parameters:
+        - paths: iterable of str, image paths
+        - workers: int or None, pool size (default: os.cpu_count())
+        - progress: callable(done, total) or None, called after each decode
+
+        Returns:
+        - list[str]: paths that could not be decoded
+        """
+        pending = [key for key in dict.fromkeys(self.normalize(p) for p in paths)
+                   if key not in self.surfaces]
+        failed = []
+        if not pending:
+            return failed
+
+        workers = workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {pool.submit(pygame.image.load, key): key for key in pending}
+            for done, future in enumerate(as_completed(futures), start=1):
+                key = futures[future]
+                try:
+                    surface = future.result()
+                except (pygame.error, OSError):
+                    failed.append(key)  # L'appelant garde son propre repli (ex: icône grise)
+                else:
+                    self.misses += 1
+                    if self.display_format:
+                        surface = to_display_format(surface)
+                    self.surfaces[key] = surface
+                if progress:
+                    progress(done, len(pending))
+        return failed
+
+    def rotations(self, path):
+        """Return the 4 clockwise orientations of the image at path.
+
+        Parameters:
+        - path: str, image path
+
+        Returns:
+        - tuple[pygame.Surface]: index i is the image rotated by i * 90 degrees
+        """
+        return tuple(self.rotated(path, i) for i in range(4))
+
+    def rotated(self, path, num_rotations):
+        """Return the shared image at path rotated by num_rotations * 90 degrees.
+
+        Parameters:
+        - path: str, image path
+        - num_rotations: int, number of clockwise quarter turns
+
+        Returns:
+        - pygame.Surface: shared rotated surface
+        """
+        key = self.normalize(path)
+        num_rotations %= 4
+        if num_rotations == 0:
+            return self.load(key)
+        variant = self.rotated_variants.get((key, num_rotations))
+        if variant is None:
+            # pygame tourne dans le sens anti-horaire : angle négatif = sens horaire
+            variant = pygame.transform.rotate(self.load(key), -90 * num_rotations)
+            self.rotated_variants.put((key, num_rotations), variant)
+        return variant
+
+    def convert_for_display(self):
+        """Convert every cached image to the display pixel format.
+
+        Images loaded afterwards are converted as they are decoded. Rotated
+        variants are dropped so they get rebuilt from the converted sources.
+
+        Returns:
+        - int: number of converted surfaces
+        """
+        for key, surface in self.surfaces.items():
+            self.surfaces[key] = to_display_format(surface)
+        self.rotated_variants.clear()
+        self.display_format = True
+        return len(self.surfaces)
+
+    def stats(self):
+        """Return hit/miss counters and number of cached entries.
+
+        Returns:
+        - dict: {"hits", "misses", "entries", "rotated", "rotated_bytes", "rotated_evictions"}
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.surfaces),
+                "rotated": len(self.rotated_variants), "rotated_bytes": self.rotated_variants.bytes,
+                "rotated_evictions": self.rotated_variants.evictions}
+
+    def reset_stats(self):
+        """Reset hit/miss counters without dropping cached surfaces."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Drop every cached surface and reset counters."""
+        self.surfaces.clear()
+        self.rotated_variants.clear()
+        self.reset_stats()
+
+
+class SpriteAtlas:
+    """Shelf-packed atlas pages holding many small sprites.
+
+    Sprites are copied into a few large page surfaces the first time they
+    are added; callers then blit a region (page, area) instead of keeping a
+    separate Surface per sprite. Pages are allocated on demand, so an atlas
+    filled lazily only grows as far as the sprites actually used.
+
+    Once the pages reach max_bytes, the least recently used page is emptied
+    and reused instead of allocating a new one; its sprites are rebuilt on
+    their next request. A region is only valid until the next add().
+    """
+
+    def __init__(self, page_size=(1024, 1024), max_bytes=ATLAS_CACHE_BYTES):
+        self.page_size = page_size
+        self.max_bytes = max_bytes
+        self.pages = []  # pygame.Surface
+        self.shelves = []  # par page : liste de [y, hauteur, x_suivant]
+        self.page_ticks = []  # par page : dernier accès (horloge logique)
+        self.regions = {}  # key -> (page surface, pygame.Rect)
+        self.region_pages = {}  # key -> index de page
+        self.used_area = 0
+        self.clock = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the (page, area) region stored under key, or None."""
+        found = self.regions.get(key)
+        if found is not None:
+            self.clock += 1
+            self.page_ticks[self.region_pages[key]] = self.clock
+        return found
+
+    def add(self, key, sprite):
+        """Copy sprite into a free region of a page and remember it under key.
+
+        Parameters:
+        - key: hashable, region identifier
+        - sprite: pygame.Surface to copy
+
+        Returns:
+        - tuple[pygame.Surface, pygame.Rect]: page and area to blit from
+        """
+        w, h = sprite.get_size()
+        page_index, rect = self._allocate(w, h)
+        page = self.pages[page_index]
+        # Copie exacte (alpha compris) : la zone est transparente, MAX avec 0 = pixel source
+        page.fill((0, 0, 0, 0), rect)
+        page.blit(sprite, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self.used_area += w * h
+        self.regions[key] = (page, rect)
+        self.region_pages[key] = page_index
+        self.clock += 1
+        self.page_ticks[page_index] = self.clock
+        return page, rect
+
+    def _allocate(self, w, h):
+        """Find (or create) a shelf slot of w x h pixels; return (page index, Rect)."""
+        page_w, page_h = self.page_size
+        for page_index, shelves in enumerate(self.shelves):
+            for shelf in shelves:
+                shelf_y, shelf_h, next_x = shelf
+                if h <= shelf_h and next_x + w <= self.pages[page_index].get_width():
+                    shelf[2] += w
+                    return page_index, pygame.Rect(next_x, shelf_y, w, h)
+            # Nouvelle étagère sous la dernière si la page a encore de la place
+            top = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            if top + h <= self.pages[page_index].get_height() and w <= self.pages[page_index].get_width():
+                shelves.append([top, h, w])
+                return page_index, pygame.Rect(0, top, w, h)
+
+        # Plafond atteint : on vide et réutilise la page la moins récemment utilisée
+        if self.pages and self.bytes() + page_w * page_h * 4 > self.max_bytes:
+            page_index = self._evict_page()
+            page = self.pages[page_index]
+            if w <= page.get_width() and h <= page.get_height():
+                self.shelves[page_index] = [[0, h, w]]
+                return page_index, pygame.Rect(0, 0, w, h)
+
+        # Page neuve (un sprite plus grand qu'une page a sa propre page)
+        size = (max(page_w, w), max(page_h, h))
+        page = pygame.Surface(size, pygame.SRCALPHA, 32)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()  # Format de l'écran : blits sans conversion
+        self.pages.append(page)
+        self.shelves.append([[0, h, w]])
+        self.page_ticks.append(self.clock)
+        return len(self.pages) - 1, pygame.Rect(0, 0, w, h)
+
+    def _evict_page(self):
+        """Forget every region of the least recently used page; return its index."""
+        page_index = min(range(len(self.pages)), key=self.page_ticks.__getitem__)
+        for key in [k for k, i in self.region_pages.items() if i == page_index]:
+            rect = self.regions.pop(key)[1]
+            del self.region_pages[key]
+            self.used_area -= rect.width * rect.height
+        self.shelves[page_index] = []
+        self.evictions += 1
+        return page_index
+
+    def bytes(self):
+        """Return the bytes held by all pages."""
+        return sum(surface_bytes(p) for p in self.pages)
+
+    def region_bytes(self, key):
+        """Return the bytes of page memory used by the region under key (0 if absent)."""
+        found = self.regions.get(key)
+        if found is None:
+            return 0
+        page, rect = found
+        return rect.width * rect.height * page.get_bytesize()
+
+    def stats(self):
+        """Return page count, fill ratio and total bytes of the atlas.
+
+        Returns:
+        - dict: {"pages", "regions", "fill_ratio", "bytes", "max_bytes", "evictions"}
+        """
+        total_area = sum(p.get_width() * p.get_height() for p in self.pages)
+        return {
+            "pages": len(self.pages),
+            "regions": len(self.regions),
+            "fill_ratio": self.used_area / total_area if total_area else 0.0,
+            "bytes": self.bytes(),
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Drop every page and region."""
+        self.pages.clear()
+        self.shelves.clear()
+        self.page_ticks.clear()
+        self.regions.clear()
+        self.region_pages.clear()
+        self.used_area = 0
+
+
+class SpriteStore:
+    """Renderer-side store of pre-scaled room sprites.
+
+    A sprite is produced once per (image, rotation, size) from the shared
+    orientations of the ImageCache, copied into a SpriteAtlas and reused on
+    every following frame, so steady-state rendering does no scaling work
+    and blits regions of a few atlas pages.
+
+    When an AssetPack is attached, sprites it contains are regions of its
+    memory-mapped pages, returned as they are: they are neither decoded,
+    rotated and scaled nor copied into the atlas, which only holds the
+    sprites built from PNG files. hits/misses count the atlas only.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.pack = None
+        self.atlas = SpriteAtlas()  # (key, quarter_turns, (w, h)) -> region
+        self.touched = set()  # source images actually displayed since reset_touched()
+        self.hits = 0
+        self.misses = 0
+
+    def region(self, path, num_rotations, size):
+        """Return the atlas region holding the image at path, rotated and scaled.
+
+        Parameters:
+        - path: str, image path
+        - num_rotations: int, clockwise quarter turns
+        - size: tuple[int, int], target (width, height)
+
+        Returns:
+        - tuple[pygame.Surface, pygame.Rect]: page (of the pack or of the
+          atlas) and area to blit
+        """
+        sprite_key = (self.cache.normalize(path), num_rotations % 4, tuple(size))
+        if self.pack is not None:
+            found = self.pack.region(*sprite_key)
+            if found is not None:
+                return found  # Page du pack mappée : ni copie ni atlas
+        found = self.atlas.get(sprite_key)
+        if found is not None:
+            self.hits += 1
+            return found
+
+        # Repli PNG : sprite construit une fois puis copié dans une page de l'atlas
+        self.misses += 1
+        sprite = pygame.transform.scale(self.cache.rotated(path, num_rotations), sprite_key[2])
+        return self.atlas.add(sprite_key, sprite)
+
+    def get(self, path, num_rotations, size):
+        """Return the sprite as a Surface (subsurface view of its pack or atlas page).
+
+        Parameters:
+        - path: str, image path
+        - num_rotations: int, clockwise quarter turns
+        - size: tuple[int, int], target (width, height)
+
+        Returns:
+        - pygame.Surface: view sharing the page pixels
+        """
+        page, area = self.region(path, num_rotations, size)
+        return page.subsurface(area)
+
+    def attach_pack(self, pack):
+        """Use a pre-baked AssetPack (or None to detach) as first sprite source.
+
+        Parameters:
+        - pack: AssetPack or None
+        """
+        self.pack = pack
+        self.atlas.clear()
+
+    def room_region(self, room, size):
+        """Return what to blit for a room (current orientation) at the given size.
+
+        Parameters:
+        - room: Room instance
+        - size: tuple[int, int], target (width, height)
+
+        Returns:
+        - tuple[pygame.Surface, pygame.Rect or None] or None: source surface and
+          area (None = whole surface); None if the room has no image
+        """
+        path = getattr(room, "image_path", None)
+        if path:
+            self.touched.add(path)
+            return self.region(path, getattr(room, "rotation", 0) // 90, size)
+        image = room_image(room)
+        if image is not None:
+            # Pièce sans fichier connu : pas de clé stable, on redimensionne directement
+            return pygame.transform.scale(image, size), None
+        return None
+
+    def stats(self):
+        """Return hit/miss counters and atlas usage.
+
+        Returns:
+        - dict: {"hits", "misses", "entries", "touched", "atlas"}
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.atlas.regions),
+                "touched": len(self.touched), "atlas": self.atlas.stats()}
+
+    def reset_touched(self):
+        """Start a new count of displayed room images (e.g. for a new run)."""
+        self.touched.clear()
+
+    def clear(self):
+        """Drop every stored sprite and reset counters."""
+        self.atlas.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _default_font_cache_path():
+    """Return the on-disk font resolution cache (XDG cache directory)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "blueprince", "fonts.json")
+
+
+class FontLoader:
+    """Shared loader for the game fonts with an on-disk resolution cache.
+
+    pygame.font.SysFont enumerates every installed font (fc-list on Linux)
+    each time a process first asks for a system font. The resolved font
+    file is stored on disk, so later starts open it directly with
+    pygame.font.Font; Font objects are shared per (name, size, bold).
+    Only fonts actually found are stored: a font missing today is looked
+    up again on the next start, so installing it later is picked up.
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path or _default_font_cache_path()
+        self.resolved = None  # "name:bold" -> [path, faux_bold]
+        self.fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _read_cache(self):
+        if self.resolved is None:
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    self.resolved = json.load(f)
+            except (OSError, ValueError):
+                self.resolved = {}
+        return self.resolved
+
+    def _write_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(self.resolved, f)
+        except OSError:
+            pass  # Cache optionnel : on résoudra de nouveau au prochain lancement
+
+    def resolve(self, name, bold=False):
+        """Return (font file or None, faux_bold) for a system font name.
+
+        Parameters:
+        - name: str, font family (e.g. "arial")
+        - bold: bool, bold style requested
+
+        Returns:
+        - tuple[str or None, bool]: file to open (None = pygame default font)
+          and whether bold must be emulated, as SysFont would do
+        """
+        key = f"{name}:{'bold' if bold else 'regular'}"
+        resolved = self._read_cache()
+        entry = resolved.get(key)
+        if entry is not None and entry[0] is not None and os.path.exists(entry[0]):
+            self.hits += 1
+            return entry[0], entry[1]
+
+        self.misses += 1
+        path = pygame.font.match_font(name, bold=bold)  # Seule énumération des polices système
+        faux_bold = bold and (path is None or path == pygame.font.match_font(name))
+        if path is not None:
+            resolved[key] = [path, faux_bold]
+            self._write_cache()
+        elif resolved.pop(key, None) is not None:
+            # Police introuvable : jamais mémorisée (ancienne entrée None ou fichier disparu)
+            self._write_cache()
+        return path, faux_bold
+
+    def get(self, name, size, bold=False):
+        """Return the shared Font for (name, size, bold).
+
+        Parameters:
+        - name: str, font family
+        - size: int, point size
+        - bold: bool, bold style
+
+        Returns:
+        - pygame.font.Font
+        """
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            path, faux_bold = self.resolve(name, bold)
+            font = pygame.font.Font(path, size)
+            if faux_bold:
+                font.set_bold(True)
+            self.fonts[key] = font
+        return font
+
+    def stats(self):
+        """Return disk-cache hits/misses and number of shared fonts."""
+        return {"hits": self.hits, "misses": self.misses, "fonts": len(self.fonts)}
+
+
+# Instances partagées par toutes les pièces et par le rendu
+image_cache = ImageCache()
+sprite_store = SpriteStore(image_cache)
+font_loader = FontLoader()
+
+
+def room_image(room):
+    """Return a room's sprite in its current orientation.
+
+    Rooms are pure logic (world.py never touches pygame): they only carry an
+    image_path, or an explicit surface for rooms without file, plus a rotation.
+
+    Parameters:
+    - room: Room instance
+
+    Returns:
+    - pygame.Surface or None: decoded through the shared image cache the
+      first time it is needed; None if the room has no image
+    """
+    turns = getattr(room, "rotation", 0) // 90
+    if getattr(room, "image_path", None):
+        return image_cache.rotated(room.image_path, turns)
+    image = getattr(room, "image", None)
+    if image is not None and turns % 4:
+        return pygame.transform.rotate(image, -90 * turns)
+    return image
+
+
+def convert_for_display():
+    """Post-set_mode stage: move every cached room sprite to the display format.
+
+    Converts the decoded sources and drops the derived sprites, which are
+    re-derived (and therefore already converted) on their next request.
+
+    Returns:
+    - int: number of converted source images
+    """
+    converted = image_cache.convert_for_display()
+    sprite_store.clear()
+    return converted
+
+
+def memory_report(kinds=None):
+    """Account for the surface memory held by the shared caches.
+
+    Parameters:
+    - kinds: dict or None, normalized image path -> room kind name
+      (e.g. world.room_kinds()); paths missing from it count as "other"
+
+    Returns:
+    - dict: {"original", "rotated", "scaled", "atlas_pages", "pack_pages",
+      "caps", "by_kind"}; byte totals for decoded sources, rotated variants
+      (LRU) and scaled sprites (area used in the atlas), plus the allocated
+      atlas pages, the pages mapped from the attached AssetPack (file
+      backed, not copied) and the per-kind breakdown
+      {kind: {"original", "rotated", "scaled"}}
+    """
+    kinds = kinds or {}
+    by_kind = {}
+
+    def account(path, category, size):
+        kind = by_kind.setdefault(kinds.get(path, "other"), {"original": 0, "rotated": 0, "scaled": 0})
+        kind[category] += size
+
+    for path, surface in image_cache.surfaces.items():
+        account(path, "original", surface_bytes(surface))
+    for (path, _), surface in image_cache.rotated_variants.entries.items():
+        account(path, "rotated", surface_bytes(surface))
+    atlas = sprite_store.atlas
+    for key in atlas.regions:
+        account(key[0], "scaled", atlas.region_bytes(key))
+
+    return {
+        "original": sum(k["original"] for k in by_kind.values()),
+        "rotated": image_cache.rotated_variants.bytes,
+        "scaled": sum(k["scaled"] for k in by_kind.values()),
+        "atlas_pages": atlas.bytes(),
+        "pack_pages": sprite_store.pack.bytes() if sprite_store.pack is not None else 0,
+        "caps": {"rotated": image_cache.rotated_variants.max_bytes, "atlas": atlas.max_bytes},
+        "by_kind": by_kind,
+    }
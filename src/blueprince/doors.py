@@ -0,0 +1,52 @@
+# door sets as 4-bit masks (no pygame import here)
+
+# Un bit par porte, dans le sens horaire : tourner d'un quart de tour = décaler d'un bit
+UP, RIGHT, DOWN, LEFT = 1, 2, 4, 8
+ALL_DOORS = UP | RIGHT | DOWN | LEFT
+
+DOOR_BITS = {"up": UP, "right": RIGHT, "down": DOWN, "left": LEFT}
+OPPOSITE_BITS = {"up": DOWN, "right": LEFT, "down": UP, "left": RIGHT}  # porte d'en face, vue de la case voisine
+OPPOSITE_DOOR = {UP: DOWN, RIGHT: LEFT, DOWN: UP, LEFT: RIGHT}
+DOOR_OFFSETS = {UP: (0, -1), RIGHT: (1, 0), DOWN: (0, 1), LEFT: (-1, 0)}
+
+
+def rotate_doors(mask, turns):
+    """Rotate a door mask clockwise.
+
+    Parameters:
+    - mask: int, door mask (DOOR_BITS)
+    - turns: int, number of quarter turns (up -> right -> down -> left -> up)
+
+    Returns:
+    - int: rotated mask (4-bit rotation)
+    """
+    turns %= 4
+    return ((mask << turns) | (mask >> (4 - turns))) & ALL_DOORS
+
+
+def door_mask(doors):
+    """Return the mask of doors given as direction names (or already as a mask).
+
+    Parameters:
+    - doors: int, or iterable of "up"/"down"/"left"/"right", or None
+
+    Returns:
+    - int: door mask
+    """
+    if not doors:
+        return 0
+    if isinstance(doors, int):
+        return doors
+    mask = 0
+    for direction in doors:
+        mask |= DOOR_BITS[direction]
+    return mask
+
+
+def door_names(mask):
+    """Return the direction names of a door mask, clockwise from "up".
+
+    Returns:
+    - list[str]: e.g. ["up", "down"] for UP | DOWN
+    """
+    return [direction for direction, bit in DOOR_BITS.items() if mask & bit]
@@ -0,0 +1,454 @@
+# headless game core: state and rules of a run (no pygame import here, see game.py for the window)
+import random
+from .world import Manor
+from .entities import Player, KitCrochetage
+
+
+class GameEngine:
+    """State and transitions of one run, without window, images or input.
+
+    Everything the player can do is a method (open_door_menu,
+    confirm_room_choice, confirm_pickup_choice...) acting on plain
+    attributes: the pygame Game maps keys to these methods and draws the
+    attributes, while simulations call them directly. The engine only
+    needs the room spec table, never SDL nor the asset files.
+    """
+
+    def __init__(self, max_messages=3):
+        """Start a new run.
+
+        Parameters:
+        - max_messages: int, size of the message log kept for the HUD
+        """
+        self.messages = []
+        self.max_messages = max_messages
+        # Items du magasin, préparés par open_shop_menu
+        self.shop_items = []
+        self.restart()
+
+    def restart(self):
+        """Reinitialize the run state: new Manor and Player, menus closed.
+
+        Side effects:
+        - Creates new Manor and Player instances
+        - Resets all menu states and flags
+        - Clears message log and found permanents tracking
+        """
+        self.manor = Manor()
+        self.player = Player("Player", self.manor)
+        self.player.game = self
+        self.player.set_message_callback(self.add_message)
+        self.found_permanents = set()
+        self.manor.found_permanents = self.found_permanents
+
+        # === Sélecteur de porte + menu ===
+        self.selected_door = "up"
+        self.menu_active = False
+        self.menu_choices = []
+        self.menu_index = 0
+
+        # === SHOP MENU ===
+        self.shop_menu_active = False
+        self.shop_index = 0
+
+        # === Ramasser des objets ===
+        self.pickup_menu_active = False
+        self.pickup_index = 0
+        self.pickup_choices = []
+
+        self.messages.clear()
+        # === Game over state ===
+        self.game_over = False
+        self.game_over_message = ""
+        # === Victory state ===
+        self.victory = False
+        self.victory_message = ""
+
+        self.confirm_door_active = False  # Nouvel état pour la confirmation
+        self.confirm_door_details = {}    # Pour mémoriser quelle porte on ouvre
+
+    @property
+    def finished(self):
+        """True once the run is lost or won (only restart() changes it back)."""
+        return self.game_over or self.victory
+
+    def is_in_shop_room(self):
+        """Check if the player is currently in a shop room (yellow room).
+
+        Returns:
+        - bool: True if current room color is yellow, False otherwise.
+        """
+        x, y = self.player.position
+        room = self.manor.get_room(x, y)
+        return getattr(room, "color", None) == "yellow"
+
+    def add_message(self, text: str):
+        """Add a message to the log, maintaining max_messages limit.
+
+        Parameters:
+        - text: str, message text to append
+
+        Effects:
+        - Appends to self.messages list
+        - Removes oldest message if list exceeds max_messages
+        """
+        self.messages.append(text)
+        if len(self.messages) > self.max_messages:
+            self.messages.pop(0)
+
+    # ====================== PORTES ET TIRAGE ======================
+    def open_door_menu(self):
+        """Handle door opening logic with lock levels and key requirements.
+
+        Lock levels depend on Y position:
+        - Y 8-6: Level 0 (free)
+        - Y 5-4: Level 0 or 1 (random)
+        - Y 3-2: Level 1 or 2 (random)
+        - Y 1-0: Level 2
+
+        If player has KitCrochetage, level 1 locks can be picked for free.
+        Shows confirmation dialog if keys are required, otherwise opens directly.
+        """
+
+        if not self.player.can_move(self.selected_door, self.manor):
+            self.add_message("Cette direction n'est pas accessible.")
+            return
+
+        x, y = self.player.position
+        dx, dy = self.manor.get_direction_offset(self.selected_door)
+        nx, ny = x + dx, y + dy
+
+        # 1. Si la pièce existe déjà, on bouge
+        if self.manor.get_room(nx, ny):  # Already placed -> attempt movement instead of drafting
+            self.player.move(self.selected_door, self.manor)
+            return
+
+        # 2. Calculer le coût de la porte
+        lock_level = 0  # Difficulty escalates as player moves upward (towards y=0)
+        if ny in [8, 7, 6]:
+            lock_level = 0
+        elif ny in [5, 4]:
+            lock_level = random.choice([0, 1])
+        elif ny in [3, 2]:
+            lock_level = random.choice([1, 2])
+        elif ny in [1, 0]:
+            lock_level = 2
+
+        # 3. Vérifier les outils (Kit de crochetage)
+        has_lockpick = any(isinstance(obj, KitCrochetage) for obj in self.player.inventory.permanents)  # Enables bypass of level 1 cost
+
+        required_keys = 0 if lock_level == 0 else 1
+        pickaxe_msg = None
+
+        if lock_level == 1 and has_lockpick:  # Lockpick only waives level 1, not level 2
+            required_keys = 0
+            pickaxe_msg = "Vous crochetez la serrure (Niv 1)."
+
+        # 4. Vérifier si le joueur peut payer
+        if self.player.cles < required_keys:
+            self.add_message(f"Porte verrouillée ! (Niv {lock_level})")
+            if required_keys > 0:
+                self.add_message(f"Il vous faut {required_keys} clé(s).")
+            return
+
+        # 5. Stocker les détails pour la confirmation
+        self.confirm_door_details = {
+            'direction': self.selected_door,
+            'keys': required_keys,
+            'lock_level': lock_level,
+            'pickaxe_msg': pickaxe_msg
+        }
+
+        # 6. Demander confirmation OU ouvrir directement si gratuit
+        if required_keys > 0:  # Non-free door requires explicit confirmation
+            # Demander confirmation
+            self.confirm_door_active = True
+            self.add_message(f"Porte Niv {lock_level} ({required_keys} clé). [O]=Ouvrir / [A]=Annuler")
+        else:
+            # C'est gratuit (porte Niv 0 ou crochetage)
+            self._execute_door_opening()
+
+    def cancel_door_opening(self):
+        """Dismiss the key confirmation without spending anything."""
+        self.confirm_door_active = False
+        self.confirm_door_details = {}
+        self.add_message("Action annulée.")
+
+    def _execute_door_opening(self):
+        """Execute the door opening after confirmation.
+
+        Uses stored details from confirm_door_details to:
+        - Deduct required keys from player inventory
+        - Display lockpicking message if applicable
+        - Draw 3 room choices and activate room draft menu
+        - Refund keys if no rooms are available (error case)
+        """
+        # 1. Récupérer les détails stockés
+        details = self.confirm_door_details
+        required_keys = details['keys']
+        direction = details['direction']
+        pickaxe_msg = details['pickaxe_msg']
+
+        # 2. Payer le coût et afficher le message
+        if required_keys > 0:  # Deduct committed cost
+            self.player.cles -= required_keys
+            self.add_message(f"Vous utilisez {required_keys} clé(s).")
+        elif pickaxe_msg:
+            # Afficher le message de crochetage (si_execute_door_opening)
+            self.add_message(pickaxe_msg)
+
+        # 3. Ouvrir le menu de tirage des 3 pièces
+        self.menu_choices = self.manor.draw_three_rooms(
+            self.player.position,
+            direction,
+            self.manor.pioche
+        )
+
+        if not self.menu_choices:  # Draft failed (no compatible rooms) -> rollback cost and abort
+            self.add_message("Erreur : Aucune pièce compatible trouvée !")
+            # (On redonne les clés si elles ont été dépensées pour rien)
+            if required_keys > 0:
+                self.player.cles += required_keys  # Refund since no draft options
+            self.confirm_door_active = False
+            self.confirm_door_details = {}
+            return
+
+        self.menu_index = 0
+        self.menu_active = True # Activer le menu des pièces
+
+        # 4. Réinitialiser l'état de confirmation
+        self.confirm_door_active = False
+        self.confirm_door_details = {}
+
+    def reroll_room_choices(self):
+        """Use a die to reroll the 3 current room options. Requires player to have at least 1 die
+
+        Effects:
+        - Consumes 1 die from player inventory
+        - Generates new room choices for current door direction
+        - Resets menu_index to 0
+        """
+        if self.player.des <= 0:
+            self.add_message("Vous n'avez pas de dés pour relancer!")
+            return
+
+        self.player.des -= 1
+        self.add_message(f"Vous utilisez un dé pour relancer. Dés restants: {self.player.des}")
+
+        self.menu_choices = self.manor.draw_three_rooms(
+            self.player.position,
+            self.selected_door,
+            self.manor.pioche
+        )
+        # Reroll keeps door direction & deck; only the room selection changes
+
+        if not self.menu_choices:
+            self.add_message("Erreur: Aucune pièce compatible trouvée après relance!")
+            self.menu_active = False
+            return
+
+        self.menu_index = 0
+
+    def confirm_room_choice(self):
+        """Validate room choice and place it in the manor. Uses self.menu_index to identify chosen room from menu_choices
+
+        Effects:
+        - Deducts gem cost from player if room has gem_cost > 0
+        - Places chosen room in manor at calculated position
+        - Applies Nursery bonus if active and room is a bedroom type
+        - Closes room draft menu
+        """
+        chosen = self.menu_choices[self.menu_index]  # Selected RoomView (may have gem cost)
+        cost = getattr(chosen, 'gem_cost', 0)
+        if cost > 0:
+            if self.player.gemmes < cost:
+                self.add_message(f"Pas assez de gemmes (coût: {cost}).")
+                return
+            self.player.gemmes -= cost
+            self.add_message(f"- {cost} gemme(s)")
+
+        x, y = self.player.position
+        dx, dy = self.manor.get_direction_offset(self.selected_door)
+
+        nx, ny = x + dx, y + dy
+
+        chosen = self.manor.place_room(nx, ny, chosen)  # Commit placement & remove from catalog (view -> Room)
+        self.menu_active = False
+        self.add_message(f"Pièce ajoutée: {chosen.name}")
+
+        # LE BONUS de la piece NURSERY
+        if getattr(self.manor, "bonus_on_draft_bedroom", False):  # Nursery flag: extra steps on drafting bedroom types
+            if chosen.name in ("Bedroom", "BunkRoom", "GuestBedroom"):
+                self.player.gagner_pas(5)
+
+    # ====================== MAGASIN ======================
+    # choix de objet a echanger contre de l'or dans les pieces jaunes
+    def open_shop_menu(self):
+        """Initialize shop menu with available items.
+
+        Effects:
+        - Sets up shop_items list with name, cost, and effect lambda
+        - Resets shop_index to 0
+        - Does not activate menu automatically
+        """
+        # empêcher ouverture si un autre menu est actif
+        if self.menu_active or self.pickup_menu_active or self.confirm_door_active:
+            return
+
+        # items du shop
+        self.shop_items = [
+            ("Pomme", 2, lambda player: player.gagner_pas(2)),
+            ("Banane", 3, lambda player: player.gagner_pas(3)),
+            ("Gâteau", 8, lambda player: player.gagner_pas(10)),
+            ("Clé", 10, lambda player: setattr(player, "cles", player.cles + 1)),
+            ("Gemme", 3, lambda player: setattr(player, "gemmes", player.gemmes + 1)),
+        ]
+
+        self.shop_index = 0
+
+    def toggle_shop_menu(self):
+        """Open the shop menu in a yellow room, or close it if already open."""
+        if not self.is_in_shop_room():
+            return
+        if self.shop_menu_active:
+            self.shop_menu_active = False
+        else:
+            self.open_shop_menu()
+            self.shop_menu_active = True
+
+    def confirm_shop_choice(self):
+        """Process shop purchase for currently selected item. Uses self.shop_index to identify selected item
+
+        Effects:
+        - Deducts gold from player if purchase successful
+        - Applies item effect (adds steps, keys, gems, or permanent item)
+        - Shows message about purchase or insufficient gold
+        """
+        name, cost, effect = self.shop_items[self.shop_index]
+
+        if self.player.or_ < cost:
+            self.add_message(f"Pas assez d'or pour acheter {name}.")
+            return
+
+        self.player.or_ -= cost
+        effect(self.player)
+        self.add_message(f"Achat : {name} pour {cost} or.")
+
+    # ====================== OBJETS ======================
+    def open_object_pickup_menu(self):
+        """Open pickup menu for objects in current room.
+
+        Effects:
+        - Sets pickup_choices to current room's object stacks
+        - Activates pickup menu if objects are available
+        - Shows message if no objects present
+        """
+        x, y = self.player.position
+        room = self.manor.get_room(x, y)
+        if not room or not room.objets:
+            self.add_message("Il n'y a pas d'objets à ramasser ici.")
+            return
+
+        self.pickup_choices = room.objets
+        self.pickup_index = 0
+        self.pickup_menu_active = True
+
+    def confirm_pickup_choice(self):
+        """Validate and process object pickup from current room.
+
+        Side effects:
+        - Calls the pick_up method of the selected stack's object
+        - Removes one item from the stack (unless should_consume_on_pickup returns False)
+        - Tracks permanent objects globally to prevent respawning
+        - Updates pickup menu choices and index after removal
+        - Closes menu if no objects remain
+        """
+        # Bounds check to prevent IndexError
+        if not self.pickup_choices or self.pickup_index >= len(self.pickup_choices):
+            self.pickup_menu_active = False
+            return
+
+        stack = self.pickup_choices[self.pickup_index]
+        chosen = stack.objet
+        x, y = self.player.position
+        room = self.manor.get_room(x, y)
+        if not room:
+            return
+
+        if chosen.type == "permanent":
+            self.found_permanents.add(chosen.__class__.__name__)
+
+        chosen.pick_up(self.player)
+        # Ne retirer l'objet que s'il doit réellement être consommé.
+        remove_after = True  # Decide if object should be consumed/removed after pickup
+        if hasattr(chosen, 'should_consume_on_pickup'):
+            try:
+                remove_after = chosen.should_consume_on_pickup()
+            except Exception:
+                remove_after = True
+        if remove_after:
+            room.objets.take(stack)  # Une pile de N objets identiques perd un exemplaire
+
+        # Update pickup_choices to reflect current room state and reset index
+        self.pickup_choices = room.objets
+        if not self.pickup_choices:
+            self.pickup_menu_active = False
+            self.pickup_index = 0
+        else:
+            # Keep index valid after removal
+            self.pickup_index = min(self.pickup_index, len(self.pickup_choices) - 1)
+
+    # ====================== FIN DE PARTIE ======================
+    def check_end_conditions(self):
+        """Check and trigger game over or victory conditions.
+
+        Loss conditions:
+        - Player runs out of steps (not is_alive)
+        - No more rooms can be placed (manor.can_advance returns False)
+
+        Victory condition:
+        - Player reaches the Antechamber room
+        """
+        # 1) Lose: plus de pas
+        if not self.player.is_alive:
+            self.end_game("Vous n'avez plus de pas...\nGame Over.")
+        if not self.manor.can_advance():
+            self.end_game("Il n'y a plus de pièces disponibles pour avancer.\nGame Over.")
+            return
+
+        # 2) Win: joueur dans l'Antechamber
+        x, y = self.player.position
+        current_room = self.manor.get_room(x, y)
+        if current_room is not None and current_room.name == "Antechamber":
+            self.set_victory("Bravo ! Vous avez atteint l'Antechamber. Vous gagnez !")
+
+    def end_game(self, message: str):
+        """Trigger game over state.
+
+        Parameters:
+        - message: str, text to display on game over screen
+
+        Side effects:
+        - Sets game_over flag to True
+        - Stores message for overlay display
+        - Adds "GAME OVER" to message log
+        """
+        self.game_over = True
+        self.game_over_message = message
+        # Also push a concise last message into log
+        self.add_message("GAME OVER")
+
+    def set_victory(self, message: str):
+        """Trigger victory state.
+
+        Parameters:
+        - message: str, text to display on victory screen
+
+        Side effects:
+        - Sets victory flag to True
+        - Stores message for overlay display
+        - Adds "VICTOIRE !" to message log
+        """
+        self.victory = True
+        self.victory_message = message
+        self.add_message("VICTOIRE !")
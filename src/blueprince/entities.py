@@ -2,6 +2,8 @@
 from abc import ABC, abstractmethod
 import random
 
+from .doors import DOOR_BITS, OPPOSITE_BITS
+
 
 class Player:
     """Represents the player character with inventory, position, and resources.
@@ -41,7 +43,7 @@ class Player:
         self.is_alive = True    # Utile pour la boucle de jeu principale
         
         self.message_callback = None  # Callback function for messages
-        self.game = None  # Assigned by Game after creation; allows safe attribute access
+        self.game = None  # GameEngine, assigned after creation; allows safe attribute access
 
     def set_message_callback(self, callback):
         """Set callback function for displaying messages to player.
@@ -105,8 +107,8 @@ class Player:
         # Check for food items (Pomme, Banane, Gateau, Sandwich, Repas) or Pas objects
         step_giving_items = ["Pomme", "Banane", "Gâteau", "Sandwich", "Repas", "Pas"]  # 'Pas' kept for legacy compatibility
         
-        for obj in room.objets:
-            if obj.nom in step_giving_items:
+        for stack in room.objets:
+            if stack.objet.nom in step_giving_items:
                 return True
 
         return False
@@ -136,19 +138,16 @@ class Player:
         Returns:
         - bool: True if movement allowed, checks door existence and room bounds
         """
-        current_room = manor.get_room(*self.position)
-        if not current_room or direction not in current_room.doors:
-            return False
-            
         x, y = self.position
-        dx, dy = manor.get_direction_offset(direction)
-        nx, ny = x + dx, y + dy
-        
-        if not manor.in_bounds(nx, ny):
+        current_room = manor.get_room(x, y)
+        door = DOOR_BITS[direction]
+        # Porte présente ET menant dans la grille : un seul ET avec le masque de la case
+        if not current_room or not current_room.doors & manor.bounds_masks[y][x] & door:
             return False
-            
-        next_room = manor.get_room(nx, ny)
-        if next_room and self.opposite_direction[direction] not in next_room.doors:  # Require reciprocal door for valid corridor
+
+        dx, dy = manor.get_direction_offset(direction)
+        next_room = manor.get_room(x + dx, y + dy)
+        if next_room and not next_room.doors & OPPOSITE_BITS[direction]:  # Require reciprocal door for valid corridor
             return False
         return True   
     
@@ -179,7 +178,7 @@ class Player:
             self.add_message("Vous n’êtes dans aucune pièce.")
             return
 
-        if direction not in current_room.doors:  # No exit in chosen direction
+        if not current_room.doors & DOOR_BITS[direction]:  # No exit in chosen direction
             self.add_message(f"Pas de porte vers {direction} dans {current_room.name}.")
             return
 
@@ -200,9 +199,8 @@ class Player:
             self.add_message("Il n'y a pas encore de pièce dans cette direction.")
             return
 
-        opposite = {"up": "down", "down": "up", "left": "right", "right": "left"}
-        if opposite[direction] not in next_room.doors:  # Prevent one-way traversal into a sealed side
-            self.add_message(f"{next_room.name} n’a pas de porte vers {opposite[direction]}.")
+        if not next_room.doors & OPPOSITE_BITS[direction]:  # Prevent one-way traversal into a sealed side
+            self.add_message(f"{next_room.name} n’a pas de porte vers {self.opposite_direction[direction]}.")
             return
 
         self.position = [nx, ny]  # Commit movement
@@ -259,19 +257,28 @@ class Inventory:
 
 class Objet(ABC):
     """Classe abstraite représentant tout objet du jeu"""
+    # Pas de __dict__ par instance : chaque sous-classe déclare ses propres __slots__
+    __slots__ = ("nom", "description", "type_")
+
+    # Métadonnées de génération de butin, constantes par type d'objet (surchargées par les sous-classes)
+    is_metallic = False  # Defaults non-metallic unless subclass overrides
+    base_find_chance = 0.5  # Default baseline probability for loot generation
+    # Objets sans état propre : des exemplaires identiques se regroupent en une pile (ObjetStacks)
+    stackable = False
+
     def __init__(self, nom, description, type_objet):
         self.nom = nom
         self.description = description
         self.type_ = type_objet
-        # Alias pour compatibilité (certains endroits utilisent .type)
-        self.type = type_objet
-        # Métadonnées par défaut pour la génération de butin
-        # Les sous-classes peuvent les surcharger en tant qu'attributs de classe
-        if not hasattr(self, "is_metallic"):
-            self.is_metallic = False  # Defaults non-metallic unless subclass overrides
-        if not hasattr(self, "base_find_chance"):
-            self.base_find_chance = 0.5  # Default baseline probability for loot generation
-        super().__init__()
+
+    def stack_key(self):
+        """Return the key identifying identical items, or None if the item never stacks."""
+        return self.__class__ if self.stackable else None
+
+    @property
+    def type(self):
+        """Alias de type_ pour compatibilité (certains endroits utilisent .type)."""
+        return self.type_
 
     @abstractmethod
     def pick_up(self, player):
@@ -285,6 +292,9 @@ class ObjetConsommable(Objet):
     Consumables are picked up and used immediately, typically granting
     resources like steps, gold, gems, keys, or dice.
     """
+    __slots__ = ("valeur",)
+    stackable = True
+
     def __init__(self, nom, description, valeur):
         """Initialize consumable with value.
         
@@ -300,6 +310,10 @@ class ObjetConsommable(Objet):
         """Applique l'effet de l'objet sur le joueur"""
         pass
 
+    def stack_key(self):
+        """Consumables only stack with the same class and value (Or(5) != Or(10))."""
+        return (self.__class__, self.valeur)
+
     def should_consume_on_pickup(self):
         """Détermine si l'objet doit être consommé immédiatement après la collecte."""
         return True
@@ -307,6 +321,7 @@ class ObjetConsommable(Objet):
 
 class Pas(ObjetConsommable):
     """Steps resource for player movement."""
+    __slots__ = ()
     def __init__(self, valeur):
         super().__init__("Pas", "Permet de se deplacer", valeur)
 
@@ -321,6 +336,7 @@ class Pas(ObjetConsommable):
 
 class Or(ObjetConsommable):
     """Gold coins used for shop purchases."""
+    __slots__ = ()
     def __init__(self, valeur):
         super().__init__("Or", "Monnaie utilisée pour acheter des objets", valeur)
 
@@ -336,6 +352,7 @@ class Or(ObjetConsommable):
 
 class Gemmes(ObjetConsommable):
     """Gems used to pay for special room drafts."""
+    __slots__ = ()
     def __init__(self, valeur):
         super().__init__("Gemme", "Permet de choisir certaines pieces", valeur)
 
@@ -354,10 +371,12 @@ class Cles(ObjetConsommable):
     
     Has higher base_find_chance (0.75) to ensure availability.
     """
+    __slots__ = ()
+    # Augmenter la chance de base pour apparaître
+    base_find_chance = 0.75  # Boosted availability due to doorway progression reliance
+
     def __init__(self, valeur):
         super().__init__("Cle", "Permet d'ouvrir des portes verrouillées", valeur)
-        # Augmenter la chance de base pour apparaître
-        self.base_find_chance = 0.75  # Boosted availability due to doorway progression reliance
 
     def pick_up(self, player):
         """Add keys to player inventory.
@@ -371,6 +390,7 @@ class Cles(ObjetConsommable):
 
 class Des(ObjetConsommable):
     """Dice for rerolling room draft choices."""
+    __slots__ = ()
     def __init__(self, valeur):
         super().__init__("Dés", "Permet de relancer un tirage de pieces", valeur)
 
@@ -391,6 +411,7 @@ class ObjetPermanent(Objet):
     Permanent items remain in inventory after pickup and provide
     passive bonuses or enable special interactions.
     """
+    __slots__ = ()
     def __init__(self, nom, description):
         super().__init__(nom, description, "permanent")
 
@@ -428,10 +449,12 @@ class ObjetPermanent(Objet):
 
 class Pelle(ObjetPermanent):
     """Permet de creuser certains endroits"""
+    __slots__ = ()
+    is_metallic = True
+    base_find_chance = 0.35
+
     def __init__(self):
         super().__init__("Pelle", "Permet de creuser à certains endroits.")
-        self.is_metallic = True
-        self.base_find_chance = 0.35
 
     def appliquer_effet(self, player):
         player.add_message("Le joueur peut maintenant creuser des trous")
@@ -439,10 +462,12 @@ class Pelle(ObjetPermanent):
 
 class Marteau(ObjetPermanent):
     """Permet d’ouvrir les coffres sans clé"""
+    __slots__ = ()
+    is_metallic = True
+    base_find_chance = 0.6
+
     def __init__(self):
         super().__init__("Marteau", "Permet d’ouvrir des coffres sans clé")
-        self.is_metallic = True
-        self.base_find_chance = 0.6
 
     def appliquer_effet(self, player):
         player.add_message("Le joueur peut ouvrir les coffres sans clé")
@@ -450,10 +475,12 @@ class Marteau(ObjetPermanent):
 
 class KitCrochetage(ObjetPermanent):
     """Permet d’ouvrir les portes de niveau 1 sans clé"""
+    __slots__ = ()
+    is_metallic = True
+    base_find_chance = 0.8
+
     def __init__(self):
         super().__init__("Kit de crochetage", "Permet d’ouvrir les portes de niveau 1 sans clé")
-        self.is_metallic = True
-        self.base_find_chance = 0.8
 
     def appliquer_effet(self, player):
         player.add_message("Le joueur peut crocheter les portes de niveau 1")
@@ -465,11 +492,13 @@ class DetecteurMetaux(ObjetPermanent):
     Increases discovery rate for gold, gems, and keys by 25%.
     Metallic item with base_find_chance 0.35.
     """
+    __slots__ = ()
+    is_metallic = True
+    # Réduction de la probabilité de base pour équilibrer plus large distribution
+    base_find_chance = 0.35  # Lower base to keep detector relatively rare
+
     def __init__(self):
         super().__init__("Détecteur de métaux", "Augmente les chances de trouver des clés et de l'or")
-        self.is_metallic = True
-        # Réduction de la probabilité de base pour équilibrer plus large distribution
-        self.base_find_chance = 0.35  # Lower base to keep detector relatively rare
 
     def appliquer_effet(self, player):
         """Notify player of enhanced item discovery.
@@ -486,10 +515,12 @@ class PatteLapin(ObjetPermanent):
     Provides 15% multiplier to all discovery chances.
     Low base_find_chance (0.25) to maintain rarity.
     """
+    __slots__ = ()
+    # Ajout d'une probabilité explicite plus faible (par défaut c'était ~0.5 implicite)
+    base_find_chance = 0.25  # Intentional low base to balance global luck bonus
+
     def __init__(self):
         super().__init__("Patte de lapin", "Augmente la chance de trouver des objets rares")
-        # Ajout d'une probabilité explicite plus faible (par défaut c'était ~0.5 implicite)
-        self.base_find_chance = 0.25  # Intentional low base to balance global luck bonus
 
     def appliquer_effet(self, player):
         """Notify player of increased luck.
@@ -505,7 +536,11 @@ class AutreObjet(Objet):
     
     Includes food items, chests, digging spots, and lockers.
     These objects typically have custom interaction logic.
+    Food stacks; objects with their own state (chests, lockers, digging
+    spots) do not.
     """
+    __slots__ = ()
+    stackable = True
 
     def __init__(self, nom, description):
         super().__init__(nom, description, "autre")
@@ -522,6 +557,7 @@ class AutreObjet(Objet):
 ##### Autres Objets
 class Pomme(AutreObjet):
     """Apple that restores 2 steps when consumed."""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Pomme", "Redonne 2 pas")
 
@@ -536,6 +572,7 @@ class Pomme(AutreObjet):
 
 class Banane(AutreObjet):
     """Banana that restores 3 steps when consumed."""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Banane", "Redonne 3 pas")
 
@@ -550,6 +587,7 @@ class Banane(AutreObjet):
 
 class Gateau(AutreObjet):
     """Cake that restores 10 steps when consumed."""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Gâteau", "Redonne 10 pas")
 
@@ -564,6 +602,7 @@ class Gateau(AutreObjet):
 
 class Sandwich(AutreObjet):
     """Sandwich that restores 15 steps when consumed."""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Sandwich", "Redonne 15 pas")
 
@@ -578,6 +617,7 @@ class Sandwich(AutreObjet):
 
 class Repas(AutreObjet):
     """Full meal that restores 25 steps when consumed."""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Repas", "Redonne 25 pas")
 
@@ -598,6 +638,8 @@ class Coffre(AutreObjet):
     Contents determined by luck modifiers (metal detector, rabbit's foot).
     Can only be opened once.
     """
+    __slots__ = ("already_opened",)
+    stackable = False  # État propre (ouvert/creusé) : chaque exemplaire reste distinct
     def __init__(self):
         super().__init__( "Coffre", "Peut être ouvert avec une clé ou un marteau")
         self.already_opened = False
@@ -702,6 +744,8 @@ class EndroitCreuser(AutreObjet):
     Requires Pelle in inventory. Contents determined by luck modifiers.
     Can only be dug once.
     """
+    __slots__ = ("already_dug",)
+    stackable = False  # État propre (ouvert/creusé) : chaque exemplaire reste distinct
     def __init__(self):
         super().__init__("Endroit a creuser", "Peut contenir des objets")
         self.already_dug = False
@@ -799,6 +843,8 @@ class Casier(AutreObjet):
     Requires key to open (unless unlocked). 30% chance of being empty.
     Contents determined by luck modifiers.
     """
+    __slots__ = ("locked", "already_opened")
+    stackable = False  # État propre (ouvert/creusé) : chaque exemplaire reste distinct
     def __init__(self, locked = True):
         super().__init__("Casier", "Present dans le vestiaire peut contenir des objets.")
         self.locked = locked
@@ -913,4 +959,161 @@ class Casier(AutreObjet):
     def should_consume_on_pickup(self):
         """Détermine si l'objet doit être consommé immédiatement après la collecte."""
         return self.already_opened
-    
\ No newline at end of file
+    
+
+##### Piles d'objets (contenu des pièces)
+class ObjetStack:
+    """A pile of identical items: one representative Objet and a count.
+
+    Non-stackable items always get a stack of their own with count 1.
+    """
+    __slots__ = ("objet", "count")
+
+    def __init__(self, objet, count=1):
+        self.objet = objet
+        self.count = count
+
+    def __repr__(self):
+        return f"ObjetStack({self.objet.nom!r}, {self.count})"
+
+
+class ObjetStacks:
+    """Ordered collection of ObjetStack used for Room.objets.
+
+    Adding an item merges it into the existing stack of identical items in
+    O(1), so a room receiving dozens of apples keeps a single entry; length,
+    iteration and indexing are over stacks (distinct kinds), not items.
+    """
+    __slots__ = ("stacks", "by_key")
+
+    def __init__(self, objets=None):
+        """Build the collection from an optional iterable of Objet."""
+        self.stacks = []
+        self.by_key = {}  # stack_key -> ObjetStack (objets empilables seulement)
+        if objets:
+            self.extend(objets)
+
+    def append(self, objet, count=1):
+        """Add count copies of objet, merging with identical items.
+
+        Parameters:
+        - objet: Objet instance
+        - count: int, number of items added (default 1)
+
+        Returns:
+        - ObjetStack: the stack holding the item
+        """
+        key = objet.stack_key()
+        stack = self.by_key.get(key) if key is not None else None
+        if stack is not None:
+            stack.count += count
+            return stack
+        stack = ObjetStack(objet, count)
+        self.stacks.append(stack)
+        if key is not None:
+            self.by_key[key] = stack
+        return stack
+
+    def extend(self, objets):
+        """Add every Objet of an iterable."""
+        for objet in objets:
+            self.append(objet)
+
+    def take(self, stack):
+        """Remove one item from stack, dropping the stack when it becomes empty.
+
+        Parameters:
+        - stack: ObjetStack of this collection
+
+        Returns:
+        - bool: True if an item was removed
+        """
+        if stack.count <= 0 or stack not in self.stacks:
+            return False
+        stack.count -= 1
+        if stack.count == 0:
+            self.stacks.remove(stack)
+            key = stack.objet.stack_key()
+            if key is not None and self.by_key.get(key) is stack:
+                del self.by_key[key]
+        return True
+
+    def total(self):
+        """Return the number of items (sum of the stack counts)."""
+        return sum(stack.count for stack in self.stacks)
+
+    def copy(self):
+        """Return an independent collection with the same stacks and counts."""
+        clone = ObjetStacks()
+        for stack in self.stacks:
+            clone.append(stack.objet, stack.count)
+        return clone
+
+    def __iter__(self):
+        return iter(self.stacks)
+
+    def __len__(self):
+        return len(self.stacks)
+
+    def __getitem__(self, index):
+        return self.stacks[index]
+
+    def __repr__(self):
+        return f"ObjetStacks({self.stacks!r})"
+
+
+##### Prototypes d'objets (butin des pièces)
+class ItemPrototype:
+    """Immutable, shared description of an item a room can drop.
+
+    Room item pools hold prototypes instead of live Objet instances: the
+    loot metadata (base_find_chance, is_metallic, permanent or not) is read
+    once from the item class, and a real Objet is only built with
+    instantiate() when a roll succeeds. Use prototype() to get the shared
+    instance for a given class and arguments.
+    """
+    __slots__ = ("cls", "args", "name", "is_permanent", "base_find_chance", "is_metallic")
+
+    def __init__(self, cls, args=()):
+        """Read the loot metadata of an Objet subclass.
+
+        Parameters:
+        - cls: Objet subclass
+        - args: tuple, constructor arguments (e.g. (4,) for Gemmes(4))
+        """
+        object.__setattr__(self, "cls", cls)
+        object.__setattr__(self, "args", tuple(args))
+        object.__setattr__(self, "name", cls.__name__)
+        object.__setattr__(self, "is_permanent", issubclass(cls, ObjetPermanent))
+        object.__setattr__(self, "base_find_chance", cls.base_find_chance)
+        object.__setattr__(self, "is_metallic", cls.is_metallic)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ItemPrototype is immutable")
+
+    def instantiate(self):
+        """Return a new Objet built from this prototype."""
+        return self.cls(*self.args)
+
+    def __repr__(self):
+        return f"prototype({', '.join([self.name] + [repr(a) for a in self.args])})"
+
+
+_prototypes = {}  # (classe, arguments) -> ItemPrototype partagé
+
+
+def prototype(cls, *args):
+    """Return the shared ItemPrototype for cls(*args), creating it on first use.
+
+    Parameters:
+    - cls: Objet subclass
+    - args: constructor arguments
+
+    Returns:
+    - ItemPrototype: same instance for equal (cls, args)
+    """
+    key = (cls, args)
+    proto = _prototypes.get(key)
+    if proto is None:
+        proto = _prototypes[key] = ItemPrototype(cls, args)
+    return proto
@@ -1,26 +1,49 @@
 import pygame
-import random
-from .world import Manor, Antechamber
-from .entities import Player, ObjetConsommable, ObjetPermanent, AutreObjet, KitCrochetage
+from .assets import convert_for_display, font_loader, image_cache, sprite_store
+from .assetpack import load_pack
+from .gcmanager import GCManager
+from .profiling import StartupProfiler
+from .engine import GameEngine
+from .world import get_room_catalog
+from .entities import ObjetConsommable
 
 
 class Game:
+    """Pygame frontend of a GameEngine: window, keyboard and drawing.
+
+    The rules and the state of the run live in self.engine; this class maps
+    keys to engine methods and draws the engine's attributes every frame.
+    """
+
+    ICON_FILES = {
+        "steps": "assets/icons/steps.png",
+        "coin": "assets/icons/coin.png",
+        "gem": "assets/icons/gem.png",
+        "key": "assets/icons/key.png",
+        "dice": "assets/icons/dice.png",
+    }
+    # Salles visibles dès le premier écran (placées par Manor.__init__)
+    STARTUP_ROOM_IMAGES = (
+        "assets/rooms/Blue/Entrance_Hall.png",
+        "assets/rooms/Blue/Antechamber.png",
+    )
+
+    def __init__(self, profiler=None):
+        """Create the window, load startup assets and start a new run.
 
-    opposite_direction = {"up": "down",
-                          "down": "up",
-                          "right": "left",
-                          "left": "right"}
-
-    def __init__(self):
-        pygame.init()
+        Parameters:
+        - profiler: StartupProfiler or None, receives the duration of each
+          startup phase (used by main.py --profile-startup)
+        """
+        prof = profiler or StartupProfiler(enabled=False)
+        with prof.phase("pygame.init"):
+            pygame.init()
 
         # === Dimensions ===
         self.COLS = 5
         self.ROWS = 9
         self.cell_size = 90
         self.margin = 5
-        self.messages = []
-        self.max_messages = 3
 
         self.game_width = self.COLS * self.cell_size
         self.hud_width = int(self.cell_size * 10)
@@ -28,8 +51,14 @@ class Game:
         self.window_height = self.ROWS * self.cell_size
 
         # === Fenêtre ===
-        self.screen = pygame.display.set_mode((self.window_width, self.window_height))
-        pygame.display.set_caption("Blue Prince – Interface avec HUD")
+        with prof.phase("set_mode"):
+            self.screen = pygame.display.set_mode((self.window_width, self.window_height))
+            pygame.display.set_caption("Blue Prince – Interface avec HUD")
+        with prof.phase("asset_pack"):
+            # Toutes les images (déjà chargées ou à venir) au format de l'écran : blits sans conversion
+            convert_for_display()
+            # Pack pré-calculé (src/build_pack.py) s'il existe et n'est pas périmé, sinon PNG
+            sprite_store.attach_pack(load_pack())
 
         # === Couleurs ===
         self.COLOR_BG = (10, 10, 20)
@@ -38,101 +67,104 @@ class Game:
         self.COLOR_TEXT = (10, 10, 10)
         self.COLOR_WHITE = (255, 255, 255)
 
+        # === Sprites pré-redimensionnés (cellules du manoir + cartes de tirage) ===
+        self.sprites = sprite_store
+        self.card_size = 90
+
         # === Police ===
-        self.font_title = pygame.font.SysFont("arial", 28, bold=True)
-        self.font_text = pygame.font.SysFont("arial", 22)
-        self.font_small = pygame.font.SysFont("arial", 20)
-        
-         # === SHOP MENU ===
-        self.shop_menu_active = False
-        self.shop_choices = []
-        self.shop_index = 0
-        self.current_shop_room = None
+        with prof.phase("fonts"):
+            self.font_title = font_loader.get("arial", 28, bold=True)
+            self.font_text = font_loader.get("arial", 22)
+            self.font_small = font_loader.get("arial", 20)
+
+        # === Décodage parallèle des images du premier écran (icônes + salles fixes) ===
+        # Les autres salles sont décodées à leur première apparition (tirage ou grille).
+        with prof.phase("preload"):
+            image_cache.preload(list(self.ICON_FILES.values()) + list(self.STARTUP_ROOM_IMAGES),
+                                progress=self.draw_loading_screen)
 
         # === Chargement des icônes d’inventaire ===
         def load_icon(path):
             try:
-                img = pygame.image.load(path).convert_alpha()
+                img = image_cache.load(path)  # déjà au format de l'écran
                 return pygame.transform.scale(img, (32, 32))
             except:
                 surf = pygame.Surface((32, 32))
                 surf.fill((120, 120, 120))
                 return surf
 
-        
-        self.icons = {
-            "steps": load_icon("assets/icons/steps.png"),
-            "coin": load_icon("assets/icons/coin.png"),
-            "gem": load_icon("assets/icons/gem.png"),
-            "key": load_icon("assets/icons/key.png"),
-            "dice": load_icon("assets/icons/dice.png"),
-        }
+        with prof.phase("icons"):
+            self.icons = {name: load_icon(path) for name, path in self.ICON_FILES.items()}
 
         # === Monde et joueur ===
         self.clock = pygame.time.Clock()
-        self.manor = Manor()
-        self.player = Player("Player", self.manor)
-        self.player.game = self
-        self.player.set_message_callback(self.add_message)
+        self.fps = 30
+        sprite_store.reset_touched()  # Compteur d'images réellement affichées pendant la partie
+        with prof.phase("catalog"):
+            get_room_catalog()
+        # Catalogue, polices, images : tout ce qui vit jusqu'à la fin n'est plus rescanné par le GC
+        self.gc_manager = GCManager()
+        with prof.phase("gc.freeze"):
+            self.gc_manager.freeze()
+        with prof.phase("GameEngine()"):
+            self.engine = GameEngine()  # Toute la logique de la partie, sans pygame
         self.running = True
-        # HUD layout helpers
+        # HUD layout helpers: record the Y after inventory/permanents and room menu
         self.hud_y_after_inventory = 0
         self.hud_y_after_room_menu = 0
-        # HUD layout helper: records the Y after inventory/permanents
-        self.hud_y_after_inventory = 0
-        
-        self.found_permanents = set()
-        self.manor.found_permanents = self.found_permanents
-
-        # === Sélecteur de porte + menu ===
-        self.selected_door = "up"
-        self.menu_active = False
-        self.menu_choices = []
-        self.menu_index = 0
-
-        # === Ramasser des objets ===
-        self.pickup_menu_active = False
-        self.pickup_index = 0
-        self.pickup_choices = []
-        # === Game over state ===
-        self.game_over = False
-        self.game_over_message = ""
-        # === Victory state ===
-        self.victory = False
-        self.victory_message = ""
-        
-        self.confirm_door_active = False  # Nouvel état pour la confirmation
-        self.confirm_door_details = {}    # Pour mémoriser quelle porte on ouvre
-    
-    
-    def is_in_shop_room(self):
-        """Check if the player is currently in a shop room (yellow room).
 
-        Returns:
-        - bool: True if current room color is yellow, False otherwise.
+    def draw_loading_screen(self, done, total):
+        """Render asset loading progress while images decode in the background.
+
+        Parameters:
+        - done: int, number of decoded images
+        - total: int, number of images to decode
+
+        Keeps the window responsive by pumping the event queue.
         """
-        x, y = self.player.position
-        room = self.manor.get_room(x, y)
-        return getattr(room, "color", None) == "yellow"
+        pygame.event.pump()
+        self.screen.fill(self.COLOR_BG)
+
+        title = self.font_title.render("Chargement...", True, self.COLOR_WHITE)
+        self.screen.blit(title, ((self.window_width - title.get_width()) // 2, self.window_height // 2 - 60))
+
+        bar_w, bar_h = 400, 24
+        bar_x = (self.window_width - bar_w) // 2
+        bar_y = self.window_height // 2
+        pygame.draw.rect(self.screen, (60, 60, 80), (bar_x, bar_y, bar_w, bar_h), border_radius=6)
+        fill_w = int(bar_w * done / total) if total else bar_w
+        pygame.draw.rect(self.screen, (0, 80, 200), (bar_x, bar_y, fill_w, bar_h), border_radius=6)
+
+        count = self.font_small.render(f"{done} / {total}", True, self.COLOR_WHITE)
+        self.screen.blit(count, ((self.window_width - count.get_width()) // 2, bar_y + bar_h + 10))
+        pygame.display.flip()
 
     # ====================== BOUCLE PRINCIPALE ======================
     def run(self):
         """Main game loop that handles events, updates game state, and renders.
 
         Runs at 30 FPS and continues until self.running is set to False.
-        Checks end conditions only if game is not over.
+        Checks end conditions only if game is not over. Cyclic garbage
+        collections run in the time left at the end of each frame.
         """
-        while self.running:
-            self.handle_events()
-            if not self.game_over:
-                self.check_end_conditions()
-            self.render()
-            self.clock.tick(30)
+        frame_ms = 1000 / self.fps
+        self.gc_manager.install()
+        try:
+            while self.running:
+                frame_start = pygame.time.get_ticks()
+                self.handle_events()
+                if not self.engine.game_over:
+                    self.engine.check_end_conditions()
+                self.render()
+                self.gc_manager.idle(frame_ms - (pygame.time.get_ticks() - frame_start))
+                self.clock.tick(self.fps)
+        finally:
+            self.gc_manager.uninstall()
         pygame.quit()
 
     # ====================== GESTION DES TOUCHES ======================
     def handle_events(self):
-        """Handle all keyboard and window events based on current game state.
+        """Translate keyboard and window events into engine actions.
 
         Processes different input modes:
         - Game over/victory: R to restart, ESC to quit
@@ -142,6 +174,7 @@ class Game:
         - Room draft menu: LEFT/RIGHT to navigate, SPACE to confirm, R to reroll
         - Normal navigation: Z/Q/S/D or arrows to select door, SPACE to open, M for opening shop, E for opening object pickup
         """
+        engine = self.engine
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -153,465 +186,92 @@ class Game:
                     self.running = False
 
                 # --- Si game over / victoire ---
-                if self.game_over or self.victory:
+                if engine.finished:
                     if event.key == pygame.K_r:
                         self.restart_game()
                     continue
 
                 # --- Confirmation ouverture de porte ---
-                if self.confirm_door_active:  # Confirmation modal overrides all other inputs
+                if engine.confirm_door_active:  # Confirmation modal overrides all other inputs
                     if event.key == pygame.K_o:   # OUI
-                        self._execute_door_opening()
+                        engine._execute_door_opening()
                     elif event.key == pygame.K_a: # NON
-                        self.confirm_door_active = False
-                        self.confirm_door_details = {}
-                        self.add_message("Action annulée.")
+                        engine.cancel_door_opening()
                     continue
                 # ============================================================
                 # MODE SHOP (menu actif)
                 # ============================================================
-                if self.shop_menu_active:  # Shop navigation state
+                if engine.shop_menu_active:  # Shop navigation state
                     if event.key == pygame.K_UP:
-                        self.shop_index = (self.shop_index - 1) % len(self.shop_items)
+                        engine.shop_index = (engine.shop_index - 1) % len(engine.shop_items)
                     elif event.key == pygame.K_DOWN:
-                        self.shop_index = (self.shop_index + 1) % len(self.shop_items)
+                        engine.shop_index = (engine.shop_index + 1) % len(engine.shop_items)
                     elif event.key == pygame.K_SPACE:
-                        self.confirm_shop_choice()
+                        engine.confirm_shop_choice()
                     elif event.key == pygame.K_m:
-                        self.shop_menu_active = False
+                        engine.shop_menu_active = False
                     continue
 
                 # ============================================================
                 # MODE PICKUP (ramasser objets)
                 # ============================================================
-                if self.pickup_menu_active:  # Pickup list navigation state
+                if engine.pickup_menu_active:  # Pickup list navigation state
                     if event.key == pygame.K_UP:
-                        self.pickup_index = (self.pickup_index - 1) % len(self.pickup_choices)
+                        engine.pickup_index = (engine.pickup_index - 1) % len(engine.pickup_choices)
                     elif event.key == pygame.K_DOWN:
-                        self.pickup_index = (self.pickup_index + 1) % len(self.pickup_choices)
+                        engine.pickup_index = (engine.pickup_index + 1) % len(engine.pickup_choices)
                     elif event.key == pygame.K_SPACE:
-                        self.confirm_pickup_choice()
+                        engine.confirm_pickup_choice()
                     elif event.key == pygame.K_e:
-                        self.pickup_menu_active = False
+                        engine.pickup_menu_active = False
                     continue
 
                 # ============================================================
                 # MENU DE TIRAGE (3 pièces)
                 # ============================================================
-                if self.menu_active:  # Draft menu navigation state
+                if engine.menu_active:  # Draft menu navigation state
                     if event.key == pygame.K_LEFT:
-                        self.menu_index = (self.menu_index - 1) % len(self.menu_choices)
+                        engine.menu_index = (engine.menu_index - 1) % len(engine.menu_choices)
                     elif event.key == pygame.K_RIGHT:
-                        self.menu_index = (self.menu_index + 1) % len(self.menu_choices)
+                        engine.menu_index = (engine.menu_index + 1) % len(engine.menu_choices)
                     elif event.key == pygame.K_SPACE:
-                        self.confirm_room_choice()
+                        engine.confirm_room_choice()
                     elif event.key == pygame.K_r:
-                        self.reroll_room_choices()
+                        engine.reroll_room_choices()
                     continue
 
-                # ============================================================
-                # NAVIGATION NORMALE
-                # ============================================================
                 # ============================================================
                 # NAVIGATION / SELECTION & MENUS (PAS DE MOUVEMENT DIRECT)
                 # ============================================================
-                if not self.menu_active and not self.pickup_menu_active and not self.confirm_door_active:  # Free navigation / selection state
-                    if event.key == pygame.K_z or event.key == pygame.K_UP:
-                        self.selected_door = "up"
-                    elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                        self.selected_door = "down"
-                    elif event.key == pygame.K_q or event.key == pygame.K_LEFT:
-                        self.selected_door = "left"
-                    elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-                        self.selected_door = "right"
-                    elif event.key == pygame.K_SPACE:
-                        self.open_door_menu()
-                    elif event.key == pygame.K_m:
-                        if self.is_in_shop_room():
-                            if self.shop_menu_active:
-                                self.shop_menu_active = False
-                            else:
-                                self.open_shop_menu()
-                                self.shop_menu_active = True
-                        return
-                    elif event.key == pygame.K_e:
-                        if not self.is_in_shop_room():
-                            self.open_object_pickup_menu()
-                        return
-
-
-
-
-    def open_door_menu(self):
-        """Handle door opening logic with lock levels and key requirements.
-
-        Lock levels depend on Y position:
-        - Y 8-6: Level 0 (free)
-        - Y 5-4: Level 0 or 1 (random)
-        - Y 3-2: Level 1 or 2 (random)
-        - Y 1-0: Level 2
-
-        If player has KitCrochetage, level 1 locks can be picked for free.
-        Shows confirmation dialog if keys are required, otherwise opens directly.
-        """
-        
-        if not self.player.can_move(self.selected_door, self.manor):
-            self.add_message("Cette direction n'est pas accessible.")
-            return
-
-        x, y = self.player.position
-        dx, dy = self.manor.get_direction_offset(self.selected_door)
-        nx, ny = x + dx, y + dy
-
-        # 1. Si la pièce existe déjà, on bouge
-        if self.manor.get_room(nx, ny):  # Already placed -> attempt movement instead of drafting
-            self.player.move(self.selected_door, self.manor)
-            return
-        
-        # 2. Calculer le coût de la porte
-        lock_level = 0  # Difficulty escalates as player moves upward (towards y=0)
-        if ny in [8, 7, 6]:
-            lock_level = 0
-        elif ny in [5, 4]:
-            lock_level = random.choice([0, 1])
-        elif ny in [3, 2]:
-            lock_level = random.choice([1, 2])
-        elif ny in [1, 0]:
-            lock_level = 2
-
-        # 3. Vérifier les outils (Kit de crochetage)
-        has_lockpick = any(isinstance(obj, KitCrochetage) for obj in self.player.inventory.permanents)  # Enables bypass of level 1 cost
-
-        required_keys = 0 if lock_level == 0 else 1
-        pickaxe_msg = None
-
-        if lock_level == 1 and has_lockpick:  # Lockpick only waives level 1, not level 2
-            required_keys = 0
-            pickaxe_msg = "Vous crochetez la serrure (Niv 1)."
-        
-        # 4. Vérifier si le joueur peut payer
-        if self.player.cles < required_keys:
-            self.add_message(f"Porte verrouillée ! (Niv {lock_level})")
-            if required_keys > 0:
-                self.add_message(f"Il vous faut {required_keys} clé(s).")
-            return
-        
-        # 5. Stocker les détails pour la confirmation
-        self.confirm_door_details = {
-            'direction': self.selected_door,
-            'keys': required_keys,
-            'lock_level': lock_level,
-            'pickaxe_msg': pickaxe_msg
-        }
-
-        # 6. Demander confirmation OU ouvrir directement si gratuit
-        if required_keys > 0:  # Non-free door requires explicit confirmation
-            # Demander confirmation
-            self.confirm_door_active = True
-            self.add_message(f"Porte Niv {lock_level} ({required_keys} clé). [O]=Ouvrir / [A]=Annuler")
-        else:
-            # C'est gratuit (porte Niv 0 ou crochetage)
-            self._execute_door_opening()
-
-    
-    #
-    def _execute_door_opening(self):
-        """Execute the door opening after confirmation.
-
-        Uses stored details from confirm_door_details to:
-        - Deduct required keys from player inventory
-        - Display lockpicking message if applicable
-        - Draw 3 room choices and activate room draft menu
-        - Refund keys if no rooms are available (error case)
-        """
-        # 1. Récupérer les détails stockés
-        details = self.confirm_door_details
-        required_keys = details['keys']
-        direction = details['direction']
-        pickaxe_msg = details['pickaxe_msg']
-
-        # 2. Payer le coût et afficher le message
-        if required_keys > 0:  # Deduct committed cost
-            self.player.cles -= required_keys
-            self.add_message(f"Vous utilisez {required_keys} clé(s).")
-        elif pickaxe_msg:
-            # Afficher le message de crochetage (si_execute_door_opening)
-            self.add_message(pickaxe_msg)
-
-        # 3. Ouvrir le menu de tirage des 3 pièces
-        self.menu_choices = self.manor.draw_three_rooms(
-            self.player.position, 
-            direction, 
-            self.manor.pioche
-        )
-        
-        if not self.menu_choices:  # Draft failed (no compatible rooms) -> rollback cost and abort
-             self.add_message("Erreur : Aucune pièce compatible trouvée !")
-             # (On redonne les clés si elles ont été dépensées pour rien)
-             if required_keys > 0:
-                 self.player.cles += required_keys  # Refund since no draft options
-             self.confirm_door_active = False
-             self.confirm_door_details = {}
-             return
-
-        self.menu_index = 0
-        self.menu_active = True # Activer le menu des pièces
-
-        # 4. Réinitialiser l'état de confirmation
-        self.confirm_door_active = False
-        self.confirm_door_details = {}
-    
-    def reroll_room_choices(self):
-        """Use a die to reroll the 3 current room options. Requires player to have at least 1 die
-
-        Effects:
-        - Consumes 1 die from player inventory
-        - Generates new room choices for current door direction
-        - Resets menu_index to 0
-        """
-        if self.player.des <= 0:
-            self.add_message("Vous n'avez pas de dés pour relancer!")
-            return
-
-        self.player.des -= 1
-        self.add_message(f"Vous utilisez un dé pour relancer. Dés restants: {self.player.des}")
-
-        self.menu_choices = self.manor.draw_three_rooms(
-            self.player.position, 
-            self.selected_door, 
-            self.manor.pioche
-        )
-        # Reroll keeps door direction & deck; only the room selection changes
-        
-        if not self.menu_choices:
-            self.add_message("Erreur: Aucune pièce compatible trouvée après relance!")
-            self.menu_active = False
-            return
-
-        self.menu_index = 0
-
-    def confirm_room_choice(self):
-        """Validate room choice and place it in the manor. Uses self.menu_index to identify chosen room from menu_choices
-
-        Effects:
-        - Deducts gem cost from player if room has gem_cost > 0
-        - Places chosen room in manor at calculated position
-        - Applies Nursery bonus if active and room is a bedroom type
-        - Closes room draft menu
-        """
-        chosen = self.menu_choices[self.menu_index]  # Selected room object (may have gem cost)
-        cost = getattr(chosen, 'gem_cost', 0)
-        if cost > 0:
-            if self.player.gemmes < cost:
-                self.add_message(f"Pas assez de gemmes (coût: {cost}).")
-                return
-            self.player.gemmes -= cost
-            self.add_message(f"- {cost} gemme(s)")
-        
-        x, y = self.player.position
-        dx, dy = self.manor.get_direction_offset(self.selected_door)
-
-        nx, ny = x + dx, y + dy
-
-        self.manor.place_room(nx, ny, chosen)  # Commit placement & remove from catalog
-        self.menu_active = False
-        self.add_message(f"Pièce ajoutée: {chosen.name}")
-
-
-        # LE BONUS de la piece NURSERY
-        if getattr(self.manor, "bonus_on_draft_bedroom", False):  # Nursery flag: extra steps on drafting bedroom types
-            if chosen.name in ("Bedroom", "BunkRoom", "GuestBedroom"):
-                self.player.gagner_pas(5)
-
-
-    # choix de objet a echanger contre de l'or dans les pieces jaunes
-    ####################################################################
-    def open_shop_menu(self):
-        """Initialize shop menu with available items.
-
-        Effects:
-        - Sets up shop_items list with name, cost, and effect lambda
-        - Resets shop_index to 0
-        - Does not activate menu automatically
-        """
-    # empêcher ouverture si un autre menu est actif
-        if self.menu_active or self.pickup_menu_active or self.confirm_door_active:
-            return
-
-        # items du shop
-        self.shop_items = [
-            ("Pomme", 2, lambda player: player.gagner_pas(2)),
-            ("Banane", 3, lambda player: player.gagner_pas(3)),
-            ("Gâteau", 8, lambda player: player.gagner_pas(10)),
-            ("Clé", 10, lambda player: setattr(player, "cles", player.cles + 1)),
-            ("Gemme", 3, lambda player: setattr(player, "gemmes", player.gemmes + 1)),
-        ]
-
-        self.shop_index = 0
-
-
-    def confirm_shop_choice(self):
-            """Process shop purchase for currently selected item. Uses self.shop_index to identify selected item
-
-            Effects:
-            - Deducts gold from player if purchase successful
-            - Applies item effect (adds steps, keys, gems, or permanent item)
-            - Shows message about purchase or insufficient gold
-            """
-            name, cost, effect = self.shop_items[self.shop_index]
-
-            if self.player.or_ < cost:
-                self.add_message(f"Pas assez d'or pour acheter {name}.")
-                return
-
-            self.player.or_ -= cost
-            effect(self.player)
-            self.add_message(f"Achat : {name} pour {cost} or.")
-
-    def open_object_pickup_menu(self):
-        """Open pickup menu for objects in current room.
-
-        Effects:
-        - Sets pickup_choices to current room's objects list
-        - Activates pickup menu if objects are available
-        - Shows message if no objects present
-        """
-        x, y = self.player.position
-        room = self.manor.get_room(x, y)
-        if not room or not room.objets:
-            self.add_message("Il n'y a pas d'objets à ramasser ici.")
-            return
-
-        self.pickup_choices = room.objets
-        self.pickup_index = 0
-        self.pickup_menu_active = True
-
-    def confirm_pickup_choice(self):
-        """Validate and process object pickup from current room.
-
-        Side effects:
-        - Calls object's pick_up method to add to player inventory
-        - Removes object from room (unless should_consume_on_pickup returns False)
-        - Tracks permanent objects globally to prevent respawning
-        - Updates pickup menu choices and index after removal
-        - Closes menu if no objects remain
-        """
-        # Bounds check to prevent IndexError
-        if not self.pickup_choices or self.pickup_index >= len(self.pickup_choices):
-            self.pickup_menu_active = False
-            return
-        
-        chosen = self.pickup_choices[self.pickup_index]
-        x, y = self.player.position
-        room = self.manor.get_room(x, y)
-        if not room:
-            return
-        
-        if chosen.type == "permanent":
-            self.found_permanents.add(chosen.__class__.__name__)
-        
-        chosen.pick_up(self.player)
-        # Ne retirer l'objet que s'il doit réellement être consommé.
-        remove_after = True  # Decide if object should be consumed/removed after pickup
-        if hasattr(chosen, 'should_consume_on_pickup'):
-            try:
-                remove_after = chosen.should_consume_on_pickup()
-            except Exception:
-                remove_after = True
-        if remove_after and chosen in room.objets:
-            room.objets.remove(chosen)
-        
-        # Update pickup_choices to reflect current room state and reset index
-        self.pickup_choices = room.objets
-        if not self.pickup_choices:
-            self.pickup_menu_active = False
-            self.pickup_index = 0
-        else:
-            # Keep index valid after removal
-            self.pickup_index = min(self.pickup_index, len(self.pickup_choices) - 1)
-
-    def check_end_conditions(self):
-        """Check and trigger game over or victory conditions.
-
-        Loss conditions:
-        - Player runs out of steps (not is_alive)
-        - No more rooms can be placed (manor.can_advance returns False)
-
-        Victory condition:
-        - Player reaches the Antechamber room
-        """
-        # 1) Lose: plus de pas
-        if not self.player.is_alive:
-            self.end_game("Vous n'avez plus de pas...\nGame Over.")
-        if not self.manor.can_advance():
-            self.end_game("Il n'y a plus de pièces disponibles pour avancer.\nGame Over.")
-            return
-
-        # 2) Win: joueur dans l'Antechamber
-        x, y = self.player.position
-        current_room = self.manor.get_room(x, y)
-        if isinstance(current_room, Antechamber):
-            self.set_victory("Bravo ! Vous avez atteint l'Antechamber. Vous gagnez !")
-
-    def end_game(self, message: str):
-        """Trigger game over state.
-
-        Parameters:
-        - message: str, text to display on game over screen
-
-        Side effects:
-        - Sets game_over flag to True
-        - Stores message for overlay display
-        - Adds "GAME OVER" to message log
-        """
-        self.game_over = True
-        self.game_over_message = message
-        # Also push a concise last message into log
-        self.add_message("GAME OVER")
-
-    def set_victory(self, message: str):
-        """Trigger victory state.
-
-        Parameters:
-        - message: str, text to display on victory screen
-
-        Side effects:
-        - Sets victory flag to True
-        - Stores message for overlay display
-        - Adds "VICTOIRE !" to message log
-        """
-        self.victory = True
-        self.victory_message = message
-        self.add_message("VICTOIRE !")
+                if event.key == pygame.K_z or event.key == pygame.K_UP:
+                    engine.selected_door = "up"
+                elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
+                    engine.selected_door = "down"
+                elif event.key == pygame.K_q or event.key == pygame.K_LEFT:
+                    engine.selected_door = "left"
+                elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
+                    engine.selected_door = "right"
+                elif event.key == pygame.K_SPACE:
+                    engine.open_door_menu()
+                elif event.key == pygame.K_m:
+                    engine.toggle_shop_menu()
+                    return
+                elif event.key == pygame.K_e:
+                    if not engine.is_in_shop_room():
+                        engine.open_object_pickup_menu()
+                    return
 
     def restart_game(self):
-        """Reinitialize game state for a new run.
+        """Start a new run in the same window (R key after game over/victory).
 
         Side effects:
-        - Creates new Manor and Player instances
-        - Resets all menu states and flags
-        - Clears message log and found permanents tracking
+        - Replaces the engine state with a fresh run (GameEngine.restart)
+        - Starts a new count of displayed room images
         - Keeps window and pygame initialized
         """
-        # Reinitialize dynamic game state (keep window & pygame)
-        self.manor = Manor()
-        self.player = Player("Player", self.manor)
-        self.player.set_message_callback(self.add_message)
-        self.found_permanents = set()
-        self.manor.found_permanents = self.found_permanents
-        self.selected_door = "up"
-        self.menu_active = False
-        self.menu_choices = []
-        self.menu_index = 0
-        self.pickup_menu_active = False
-        self.pickup_index = 0
-        self.pickup_choices = []
-        self.messages.clear()
-        self.game_over = False
-        self.game_over_message = ""
-        self.victory = False
-        self.victory_message = ""
-        self.add_message("Nouvelle partie")
+        sprite_store.reset_touched()
+        self.engine.restart()
+        self.engine.add_message("Nouvelle partie")
 
     # ====================== AFFICHAGE ======================
     def render(self):
@@ -643,7 +303,7 @@ class Game:
         pygame.draw.rect(self.screen, self.COLOR_HUD, hud_rect)
 
         # --- 3. Cadre blanc autour de la pièce actuelle (sans cacher les portes) ---
-        px, py = self.player.position
+        px, py = self.engine.player.position
         outer_margin = 2  # cadre plus fin et plus éloigné des bords
         room_rect = pygame.Rect(
         px * self.cell_size + self.margin - outer_margin,
@@ -658,22 +318,22 @@ class Game:
         self.draw_door_selector(px, py)
 
         # --- 5. Inventaire ---
-        self.draw_inventory(self.player, hud_rect)
+        self.draw_inventory(self.engine.player, hud_rect)
 
         # --- 6. Menu de choix de pièces ---
-        if self.menu_active:
+        if self.engine.menu_active:
             self.draw_room_choice_menu(hud_rect)
 
         # --- 7. Messages ---
         self.draw_messages(hud_rect)
 
         # --- 8. Objets dans la pièce actuelle (toujours si pas menu de tirage et pas salle shop) ---
-        if not self.menu_active and not self.is_in_shop_room():
+        if not self.engine.menu_active and not self.engine.is_in_shop_room():
             self.draw_room_objects(hud_rect)
 
-        if self.victory:
+        if self.engine.victory:
             self.draw_victory_overlay()
-        elif self.game_over:
+        elif self.engine.game_over:
             self.draw_game_over_overlay()
         # dessine toujours le shop (affichage passif possible)
         self.draw_shop_menu(hud_rect)
@@ -694,7 +354,7 @@ class Game:
         # --- 1. Dessiner le manoir ---
         for y in range(self.ROWS):
             for x in range(self.COLS):
-                room = self.manor.get_room(x, y)
+                room = self.engine.manor.get_room(x, y)
                 if room:
                     rect = pygame.Rect(
                         x * self.cell_size + self.margin,
@@ -702,9 +362,9 @@ class Game:
                         self.cell_size - 2 * self.margin,
                         self.cell_size - 2 * self.margin
                     )
-                    if room.image:
-                        scaled = pygame.transform.scale(room.image, (rect.width, rect.height))
-                        self.screen.blit(scaled, rect)
+                    sprite = self.sprites.room_region(room, rect.size)  # Scaled once, blitted from the atlas
+                    if sprite:
+                        self.screen.blit(sprite[0], rect, sprite[1])
                     else:
                         pygame.draw.rect(self.screen, (100, 100, 100), rect)
 
@@ -725,13 +385,13 @@ class Game:
         h = self.cell_size
         t = 8
 
-        if self.selected_door == "up":
+        if self.engine.selected_door == "up":
             rect = pygame.Rect(x + 10, y, w - 20, t)
-        elif self.selected_door == "down":
+        elif self.engine.selected_door == "down":
             rect = pygame.Rect(x + 10, y + h - t, w - 20, t)
-        elif self.selected_door == "left":
+        elif self.engine.selected_door == "left":
             rect = pygame.Rect(x, y + 10, t, h - 20)
-        elif self.selected_door == "right":
+        elif self.engine.selected_door == "right":
             rect = pygame.Rect(x + w - t, y + 10, t, h - 20)
         else:
             return
@@ -783,8 +443,8 @@ class Game:
         perm_title = self.font_title.render("Objets permanents:", True, color)
         self.screen.blit(perm_title, (margin_x, y))
         y += 40
-        if self.player.inventory.permanents:
-            for obj in self.player.inventory.permanents:
+        if player.inventory.permanents:
+            for obj in player.inventory.permanents:
                 line = self.font_text.render(f"- {obj.nom}", True, color)
                 self.screen.blit(line, (margin_x + 8, y))
                 y += 26
@@ -823,16 +483,17 @@ class Game:
         title = self.font_text.render("Choose a room to draft", True, color)
         self.screen.blit(title, (base_x, base_y))
 
-        card_size = 90
+        card_size = self.card_size
         spacing = 140
         y_img = base_y + 40
 
-        for i, room in enumerate(self.menu_choices):
+        for i, room in enumerate(self.engine.menu_choices):
             x = base_x + i * spacing
             rect = pygame.Rect(x, y_img, card_size, card_size)
-            img = pygame.transform.scale(room.image, (card_size, card_size))
-            self.screen.blit(img, rect)
-            if i == self.menu_index:
+            sprite = self.sprites.room_region(room, rect.size)
+            if sprite:
+                self.screen.blit(sprite[0], rect, sprite[1])
+            if i == self.engine.menu_index:
                 color_frame = (0, 80, 200)  # bleu cyan lumineux
                 pygame.draw.rect(self.screen, color_frame, rect, 4)
 
@@ -843,14 +504,14 @@ class Game:
             # Afficher le coût en gemmes
             cost = getattr(room, 'gem_cost', 0)
             cost_text = "Gratuit" if cost == 0 else f"Coût: {cost} gemme(s)"
-            affordable = self.player.gemmes >= cost
+            affordable = self.engine.player.gemmes >= cost
             cost_color = (120, 180, 120) if cost == 0 else ((180, 60, 60) if not affordable else color)
             cost_surf = self.font_small.render(cost_text, True, cost_color)
             self.screen.blit(cost_surf, (x + 10, y_img + card_size + 28))
 
         reroll_y = y_img + card_size + 50
-        if self.player.des > 0:
-            reroll_text = f"[R] Relancer ({self.player.des} dés disponibles)"
+        if self.engine.player.des > 0:
+            reroll_text = f"[R] Relancer ({self.engine.player.des} dés disponibles)"
             reroll_color = (0, 150, 0)
         else:
             reroll_text = "[R] Relancer (pas de dés)"
@@ -863,20 +524,6 @@ class Game:
         if bottom > getattr(self, 'hud_y_after_room_menu', 0):
             self.hud_y_after_room_menu = bottom
 
-    def add_message(self, text: str):
-        """Add a message to the log, maintaining max_messages limit.
-
-        Parameters:
-        - text: str, message text to append
-
-        Effects:
-        - Appends to self.messages list
-        - Removes oldest message if list exceeds max_messages (10)
-        """
-        self.messages.append(text)
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
-
     def draw_messages(self, hud_rect):
         """Render message log in HUD.
 
@@ -902,7 +549,7 @@ class Game:
         self.screen.blit(title, (x, y))
         y += 30
 
-        for msg in self.messages:
+        for msg in self.engine.messages:
             surf = self.font_small.render(msg, True, self.COLOR_TEXT)
             self.screen.blit(surf, (x, y))
             y += 22
@@ -925,7 +572,7 @@ class Game:
         - Only renders when is_in_shop_room() returns True
         """
         # afficher seulement dans une pièce jaune
-        if not self.is_in_shop_room():
+        if not self.engine.is_in_shop_room():
             return
         x = hud_rect.left + 500
         y = hud_rect.top + 40
@@ -935,18 +582,18 @@ class Game:
         y += 50
 
         # initialiser items si nécessaire (sans activation)
-        if not hasattr(self, 'shop_items') or not self.shop_items:
-            self.open_shop_menu()
+        if not self.engine.shop_items:
+            self.engine.open_shop_menu()
 
-        for i, (name, cost, _) in enumerate(self.shop_items):
-            color = (255, 215, 0) if (self.shop_menu_active and i == self.shop_index) else self.COLOR_TEXT
+        for i, (name, cost, _) in enumerate(self.engine.shop_items):
+            color = (255, 215, 0) if (self.engine.shop_menu_active and i == self.engine.shop_index) else self.COLOR_TEXT
             text = f"{i+1}. {name} - {cost} or"
             line = self.font_small.render(text, True, color)
             self.screen.blit(line, (x, y))
             y += 22
 
         y += 5
-        if self.shop_menu_active:
+        if self.engine.shop_menu_active:
             hint1 = self.font_small.render("M: fermer le menu", True, self.COLOR_TEXT)
             hint2 = self.font_small.render("UP/DOWN + SPACE : acheter", True, self.COLOR_TEXT)
             self.screen.blit(hint1, (x, y))
@@ -971,14 +618,15 @@ class Game:
           - Casier shows "[Clé requise]"
           - Coffre shows "[Marteau ou Clé requis]"
           - EndroitCreuser shows "[Pelle requise]"
+          - Stacks of identical items show their count, e.g. "(12)"
         - Highlights selected object (yellow) when pickup_menu_active
         - Controls hint (E to open/close, UP/DOWN + SPACE to interact)
         """
         x = hud_rect.left + 500
         y = hud_rect.top + 40
 
-        px, py = self.player.position
-        room = self.manor.get_room(px, py)
+        px, py = self.engine.player.position
+        room = self.engine.manor.get_room(px, py)
 
         if not room or not room.objets:
             return
@@ -986,23 +634,26 @@ class Game:
         self.screen.blit(title, (x, y))
         y += 50
 
-        if not self.pickup_menu_active:
-            for i, obj in enumerate(room.objets, start=1):
+        if not self.engine.pickup_menu_active:
+            for i, stack in enumerate(room.objets, start=1):  # Une ligne par pile, pas par objet
+                obj = stack.objet
                 if isinstance(obj, ObjetConsommable):
-                    line = self.font_small.render(f"{i}. {obj.nom} x {obj.valeur}", True, self.COLOR_TEXT)
-                    self.screen.blit(line, (x, y))
-                    y += 22
+                    text = f"{i}. {obj.nom} x {obj.valeur}"
                 else:
-                    line = self.font_small.render(f"{i}. {obj.nom}", True, self.COLOR_TEXT)
-                    self.screen.blit(line, (x, y))
-                    y += 22
+                    text = f"{i}. {obj.nom}"
+                if stack.count > 1:
+                    text += f" ({stack.count})"
+                line = self.font_small.render(text, True, self.COLOR_TEXT)
+                self.screen.blit(line, (x, y))
+                y += 22
             hint = self.font_small.render("E: ouvrir le menu", True, self.COLOR_TEXT)
             self.screen.blit(hint, (x, y + 5))
 
         else:
 
-            for i, obj in enumerate(room.objets, start=1):
-                text_color = (255, 215, 0) if i - 1 == self.pickup_index else self.COLOR_TEXT
+            for i, stack in enumerate(room.objets, start=1):
+                obj = stack.objet
+                text_color = (255, 215, 0) if i - 1 == self.engine.pickup_index else self.COLOR_TEXT
 
                 # Construction du texte avec détails
                 display_text = f"{i}. {obj.nom}"
@@ -1019,6 +670,8 @@ class Game:
                 # Ajoute l'état pour EndroitCreuser
                 elif obj.__class__.__name__ == "EndroitCreuser":
                     display_text += "[Pelle requise]"
+                if stack.count > 1:
+                    display_text += f" ({stack.count})"
                 line = self.font_small.render(display_text, True, text_color)
                 self.screen.blit(line, (x, y))
                 y += 22
@@ -1051,14 +704,15 @@ class Game:
         self.screen.blit(title, (panel_x + (panel_w - title.get_width()) // 2, panel_y + 18))
 
         # Wrap message lines
-        lines = [l for l in self.game_over_message.split('\n') if l.strip()] or ["Fin de la partie."]
+        lines = [l for l in self.engine.game_over_message.split('\n') if l.strip()] or ["Fin de la partie."]
         y = panel_y + 80
         for line in lines:
             surf = self.font_text.render(line, True, self.COLOR_TEXT)
             self.screen.blit(surf, (panel_x + 30, y))
             y += 32
 
-        stats = f"Pas: {self.player.pas}  Or: {self.player.or_}  Gemmes: {self.player.gemmes}  Clés: {self.player.cles}"
+        player = self.engine.player
+        stats = f"Pas: {player.pas}  Or: {player.or_}  Gemmes: {player.gemmes}  Clés: {player.cles}"
         stats_surf = self.font_small.render(stats, True, (70, 70, 80))
         self.screen.blit(stats_surf, (panel_x + 30, panel_y + panel_h - 100))
 
@@ -1088,14 +742,15 @@ class Game:
         self.screen.blit(title, (panel_x + (panel_w - title.get_width()) // 2, panel_y + 18))
 
         # Wrap message lines
-        lines = [l for l in self.victory_message.split('\n') if l.strip()] or ["Partie gagnée !"]
+        lines = [l for l in self.engine.victory_message.split('\n') if l.strip()] or ["Partie gagnée !"]
         y = panel_y + 80
         for line in lines:
             surf = self.font_text.render(line, True, self.COLOR_TEXT)
             self.screen.blit(surf, (panel_x + 30, y))
             y += 32
 
-        stats = f"Pas: {self.player.pas}  Or: {self.player.or_}  Gemmes: {self.player.gemmes}  Clés: {self.player.cles}"
+        player = self.engine.player
+        stats = f"Pas: {player.pas}  Or: {player.or_}  Gemmes: {player.gemmes}  Clés: {player.cles}"
         stats_surf = self.font_small.render(stats, True, (60, 90, 60))
         self.screen.blit(stats_surf, (panel_x + 30, panel_y + panel_h - 110))
 
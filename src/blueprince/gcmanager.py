@@ -0,0 +1,149 @@
+# cyclic garbage collector policy for the frame loop (no pygame import here)
+import gc
+import time
+
+
+class GCManager:
+    """Moves cyclic garbage collection out of the frames and measures its pauses.
+
+    - freeze(): after the long-lived data (room catalog, shop items...) is
+      built, moves every tracked object to the permanent generation so later
+      collections no longer rescan it.
+    - install(): disables automatic collections; idle() then runs the
+      generation the collector would have run, but only between frames when
+      the frame left enough slack. Past force_factor times a threshold the
+      collection runs anyway, so garbage can never pile up indefinitely.
+    - observe(): only records pauses, automatic collections stay on (to
+      measure the interpreter's own scheduling); install() implies it.
+    - stats(): number, total and worst duration of the pauses per generation,
+      split between idle-time collections and the others (automatic or forced).
+    """
+
+    def __init__(self, min_slack_ms=4.0, force_factor=10):
+        self.min_slack_ms = min_slack_ms
+        self.force_factor = force_factor
+        self.installed = False
+        self.observing = False
+        self.was_enabled = gc.isenabled()
+        self.frozen = 0
+        self._in_idle = False
+        self._start = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Forget every recorded pause."""
+        self.pauses = {}  # (génération, "idle" ou "other") -> [nombre, total_ms, max_ms]
+        self.forced = 0
+
+    def _on_gc(self, phase, info):
+        # Appelé par le collecteur avant ("start") et après ("stop") chaque collecte
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        if self._start is None:
+            return
+        ms = (time.perf_counter() - self._start) * 1000
+        self._start = None
+        entry = self.pauses.setdefault((info["generation"], "idle" if self._in_idle else "other"), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += ms
+        entry[2] = max(entry[2], ms)
+
+    def observe(self):
+        """Start recording pauses without changing how collections are scheduled."""
+        if self.observing:
+            return
+        gc.callbacks.append(self._on_gc)
+        self.observing = True
+
+    def stop_observing(self):
+        """Stop recording pauses (scheduling left as it is)."""
+        if not self.observing:
+            return
+        gc.callbacks.remove(self._on_gc)
+        self.observing = False
+
+    def install(self):
+        """Start recording pauses and take over the scheduling of collections."""
+        if self.installed:
+            return
+        self.was_enabled = gc.isenabled()
+        self.observe()
+        gc.disable()
+        self.installed = True
+
+    def uninstall(self):
+        """Give collections back to the interpreter and stop recording pauses."""
+        if not self.installed:
+            return
+        self.stop_observing()
+        if self.was_enabled:
+            gc.enable()
+        self.installed = False
+
+    def freeze(self):
+        """Collect once, then move every surviving object to the permanent generation.
+
+        Call it once, after startup: objects frozen later (e.g. a run's Manor)
+        would never be reclaimed if they end up in a reference cycle.
+
+        Returns:
+        - int: number of frozen objects
+        """
+        gc.collect()
+        gc.freeze()
+        self.frozen = gc.get_freeze_count()
+        return self.frozen
+
+    def due_generation(self, factor=1):
+        """Return the oldest generation whose counter exceeds factor x its threshold, or None."""
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        due = None
+        for generation in range(3):
+            if thresholds[generation] and counts[generation] > thresholds[generation] * factor:
+                due = generation
+        return due
+
+    def idle(self, slack_ms):
+        """Run the pending collection if the current frame left enough time.
+
+        Parameters:
+        - slack_ms: float, time left before the next frame is due
+
+        Returns:
+        - int or None: collected generation, None if nothing ran
+        """
+        if not self.installed:
+            return None
+        generation = self.due_generation()
+        if generation is None:
+            return None
+        if slack_ms < self.min_slack_ms:
+            # Pas le temps : on attend une frame plus calme, sauf si les déchets s'accumulent
+            generation = self.due_generation(self.force_factor)
+            if generation is None:
+                return None
+            self.forced += 1
+            gc.collect(generation)
+            return generation
+        self._in_idle = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._in_idle = False
+        return generation
+
+    def stats(self):
+        """Return GC pause statistics.
+
+        Returns:
+        - dict: {"frozen", "forced", "pauses"}; pauses maps "gen<N>/<idle|other>"
+          to {"count", "total_ms", "max_ms"}
+        """
+        return {
+            "frozen": self.frozen,
+            "forced": self.forced,
+            "pauses": {f"gen{generation}/{kind}": {"count": c, "total_ms": total, "max_ms": worst}
+                       for (generation, kind), (c, total, worst) in sorted(self.pauses.items())},
+        }
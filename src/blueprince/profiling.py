@@ -0,0 +1,121 @@
+# startup profiling helpers (no pygame import here: used before the game modules load)
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+
+# Modules du jeu dans l'ordre de dépendance : chaque import ne compte que son propre coût
+BLUEPRINCE_MODULES = (
+    "blueprince.doors",
+    "blueprince.entities",
+    "blueprince.assets",
+    "blueprince.assetpack",
+    "blueprince.gcmanager",
+    "blueprince.room_specs",
+    "blueprince.sampler",
+    "blueprince.world",
+    "blueprince.engine",
+    "blueprince.simulate",
+    "blueprince.game",
+)
+
+
+class StartupProfiler:
+    """Collects wall-clock durations of named startup phases, in milliseconds.
+
+    A disabled profiler keeps the same interface but records nothing, so
+    Game.__init__ can always wrap its phases with it.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block and store it under name (summed if repeated)."""
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - t0) * 1000
+
+
+def profile_imports(modules=BLUEPRINCE_MODULES):
+    """Import pygame then each game module, timing every import separately.
+
+    Parameters:
+    - modules: iterable of str, module names in dependency order
+
+    Returns:
+    - dict: module name -> milliseconds (0.0 if it was already imported)
+    """
+    timings = {}
+    for name in ("pygame",) + tuple(modules):
+        already_loaded = name in sys.modules
+        t0 = time.perf_counter()
+        importlib.import_module(name)
+        timings[name] = 0.0 if already_loaded else (time.perf_counter() - t0) * 1000
+    return timings
+
+
+def profile_room_kinds(table):
+    """Time construction and image decoding for each room kind.
+
+    Parameters:
+    - table: room_specs.RoomTable, e.g. room_specs.get_room_table()
+
+    Returns:
+    - dict: kind -> {"construct_ms", "decode_ms"}; decode_ms is the cost
+      of decoding the kind's image from disk (what its first display costs
+      without the asset pack)
+    """
+    import pygame
+    from blueprince.world import build_room
+
+    kinds = {}
+    for spec in table:
+        t0 = time.perf_counter()
+        build_room(spec)
+        t1 = time.perf_counter()
+        if spec.image_path:
+            pygame.image.load(spec.image_path)
+        t2 = time.perf_counter()
+        kinds[spec.kind] = {"construct_ms": (t1 - t0) * 1000, "decode_ms": (t2 - t1) * 1000}
+    return kinds
+
+
+def profile_startup():
+    """Profile a full game startup and return a JSON-serializable report.
+
+    Returns:
+    - dict: {"report_version", "python", "pygame", "imports_ms", "phases_ms",
+      "room_kinds_ms", "total_ms"}; the game window is created then closed,
+      the loop never runs
+    """
+    t0 = time.perf_counter()
+    imports = profile_imports()
+
+    import pygame
+    from blueprince.game import Game
+    from blueprince.room_specs import get_room_table
+
+    profiler = StartupProfiler()
+    with profiler.phase("Game.__init__"):
+        Game(profiler=profiler)
+    total = (time.perf_counter() - t0) * 1000
+
+    report = {
+        "report_version": 2,  # À incrémenter si la structure du rapport change
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "imports_ms": imports,
+        "phases_ms": profiler.phases,
+        "room_kinds_ms": profile_room_kinds(get_room_table()),
+        "total_ms": total,
+    }
+    pygame.quit()
+    return report
@@ -0,0 +1,228 @@
+# declarative room table (no pygame import): one entry per room kind, compiled once into columns
+from collections import namedtuple
+
+from .entities import (
+    Banane, Casier, Cles, Coffre, Des, DetecteurMetaux, EndroitCreuser, Gateau, Gemmes,
+    KitCrochetage, Marteau, Or, PatteLapin, Pelle, Pomme, Repas, Sandwich, prototype
+)
+
+# kind: identifiant du type de pièce ; name: nom affiché/utilisé en jeu (Room.name)
+# doors: directions des portes sans rotation, converties en masque (doors.py) par build_room
+# copies: exemplaires dans le catalogue (plus d'exemplaires = plus de chances d'être tiré)
+# hook: classe Room de world.py portant du code propre (effets), None = pièce sans effet
+RoomSpec = namedtuple(
+    "RoomSpec",
+    "kind name image_path doors gem_cost rarity placement_condition color base_weight item_pool copies hook",
+    defaults=(0, 0, "any", "blue", 1.0, (), 1, None),
+)
+
+ROOM_SPECS = (
+    # ---- Pièces fixes : début / fin (jamais tirées) ----
+    RoomSpec("EntranceHall", "EntranceHall", "assets/rooms/Blue/Entrance_Hall.png", ("up", "left", "right"),
+             placement_condition="bottom"),
+    RoomSpec("Antechamber", "Antechamber", "assets/rooms/Blue/Antechamber.png", ("down", "left", "right"),
+             placement_condition="top"),
+
+    # ---- GREEN ROOMS (pièces vertes) ----
+    RoomSpec("Greenhouse", "Greenhouse", "assets/rooms/Green/Greenhouse.png", ("down",),
+             rarity=1, placement_condition="edge", color="green", copies=2, hook="Greenhouse",
+             item_pool=(prototype(Gemmes, 4), prototype(PatteLapin), prototype(EndroitCreuser), prototype(EndroitCreuser), prototype(Pomme), prototype(Pomme), prototype(Banane), prototype(Banane))),
+    RoomSpec("MorningRoom", "Morning Room", "assets/rooms/Green/Morning_Room.png", ("down", "left"),
+             rarity=1, placement_condition="edge", color="green", copies=2, hook="MorningRoom",
+             item_pool=(prototype(Gemmes, 2), prototype(EndroitCreuser), prototype(Pelle), prototype(Coffre))),
+    RoomSpec("SecretGarden", "SecretGarden", "assets/rooms/Green/Secret_Garden.png", ("left", "right", "down"),
+             rarity=2, placement_condition="edge", color="green", copies=2, hook="SecretGarden",
+             item_pool=(prototype(Gemmes, 1), prototype(Pomme), prototype(Pomme), prototype(Pomme), prototype(Banane), prototype(Banane), prototype(Banane), prototype(EndroitCreuser), prototype(EndroitCreuser))),
+    RoomSpec("Veranda", "Veranda", "assets/rooms/Green/Veranda.png", ("up", "down"),
+             gem_cost=2, rarity=1, placement_condition="edge", color="green", copies=2, hook="Veranda",
+             item_pool=(prototype(Gemmes, 1), prototype(EndroitCreuser))),
+    RoomSpec("Cloister", "Cloister", "assets/rooms/Green/Cloister.png", ("left", "right", "up", "down"),
+             gem_cost=3, rarity=1, placement_condition="center", color="green", copies=2,
+             item_pool=(prototype(Gemmes, 2), prototype(EndroitCreuser), prototype(EndroitCreuser), prototype(Cles, 1), prototype(Pelle))),
+    RoomSpec("Courtyard", "Courtyard", "assets/rooms/Green/Courtyard.png", ("left", "right", "down"),
+             rarity=1, placement_condition="center", color="green", copies=2,
+             item_pool=(prototype(Or, 3), prototype(EndroitCreuser), prototype(EndroitCreuser), prototype(Pomme), prototype(Pomme), prototype(Banane), prototype(Banane), prototype(Pelle))),
+    RoomSpec("Patio", "Patio", "assets/rooms/Green/Patio.png", ("left", "down"),
+             rarity=2, placement_condition="edge", color="green", copies=2, hook="Patio",
+             item_pool=(prototype(Gemmes, 1), prototype(EndroitCreuser), prototype(EndroitCreuser))),
+    RoomSpec("Terrace", "Terrace", "assets/rooms/Green/Terrace.png", ("down",),
+             rarity=1, placement_condition="edge", color="green", copies=2, hook="Terrace",
+             item_pool=(prototype(Or, 2), prototype(EndroitCreuser))),
+
+    # ---- PURPLE ROOMS (chambres) ----
+    RoomSpec("HerLadyshipsChamber", "HerLadyshipsChamber", "assets/rooms/Purple/Her_Ladyships_Chamber.png", ("down",),
+             rarity=2, color="purple", copies=2, hook="HerLadyshipsChamber",
+             item_pool=(prototype(Gemmes, 2), prototype(Cles, 1), prototype(Des, 1), prototype(Coffre))),
+    RoomSpec("MasterBedroom", "MasterBedroom", "assets/rooms/Purple/Master_Bedroom.png", ("down",),
+             gem_cost=2, rarity=2, color="purple", copies=2, hook="MasterBedroom",
+             item_pool=(prototype(Gemmes, 1), prototype(Cles, 1), prototype(Coffre))),
+    RoomSpec("Nursery", "Nursery", "assets/rooms/Purple/Nursery.png", ("down",),
+             rarity=1, color="purple", copies=2, hook="Nursery",
+             item_pool=(prototype(Pomme), prototype(Des, 1))),
+    RoomSpec("ServantsQuarters", "ServantsQuarters", "assets/rooms/Purple/Servants_Quarters.png", ("down",),
+             rarity=1, color="purple", copies=2, hook="ServantsQuarters",
+             item_pool=(prototype(Cles, 2),)),
+    RoomSpec("Bedroom", "Bedroom", "assets/rooms/Purple/Bedroom.png", ("left", "down"),
+             color="purple", copies=2, hook="Bedroom",
+             item_pool=(prototype(Gemmes, 1), prototype(Des, 1))),
+    RoomSpec("Boudoir", "Boudoir", "assets/rooms/Purple/Boudoir.png", ("down", "left"),
+             rarity=1, color="purple", copies=2, hook="Boudoir"),
+    RoomSpec("BunkRoom", "BunkRoom", "assets/rooms/Purple/Bunk_Room.png", ("down",),
+             rarity=2, color="purple", copies=2,
+             item_pool=(prototype(Or, 2), prototype(Des, 1))),
+    RoomSpec("GuestBedroom", "GuestBedroom", "assets/rooms/Purple/GuestBedroom.png", ("down",),
+             rarity=1, color="purple", copies=2, hook="GuestBedroom",
+             item_pool=(prototype(Gemmes, 1), prototype(Or, 4))),
+
+    # ---- ORANGE ROOMS (couloirs) ----
+    RoomSpec("Corridor", "Corridor", "assets/rooms/Orange/Corridor.png", ("up", "down"),
+             color="orange", copies=2,
+             item_pool=(prototype(Or, 3), prototype(Cles, 1), prototype(DetecteurMetaux), prototype(Pelle), prototype(Coffre))),
+    RoomSpec("EastWingHall", "EastWingHall", "assets/rooms/Orange/East_Wing_Hall.png", ("left", "right", "down"),
+             rarity=1, color="orange", copies=2,
+             item_pool=(prototype(Or, 3), prototype(Cles, 1), prototype(EndroitCreuser), prototype(Pelle), prototype(Coffre), prototype(Gateau))),
+    RoomSpec("WestWingHall", "WestWingHall", "assets/rooms/Orange/West_Wing_Hall.png", ("left", "right", "down"),
+             rarity=1, color="orange", copies=2,
+             item_pool=(prototype(Or, 4), prototype(Cles, 2), prototype(EndroitCreuser), prototype(EndroitCreuser), prototype(Pelle), prototype(Coffre), prototype(Repas))),
+    RoomSpec("Hallway", "Hallway", "assets/rooms/Orange/Hallway.png", ("left", "right", "down"),
+             color="orange", copies=2,
+             item_pool=(prototype(Or, 2), prototype(Cles, 2), prototype(Des, 1), prototype(Coffre), prototype(Sandwich))),
+    RoomSpec("Passageway", "Passageway", "assets/rooms/Orange/Passageway.png", ("left", "right", "up", "down"),
+             color="orange", copies=2,
+             item_pool=(prototype(Or, 2), prototype(Cles, 1), prototype(Coffre), prototype(KitCrochetage))),
+    RoomSpec("GreatHall", "GreatHall", "assets/rooms/Orange/Great_Hall.png", ("left", "right", "up", "down"),
+             rarity=2, color="orange", copies=2,
+             item_pool=(prototype(Or, 5), prototype(Gemmes, 2), prototype(Cles, 2), prototype(Repas))),
+    RoomSpec("Foyer", "Foyer", "assets/rooms/Orange/Foyer.png", ("up", "down"),
+             gem_cost=2, rarity=2, color="orange", copies=2, hook="Foyer",
+             item_pool=(prototype(Or, 3), prototype(Cles, 1), prototype(Casier))),
+    RoomSpec("SecretPassage", "SecretPassage", "assets/rooms/Orange/Secret_Passage.png", ("down",),
+             rarity=3, color="orange", copies=2, hook="SecretPassage",
+             item_pool=(prototype(Gemmes, 1), prototype(Des, 1), prototype(Casier))),
+
+    # ---- BLUE ROOMS ----
+    RoomSpec("LockerRoom", "LockerRoom", "assets/rooms/Blue/Locker_Room.png", ("up", "down"),
+             rarity=1, copies=2, hook="LockerRoom",
+             item_pool=(prototype(Or, 3), prototype(Gemmes, 2), prototype(Cles, 4), prototype(Casier), prototype(KitCrochetage))),
+    RoomSpec("Vault", "Vault", "assets/rooms/Blue/Vault.png", ("down",),
+             gem_cost=3, rarity=3, placement_condition="edge", copies=2, hook="Vault",
+             item_pool=(prototype(Or, 40), prototype(Gemmes, 3), prototype(Cles, 1), prototype(Coffre))),
+    RoomSpec("Workshop", "Workshop", "assets/rooms/Blue/Workshop.png", ("up", "down"),
+             rarity=2, placement_condition="center", copies=2, hook="Workshop",
+             item_pool=(prototype(Pelle), prototype(Marteau), prototype(DetecteurMetaux), prototype(PatteLapin), prototype(KitCrochetage), prototype(Casier))),
+    RoomSpec("BoilerRoom", "BoilerRoom", "assets/rooms/Blue/Boiler_Room.png", ("left", "down", "right"),
+             rarity=2, placement_condition="center", copies=2, hook="BoilerRoom",
+             item_pool=(prototype(EndroitCreuser), prototype(DetecteurMetaux), prototype(Or, 3), prototype(Pelle), prototype(KitCrochetage))),
+    RoomSpec("ConferenceRoom", "ConferenceRoom", "assets/rooms/Blue/Conference_Room.png", ("down", "left", "right"),
+             rarity=2, placement_condition="center", copies=2, hook="ConferenceRoom",
+             item_pool=(prototype(Or, 4), prototype(Gemmes, 1), prototype(Cles, 1), prototype(DetecteurMetaux), prototype(Pelle), prototype(KitCrochetage))),
+    RoomSpec("Gallery", "Gallery", "assets/rooms/Blue/Gallery.png", ("up", "down"),
+             rarity=1, placement_condition="center", copies=2, hook="Gallery",
+             item_pool=(prototype(Gemmes, 1), prototype(Or, 2))),
+    RoomSpec("Garage", "Garage", "assets/rooms/Blue/Garage.png", ("down",),
+             rarity=1, copies=2, hook="Garage",
+             item_pool=(prototype(Or, 2), prototype(KitCrochetage))),
+    RoomSpec("Library", "Library", "assets/rooms/Blue/Library.png", ("left", "down"),
+             rarity=1, copies=2, hook="Library",
+             item_pool=(prototype(Gemmes, 1), prototype(Des, 1), prototype(PatteLapin))),
+    RoomSpec("RumpusRoom", "RumpusRoom", "assets/rooms/Blue/Rumpus_Room.png", ("up", "down"),
+             rarity=1, copies=2, hook="RumpusRoom",
+             item_pool=(prototype(Or, 8), prototype(Banane), prototype(Des, 2), prototype(Cles, 2), prototype(Gemmes, 1), prototype(Sandwich))),
+    RoomSpec("Pantry", "Pantry", "assets/rooms/Blue/Pantry.png", ("left", "down"),
+             copies=2, hook="Pantry",
+             item_pool=(prototype(Or, 4), prototype(Pomme), prototype(Banane), prototype(Gateau), prototype(Sandwich))),
+    RoomSpec("Room8", "Room8", "assets/rooms/Blue/Room_8.png", ("left", "down"),
+             rarity=1, copies=2, hook="Room8",
+             item_pool=(prototype(Or, 5), prototype(Gemmes, 2), prototype(Banane), prototype(Cles, 1))),
+    RoomSpec("Rotunda", "Rotunda", "assets/rooms/Blue/Rotunda.png", ("down", "left"),
+             gem_cost=3, rarity=2, placement_condition="center", copies=2, hook="Rotunda",
+             item_pool=(prototype(Or, 4), prototype(Gemmes, 1))),
+
+    # ---- YELLOW ROOMS (magasins, effet commun ShopRoom) ----
+    RoomSpec("Bookshop", "Bookshop", "assets/rooms/Yellow/Bookshop.png", ("left", "down"),
+             rarity=1, color="yellow", hook="ShopRoom"),
+    RoomSpec("Commissary", "Commissary", "assets/rooms/Yellow/Commissary.png", ("left", "down"),
+             rarity=1, color="yellow", hook="ShopRoom"),
+    RoomSpec("Kitchen", "Kitchen", "assets/rooms/Yellow/Kitchen.png", ("down", "left"),
+             color="yellow", hook="ShopRoom"),
+    RoomSpec("LaundryRoom", "LaundryRoom", "assets/rooms/Yellow/Laundry_Room.png", ("down",),
+             rarity=1, color="yellow", hook="ShopRoom"),
+    RoomSpec("Locksmith", "Locksmith", "assets/rooms/Yellow/Locksmith.png", ("down",),
+             rarity=2, color="yellow", hook="ShopRoom"),
+    RoomSpec("GiftShop", "GiftShop", "assets/rooms/Yellow/Mount_Holly_Gift_Shop.png", ("left", "down", "right"),
+             rarity=1, color="yellow", hook="ShopRoom"),
+    RoomSpec("Showroom", "Showroom", "assets/rooms/Yellow/Showroom.png", ("up", "down"),
+             rarity=2, color="yellow", hook="ShopRoom"),
+    RoomSpec("Armory", "Armory", "assets/rooms/Yellow/The_Armory.png", ("down", "left"),
+             rarity=2, color="yellow", hook="ShopRoom"),
+)
+
+
+class RoomTable:
+    """Column-oriented form of a room spec table.
+
+    Each RoomSpec field becomes one tuple holding that field for every kind,
+    in table order, so tools can scan or aggregate the catalog (filters on
+    color or rarity, sums of copies...) without building any Room.
+    """
+
+    def __init__(self, specs=ROOM_SPECS):
+        """Compile specs into columns.
+
+        Parameters:
+        - specs: iterable of RoomSpec
+
+        Raises:
+        - ValueError: if two specs share the same kind
+        """
+        self.specs = tuple(specs)  # Lignes d'origine, rendues telles quelles par spec() et l'itération
+        specs = self.specs
+        self.columns = {field: tuple(getattr(spec, field) for spec in specs) for field in RoomSpec._fields}
+        self.rows = {}  # kind -> index de ligne
+        for index, kind in enumerate(self.columns["kind"]):
+            if kind in self.rows:
+                raise ValueError(f"duplicate room kind: {kind}")
+            self.rows[kind] = index
+
+    def column(self, field):
+        """Return the tuple of values of a RoomSpec field, one per kind."""
+        return self.columns[field]
+
+    def where(self, **conditions):
+        """Return the row indices whose fields equal every given value.
+
+        Parameters:
+        - conditions: field=value pairs, e.g. color="green", rarity=2
+
+        Returns:
+        - list[int]: matching row indices, in table order
+        """
+        rows = range(len(self))
+        for field, value in conditions.items():
+            values = self.columns[field]
+            rows = [i for i in rows if values[i] == value]
+        return list(rows)
+
+    def spec(self, kind):
+        """Return the RoomSpec of a kind."""
+        return self[self.rows[kind]]
+
+    def __getitem__(self, index):
+        return self.specs[index]
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self):
+        return len(self.rows)
+
+
+_room_table = None
+
+
+def get_room_table():
+    """Return the RoomTable compiled from ROOM_SPECS, compiling it on first use."""
+    global _room_table
+    if _room_table is None:
+        _room_table = RoomTable(ROOM_SPECS)
+    return _room_table
@@ -0,0 +1,137 @@
+# dynamic weighted sampling over a fixed set of slots (no pygame import here)
+import random
+
+
+class WeightedSampler:
+    """Fenwick tree (binary indexed tree) of non-negative weights.
+
+    Slots are numbered 0..n-1 and keep their position for the sampler's
+    whole life: a removed item is a slot of weight 0. Changing a weight,
+    prefix sums and drawing a slot are O(log n), so a draw costs the same
+    whatever the number of slots.
+
+    A draw picks slot i with probability weight(i) / total(): the slot
+    whose interval [prefix(i), prefix(i) + weight(i)) contains
+    random() * total(), like random.choices with the same weights.
+    """
+
+    def __init__(self, weights=()):
+        """Build the tree in O(n).
+
+        Parameters:
+        - weights: iterable of float, initial weight of each slot
+        """
+        self.weights = [float(w) for w in weights]
+        n = len(self.weights)
+        self.tree = [0.0] * (n + 1)  # tree[i] = somme des poids des cases ]i - lowbit(i), i]
+        for i, w in enumerate(self.weights, 1):
+            self.tree[i] += w
+            parent = i + (i & -i)
+            if parent <= n:
+                self.tree[parent] += self.tree[i]
+        self.top = 1 << (n.bit_length() - 1) if n else 0  # Plus grande puissance de 2 <= n
+
+    def copy(self):
+        """Return an independent sampler with the same weights, in O(n) without rebuilding."""
+        sampler = WeightedSampler()
+        sampler.weights = list(self.weights)
+        sampler.tree = list(self.tree)
+        sampler.top = self.top
+        return sampler
+
+    def __len__(self):
+        return len(self.weights)
+
+    def weight(self, slot):
+        """Return the weight of a slot."""
+        return self.weights[slot]
+
+    def set(self, slot, weight):
+        """Change the weight of a slot (0 removes it from the draws) in O(log n)."""
+        delta = weight - self.weights[slot]
+        if not delta:
+            return
+        self.weights[slot] = weight
+        i = slot + 1
+        n = len(self.weights)
+        while i <= n:
+            node = self.tree[i] + delta
+            if abs(node) <= abs(delta) * 1e-9:
+                # Reste d'arrondi d'une soustraction : on recalcule le noeud à partir des poids
+                node = sum(self.weights[i - (i & -i):i])
+            self.tree[i] = node
+            i += i & -i
+
+    def prefix(self, slot):
+        """Return the sum of the weights of the slots before slot, in O(log n)."""
+        total = 0.0
+        i = slot
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        """Return the sum of all weights."""
+        return self.prefix(len(self.weights))
+
+    def find(self, value):
+        """Return the slot whose interval contains value (0 <= value < total()).
+
+        Slots of weight 0 have an empty interval and are never returned;
+        rounding errors fall back on the nearest positive slot (the previous
+        one, else the next one).
+
+        Raises:
+        - ValueError: if every weight is 0
+        """
+        pos = 0
+        step = self.top
+        n = len(self.weights)
+        while step:
+            nxt = pos + step
+            if nxt <= n and self.tree[nxt] <= value:
+                pos = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        slot = self._nearest(min(pos, n - 1), ())
+        if slot is None:
+            raise ValueError("no slot with a positive weight")
+        return slot
+
+    def _nearest(self, pos, excluded):
+        # Arrondis flottants : la descente peut s'arrêter sur une case vide ou exclue ;
+        # on prend la case valide précédente, à défaut la suivante (None s'il n'y en a aucune)
+        for candidate in range(pos, -1, -1):
+            if self.weights[candidate] > 0 and candidate not in excluded:
+                return candidate
+        for candidate in range(pos + 1, len(self.weights)):
+            if self.weights[candidate] > 0 and candidate not in excluded:
+                return candidate
+        return None
+
+    def sample(self, rng=random, exclude=()):
+        """Draw one slot, never one of the excluded slots (drawing without replacement).
+
+        Excluded slots are skipped by shifting the drawn value past their
+        intervals instead of changing their weights, so the tree is left
+        untouched.
+
+        Parameters:
+        - rng: object with a random() method (module random by default)
+        - exclude: iterable of slots already drawn
+
+        Returns:
+        - int or None: drawn slot, None if every remaining weight is 0
+        """
+        excluded = sorted(set(exclude))
+        total = self.total() - sum(self.weights[slot] for slot in excluded)
+        if total <= 0:
+            return None
+        value = rng.random() * total
+        for slot in excluded:
+            if value < self.prefix(slot):
+                break
+            value += self.weights[slot]  # Sauter l'intervalle de la case exclue
+        # total peut rester > 0 par arrondi alors que toutes les cases valides sont exclues : None
+        return self._nearest(self.find(value), excluded)
@@ -0,0 +1,118 @@
+# batch runs of the headless GameEngine (no pygame import here)
+import random
+import time
+
+from .engine import GameEngine
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def play_random_run(engine, rng, max_actions=400):
+    """Play the engine's current run with random choices until it ends.
+
+    Each action picks a random door; a draft takes a random affordable room
+    (rerolling with a die when none is affordable), every object of the room
+    is picked up and a random item is bought in shops when there is enough
+    gold.
+
+    Parameters:
+    - engine: GameEngine, run to play (not restarted here)
+    - rng: random.Random, source of the player's choices
+    - max_actions: int, safety cap on the number of actions
+
+    Returns:
+    - tuple[str, int]: outcome ("victory", "game_over", "stuck" when a draft
+      offers nothing affordable and no die is left, "limit") and the number
+      of actions played
+    """
+    actions = 0
+    while not engine.finished:
+        if actions >= max_actions:
+            return "limit", actions
+        actions += 1
+
+        engine.selected_door = rng.choice(DIRECTIONS)
+        engine.open_door_menu()
+        if engine.confirm_door_active:
+            engine._execute_door_opening()
+        while engine.menu_active:
+            affordable = [i for i, room in enumerate(engine.menu_choices)
+                          if room.gem_cost <= engine.player.gemmes]
+            if affordable:
+                engine.menu_index = rng.choice(affordable)
+                engine.confirm_room_choice()
+            elif engine.player.des > 0:
+                engine.reroll_room_choices()
+            else:
+                return "stuck", actions  # Même impasse au clavier : aucun choix possible
+
+        if not engine.is_in_shop_room():
+            engine.open_object_pickup_menu()
+            while engine.pickup_menu_active:
+                count = engine.pickup_choices.total()
+                engine.confirm_pickup_choice()
+                if engine.pickup_menu_active and engine.pickup_choices.total() == count:
+                    # Objet resté en place (coffre fermé, pas de pelle...) : on passe au suivant
+                    if engine.pickup_index + 1 >= len(engine.pickup_choices):
+                        engine.pickup_menu_active = False
+                    else:
+                        engine.pickup_index += 1
+        else:
+            engine.open_shop_menu()  # Comme la touche M : prépare les articles du magasin
+            if engine.shop_items:
+                engine.shop_index = rng.randrange(len(engine.shop_items))
+                if engine.player.or_ >= engine.shop_items[engine.shop_index][1]:
+                    engine.confirm_shop_choice()
+
+        engine.check_end_conditions()
+    return ("victory" if engine.victory else "game_over"), actions
+
+
+def simulate(runs, seed=None, max_actions=400):
+    """Play many random runs back to back on one engine.
+
+    Parameters:
+    - runs: int, number of runs
+    - seed: int or None, seeds both the game's random draws and the
+      player's choices so that a batch can be replayed
+    - max_actions: int, per-run cap (see play_random_run)
+
+    Returns:
+    - dict: {"runs", "outcomes", "actions", "rooms_placed", "seconds",
+      "runs_per_s", "weight_cache"}; outcomes counts runs per outcome,
+      actions and rooms_placed are means per run, weight_cache counts the
+      room weight lookups of the batch ({"hits", "misses", "hit_rate"})
+    """
+    random.seed(seed)  # Tirages de pièces, serrures et butin (module random partagé)
+    rng = random.Random(seed)
+    outcomes = {"victory": 0, "game_over": 0, "stuck": 0, "limit": 0}
+    actions = 0
+    placed = 0
+
+    t0 = time.perf_counter()
+    engine = GameEngine()
+    weights = engine.manor.room_weights  # Partagé par toutes les parties (catalogue de départ)
+    hits0, misses0 = weights.hits, weights.misses
+    for run in range(runs):
+        if run:
+            engine.restart()
+        outcome, played = play_random_run(engine, rng, max_actions)
+        outcomes[outcome] += 1
+        actions += played
+        placed += sum(1 for row in engine.manor.grid for room in row if room)
+    seconds = time.perf_counter() - t0
+    weight_hits, weight_misses = weights.hits - hits0, weights.misses - misses0
+
+    return {
+        "runs": runs,
+        "outcomes": outcomes,
+        "actions": actions / runs if runs else 0.0,
+        "rooms_placed": placed / runs if runs else 0.0,
+        "seconds": seconds,
+        "runs_per_s": runs / seconds if seconds else 0.0,
+        "weight_cache": {
+            "hits": weight_hits,
+            "misses": weight_misses,
+            "hit_rate": weight_hits / (weight_hits + weight_misses) if weight_hits + weight_misses else 0.0,
+        },
+    }
@@ -1,10 +1,12 @@
-import pygame
+# game world logic: rooms, manor grid and draws (no pygame import here, see engine.py)
+import os
 import random
-from abc import ABC, abstractmethod
 
+from .doors import DOOR_BITS, DOOR_OFFSETS, OPPOSITE_BITS, OPPOSITE_DOOR, door_mask, rotate_doors
+from .room_specs import get_room_table
+from .sampler import WeightedSampler
 from .entities import (
-    Pomme, Banane, Or, Gemmes, Cles, Des, Pelle, Marteau, EndroitCreuser,
-    DetecteurMetaux, PatteLapin, Coffre, Casier, KitCrochetage, Gateau, Sandwich, Repas
+    Pomme, Banane, Gemmes, Cles, Pelle, Marteau, DetecteurMetaux, PatteLapin, ObjetStacks
 )
 
 
@@ -12,16 +14,17 @@ from .entities import (
 # Helper function for random loot
 # ==============================
 def generate_random_loot(player, item_pool, found_permanents=None):
-    """Generates a random subset of pre-instantiated items.
+    """Generates a random subset of the items described by a pool of prototypes.
 
     Parameters:
     - player: Player instance or None. If None, luck modifiers are ignored.
-    - item_pool: list[Objet] of candidate instances (duplicates model max quantity).
+    - item_pool: list[ItemPrototype] of candidates (duplicates model max quantity).
     - dig_spots_range: optional (min,max) tuple to append that many EndroitCreuser instances.
     - found_permanents: optional set of permanent class names already found.
 
     Returns:
-    - list[Objet]: randomly selected instances (subset of item_pool plus dig spots).
+    - list[Objet]: new instances for the items that dropped only; the
+      prototypes themselves are shared and never handed out.
     """
     result = []
     if found_permanents is None:
@@ -40,26 +43,20 @@ def generate_random_loot(player, item_pool, found_permanents=None):
     luck_multiplier = 1.15 if has_rabbits_foot else 1.0
 
     for item in item_pool:
-        # Each item instance = one independent roll; duplicates model higher availability.
+        # Each pool entry = one independent roll; duplicates model higher availability.
         # Skip permanents already found globally so they never respawn.
-        if getattr(item, 'type', None) == 'permanent' and item.__class__.__name__ in found_permanents:
+        if item.is_permanent and item.name in found_permanents:
             continue
-        
-        base_chance = getattr(item, 'base_find_chance', 0.5)
-        is_metallic = getattr(item, 'is_metallic', False)
-        chance = base_chance * luck_multiplier  # Rabbit's foot boosts all base chances uniformly
-        if is_metallic and has_metal_detector:
+
+        chance = item.base_find_chance * luck_multiplier  # Rabbit's foot boosts all base chances uniformly
+        if item.is_metallic and has_metal_detector:
             chance *= 1.25  # Metal detector only amplifies metallic items
         if random.random() < chance:
-            result.append(item)
+            result.append(item.instantiate())  # Objet réel créé seulement quand il tombe
 
     return result
 
 
-# ==============================
-# Classe abstraite Room
-# ==============================
-
 # ==============================
 # SHOP EFFECT (effet commun à toutes les pièces jaunes)
 # ==============================
@@ -70,6 +67,7 @@ class ShopEffect:
     Yellow rooms allow players to purchase items with gold.
     Shop menu is opened via M key when in yellow room.
     """
+    __slots__ = ()  # Mixin sans état : ne pas rendre un __dict__ aux pièces jaunes
 
     SHOP_ITEMS = [
         ("Pomme", 2, lambda player: player.gagner_pas(2)),
@@ -94,46 +92,73 @@ class ShopEffect:
         - Shows message prompting player to press M
         """
         # Ne plus ouvrir automatiquement le menu du shop; uniquement préparer via appel existant.
-        if hasattr(player, "game"):
-            try:
-                player.game.open_shop_menu(self)  # prépare les items sans activation
-                player.add_message("Magasin disponible: appuyez sur M pour ouvrir.")
-            except Exception:
-                pass
+        if getattr(player, "game", None) is not None:
+            player.game.open_shop_menu()  # prépare les items sans activation
+            player.add_message("Magasin disponible: appuyez sur M pour ouvrir.")
+
 
 
+ROOM_HOOKS = {}  # nom de classe -> sous-classe de Room (référencée par RoomSpec.hook)
 
-class Room(ABC):
-    """Abstract base class for all manor rooms.
+
+# ==============================
+# Classe de base Room (instanciée telle quelle pour les pièces sans effet)
+# ==============================
+
+class Room:
+    """Base class for all manor rooms.
     
     Handles room properties, door connections, item generation,
     rotation mechanics, and room-specific effects.
+
+    Room kinds are declared in room_specs.ROOM_SPECS and built by
+    build_room(); rooms without effect code are plain Room instances, the
+    others are instances of the subclass named by their spec's hook
+    (subclasses register themselves in ROOM_HOOKS).
+
+    Instances have no __dict__: every attribute lives in the slots below and
+    subclasses (and the ShopEffect mixin) declare empty __slots__.
     """
+    __slots__ = ("base_weight", "name", "image_path", "image", "doors", "original_doors",
+                 "gem_cost", "item_pool", "objets", "loot_generated", "rarity",
+                 "placement_condition", "color", "rotation", "effect_triggered")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        ROOM_HOOKS[cls.__name__] = cls
+
     def __init__(self, name, image=None, doors=None, gem_cost=0, item_pool=None,
                  objets=None, rarity=0, placement_condition="any",
-                 color="blue", base_weight=1.0):
+                 color="blue", base_weight=1.0, image_path=None):
         """Initialize room with properties and configuration.
         
         Parameters:
         - name: str, internal room identifier
-        - image: pygame.Surface, room background sprite
-        - doors: list[str], available directions ["up", "down", "left", "right"]
+        - image: optional sprite object for rooms without image file (unused
+          by the logic; only the display frontend reads it)
+        - doors: door mask (doors.DOOR_BITS) or iterable of directions
+          ["up", "down", "left", "right"]; stored as a mask
         - gem_cost: int, gems required to draft this room (default 0)
-        - item_pool: list[Objet], candidate items for loot generation
-        - objets: list[Objet], items currently in room
+        - item_pool: list or tuple of ItemPrototype, candidate items for loot generation
+          (shared prototypes from entities.prototype())
+        - objets: list[Objet], items initially in room (stored as ObjetStacks,
+          identical items merged into counted stacks)
         - rarity: int, 0=common, 1-3=increasingly rare
         - placement_condition: str, "any"/"edge"/"center"/"top"/"bottom"
         - color: str, room type: "blue"/"green"/"purple"/"yellow"/"orange"/"red"
         - base_weight: float, base probability multiplier for room draws
+        - image_path: str, sprite file; never loaded here, the display
+          frontend decodes it (assets.room_image) when the room is drawn
         """
         self.base_weight = base_weight
         self.name = name
-        self.image = image
-        self.doors = doors if doors else []
-        self.original_doors = self.doors.copy()  # Store original door configuration
+        self.image_path = image_path
+        self.image = image  # En général None : l'affichage passe par image_path + rotation
+        self.doors = door_mask(doors)  # Masque 4 bits (UP | RIGHT | DOWN | LEFT)
+        self.original_doors = self.doors  # Store original door configuration
         self.gem_cost = gem_cost
         self.item_pool = item_pool if item_pool else []
-        self.objets = objets if objets else []
+        self.objets = ObjetStacks(objets)
         # Loot will be generated on first entry with player luck
         self.loot_generated = False
         self.rarity = rarity
@@ -152,7 +177,7 @@ class Room(ABC):
         Returns:
         - bool: True if door exists
         """
-        return direction in self.doors
+        return bool(self.doors & DOOR_BITS[direction])
     
 
     def generate_loot_on_enter(self, player):
@@ -180,7 +205,8 @@ class Room(ABC):
         - num_rotations: int, number of 90-degree clockwise rotations (0-3)
         
         Returns:
-        - Room: new instance with rotated doors and image
+        - Room: new instance with rotated doors; the sprite is not rotated
+          here, the frontend draws it according to rotation
         
         Door rotation mapping:
         - up → right → down → left → up
@@ -188,23 +214,17 @@ class Room(ABC):
         if num_rotations == 0:
             return self  # No rotation needed, return original instance
         
-        # Manually create a new room instance with rotated attributes
-        rotated_doors = self.original_doors.copy()
-        
-        # Apply rotation num_rotations times (clockwise); keep only first valid orientation per source room
-        for _ in range(num_rotations):
-            rotation_map = {"up": "right", "right": "down", "down": "left", "left": "up"}
-            rotated_doors = [rotation_map[d] for d in rotated_doors]
-
-        rotated_image = pygame.transform.rotate(self.image, -90 * num_rotations) if self.image else None
+        # Rotation horaire du masque de portes : up -> right -> down -> left -> up
+        rotated_doors = rotate_doors(self.original_doors, num_rotations)
 
         # Instantiate WITHOUT calling subclass __init__ (manual clone) to preserve existing state while only changing rotation & doors
         rotated = self.__class__.__new__(self.__class__)
         # Copy scalar & mutable attributes
         rotated.name = self.name
-        rotated.image = rotated_image
+        rotated.image_path = self.image_path
+        rotated.image = self.image  # Orientation portée par rotation, pas par l'image
         rotated.doors = rotated_doors
-        rotated.original_doors = self.original_doors.copy()
+        rotated.original_doors = self.original_doors
         rotated.gem_cost = self.gem_cost
         rotated.item_pool = self.item_pool  # Copy item_pool reference
         rotated.objets = self.objets.copy()
@@ -219,6 +239,26 @@ class Room(ABC):
         return rotated
 
     
+    def clone(self):
+        """Return a fresh copy of this room for a new run.
+
+        Returns:
+        - Room: same class, sharing immutable data (image, item_pool,
+          original_doors, rarity...) with this room but with its own
+          doors, objets and one-shot flags reset
+
+        Used to start a game from the prebuilt catalog template without
+        running the subclass constructors again.
+        """
+        room = self.__class__.__new__(self.__class__)
+        for name in Room.__slots__:
+            setattr(room, name, getattr(self, name))
+        room.doors = self.original_doors
+        room.objets = ObjetStacks()
+        room.loot_generated = False
+        room.effect_triggered = False
+        return room
+
     def get_all_rotations(self):
         """Returns a list of all possible rotations of this room.
         
@@ -249,42 +289,6 @@ class Room(ABC):
         self.generate_loot_on_enter(player)
 
 
-# ==============================
-# Pièces fixes : début / fin
-# ==============================
-class EntranceHall(Room):
-    """Starting room at bottom of manor (Y=8).
-    
-    Fixed placement, always present at game start.
-    Doors: up, left, right.
-    """
-    def __init__(self):
-        super().__init__(
-            name="EntranceHall",
-            image=pygame.image.load("assets/rooms/Blue/Entrance_Hall.png"),
-            doors=["up", "left", "right"],
-            placement_condition="bottom",
-            color="blue",
-            objets=[]
-        )
-
-
-class Antechamber(Room):
-    """Victory room at top of manor (Y=0).
-    
-    Fixed placement, reaching this room wins the game.
-    Doors: down, left, right.
-    """
-    def __init__(self):
-        super().__init__(
-            name="Antechamber",
-            image=pygame.image.load("assets/rooms/Blue/Antechamber.png"),
-            doors=["down", "left", "right"],
-            placement_condition="top",
-            color="blue",
-        )
-
-
 # ==============================
 # GREEN ROOMS (pièces vertes)
 # ==============================
@@ -298,19 +302,7 @@ class Greenhouse(Room):
     Rarity: 1 (uncommon)
     Placement: Edge only
     """
-    def __init__(self):
-        super().__init__(
-            name="Greenhouse",
-            image=pygame.image.load("assets/rooms/Green/Greenhouse.png"),
-            doors=["down"],
-            # Ajout PatteLapin pour disponibilité théorique des permanents
-            item_pool=[Gemmes(4), PatteLapin(), EndroitCreuser(), EndroitCreuser(), Pomme(), Pomme(), Banane(), Banane()],
-            objets=[],
-            rarity=1,
-            placement_condition="edge",
-            color="green"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         manor = getattr(player, "manor", None)
         if manor is None:
@@ -322,24 +314,14 @@ class Greenhouse(Room):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
 
+
 class MorningRoom(Room):
     """Green room that grants +2 gems (one-time effect).
     
     Rarity: 1 (uncommon)
     Placement: Edge only
     """
-    def __init__(self):
-        super().__init__(
-            name="Morning Room",
-            image=pygame.image.load("assets/rooms/Green/Morning_Room.png"),
-            doors=["down", "left"],
-            item_pool=[Gemmes(2), EndroitCreuser(), Pelle(), Coffre()],
-            rarity=1,
-            placement_condition="edge",
-            color="green"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -360,18 +342,7 @@ class SecretGarden(Room):
     Rarity: 2 (rare)
     Placement: Edge only
     """
-    def __init__(self):
-        super().__init__(
-            name="SecretGarden",
-            image=pygame.image.load("assets/rooms/Green/Secret_Garden.png"),
-            doors=["left", "right", "down"],
-            item_pool=[Gemmes(1), Pomme(), Pomme(), Pomme(), Banane(), Banane(), Banane(), EndroitCreuser(), EndroitCreuser()],
-            rarity=2,
-            placement_condition="edge",
-            color="green"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -411,19 +382,7 @@ class Veranda(Room):
     Placement: Edge only
     Cost: 2 gems
     """
-    def __init__(self):
-        super().__init__(
-            name="Veranda",
-            image=pygame.image.load("assets/rooms/Green/Veranda.png"),
-            doors=["up", "down"],
-            gem_cost=2,
-            item_pool=[Gemmes(1), EndroitCreuser()],
-            rarity=1,
-            placement_condition="edge",
-            color="green"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -438,42 +397,6 @@ class Veranda(Room):
         self.effect_triggered = True 
 
 
-class Cloister(Room):
-    """Green crossroads room with 4 doors.
-    
-    Rarity: 1 (uncommon)
-    Placement: Center only
-    Cost: 3 gems
-    """
-    def __init__(self):
-        super().__init__(
-            name="Cloister",
-            image=pygame.image.load("assets/rooms/Green/Cloister.png"),
-            doors=["left", "right", "up", "down"],
-            gem_cost=3,
-            item_pool=[Gemmes(2), EndroitCreuser(), EndroitCreuser(), Cles(1), Pelle()],
-            rarity=1,
-            placement_condition="center",
-            color="green"
-        )
-
-class Courtyard(Room):
-    """Green room with 3 doors and dig spots.
-    
-    Rarity: 1 (uncommon)
-    Placement: Center only
-    """
-    def __init__(self):
-        super().__init__(
-            name="Courtyard",
-            image=pygame.image.load("assets/rooms/Green/Courtyard.png"),
-            doors=["left", "right", "down"],
-            item_pool=[Or(3), EndroitCreuser(), EndroitCreuser(), Pomme(), Pomme(), Banane(), Banane(), Pelle()],
-            rarity=1,
-            placement_condition="center",
-            color="green"
-        )
-
 class Patio(Room):
     """Green room that adds +1 gem to all green rooms (one-time effect).
     
@@ -482,18 +405,7 @@ class Patio(Room):
     Rarity: 2 (rare)
     Placement: Edge only
     """
-    def __init__(self):
-        super().__init__(
-            name="Patio",
-            image=pygame.image.load("assets/rooms/Green/Patio.png"),
-            doors=["left", "down"],
-            item_pool=[Gemmes(1), EndroitCreuser(), EndroitCreuser()],
-            rarity=2,
-            placement_condition="edge",
-            color="green"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -522,18 +434,7 @@ class Terrace(Room):
     Rarity: 1 (uncommon)
     Placement: Edge only
     """
-    def __init__(self):
-        super().__init__(
-            name="Terrace",
-            image=pygame.image.load("assets/rooms/Green/Terrace.png"),
-            doors=["down"],
-            item_pool=[Or(2), EndroitCreuser()],
-            rarity=1,
-            placement_condition="edge",
-            color="green"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -562,18 +463,7 @@ class HerLadyshipsChamber(Room):
     Rarity: 2 (rare)
     Placement: Any
     """
-    def __init__(self):
-        super().__init__(
-            name="HerLadyshipsChamber",
-            image=pygame.image.load("assets/rooms/Purple/Her_Ladyships_Chamber.png"),
-            doors=["down"],
-            item_pool=[Gemmes(2), Cles(1), Des(1), Coffre()],
-            rarity=2,
-            placement_condition="any",
-            color="purple"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -593,18 +483,7 @@ class MasterBedroom(Room):
     Placement: Any
     Cost: 2 gems
     """
-    def __init__(self):
-        super().__init__(
-            name="MasterBedroom",
-            image=pygame.image.load("assets/rooms/Purple/Master_Bedroom.png"),
-            doors=["down"],
-            gem_cost=2,
-            item_pool=[Gemmes(1), Cles(1), Coffre()],
-            rarity=2,
-            placement_condition="any",
-            color="purple"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
@@ -624,18 +503,7 @@ class Nursery(Room):
     Rarity: 1 (uncommon)
     Placement: Any
     """
-    def __init__(self):
-        super().__init__(
-            name="Nursery",
-            image=pygame.image.load("assets/rooms/Purple/Nursery.png"),
-            doors=["down"],
-            item_pool=[Pomme(), Des(1)],
-            rarity=1,
-            placement_condition="any",
-            color="purple"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -655,17 +523,7 @@ class ServantsQuarters(Room):
     Rarity: 1 (uncommon)
     Placement: Any
     """
-    def __init__(self):
-        super().__init__(
-            name="ServantsQuarters",
-            image=pygame.image.load("assets/rooms/Purple/Servants_Quarters.png"),
-            doors=["down"],
-            item_pool=[Cles(2)],
-            rarity=1,
-            placement_condition="any",
-            color="purple"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
@@ -692,17 +550,7 @@ class Bedroom(Room):
     Rarity: 0 (common)
     Placement: Any
     """
-    def __init__(self):
-        super().__init__(
-            name="Bedroom",
-            image=pygame.image.load("assets/rooms/Purple/Bedroom.png"),
-            doors=["left", "down"],
-            item_pool=[Gemmes(1), Des(1)],
-            rarity=0,
-            placement_condition="any",
-            color="purple"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
@@ -719,16 +567,7 @@ class Boudoir(Room):
     Rarity: 1 (uncommon)
     Placement: Any
     """
-    def __init__(self):
-        super().__init__(
-            name="Boudoir",
-            image=pygame.image.load("assets/rooms/Purple/Boudoir.png"),
-            doors=["down", "left"],
-            rarity=1,
-            placement_condition="any",
-            color="purple"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
@@ -742,41 +581,13 @@ class Boudoir(Room):
             player.add_message(f"Boudoir: bonus spécial de +{bonus} pas consommé")
 
 
-class BunkRoom(Room):
-    """Purple bedroom with gold and dice.
-    
-    Rarity: 2 (rare)
-    Placement: Any
-    """
-    def __init__(self):
-        super().__init__(
-            name="BunkRoom",
-            image=pygame.image.load("assets/rooms/Purple/Bunk_Room.png"),
-            doors=["down"],
-            item_pool=[Or(2), Des(1)],
-            rarity=2,
-            placement_condition="any",
-            color="purple"
-        )
-
 class GuestBedroom(Room):
     """Purple room granting +10 steps (one-time effect).
     
     Rarity: 1 (uncommon)
     Placement: Any
     """
-    def __init__(self):
-        super().__init__(
-            name="GuestBedroom",
-            image=pygame.image.load("assets/rooms/Purple/GuestBedroom.png"),
-            doors=["down"],
-            item_pool=[Gemmes(1), Or(4)],
-            rarity=1,
-            placement_condition="any",
-            color="purple"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -792,95 +603,11 @@ class GuestBedroom(Room):
 # ORANGE ROOMS (Hallways)
 # ==============================
 
-class Corridor(Room):
-    def __init__(self):
-        super().__init__(
-            name="Corridor",
-            image=pygame.image.load("assets/rooms/Orange/Corridor.png"),
-            doors=["up", "down"],
-            item_pool=[Or(3), Cles(1), DetecteurMetaux(), Pelle(), Coffre()],
-            rarity=0,
-            placement_condition="any",
-            color="orange"
-        )
-
-class EastWingHall(Room):
-    def __init__(self):
-        super().__init__(
-            name="EastWingHall",
-            image=pygame.image.load("assets/rooms/Orange/East_Wing_Hall.png"),
-            doors=["left", "right", "down"],
-            item_pool=[Or(3), Cles(1), EndroitCreuser(), Pelle(), Coffre(), Gateau()],
-            rarity=1,
-            placement_condition="any",
-            color="orange"
-        )
-
-class WestWingHall(Room):
-    def __init__(self):
-        super().__init__(
-            name="WestWingHall",
-            image=pygame.image.load("assets/rooms/Orange/West_Wing_Hall.png"),
-            doors=["left", "right", "down"],
-            item_pool=[Or(4), Cles(2), EndroitCreuser(), EndroitCreuser(), Pelle(), Coffre(), Repas()],
-            rarity=1,
-            placement_condition="any",
-            color="orange"
-        )
-
-class Hallway(Room):
-    def __init__(self):
-        super().__init__(
-            name="Hallway",
-            image=pygame.image.load("assets/rooms/Orange/Hallway.png"),
-            doors=["left", "right", "down"],
-            item_pool=[Or(2), Cles(2), Des(1), Coffre(), Sandwich()],
-            rarity=0,
-            placement_condition="any",
-            color="orange"
-        )
-
-class Passageway(Room):
-    def __init__(self):
-        super().__init__(
-            name="Passageway",
-            image=pygame.image.load("assets/rooms/Orange/Passageway.png"),
-            doors=["left", "right", "up", "down"],
-            item_pool=[Or(2), Cles(1), Coffre(), KitCrochetage()],
-            rarity=0,
-            placement_condition="any",
-            color="orange"
-        )
-
-class GreatHall(Room):
-    def __init__(self):
-        super().__init__(
-            name="GreatHall",
-            image=pygame.image.load("assets/rooms/Orange/Great_Hall.png"),
-            doors=["left", "right", "up", "down"],
-            item_pool=[Or(5), Gemmes(2), Cles(2), Repas()],
-            rarity=2,
-            placement_condition="any",
-            color="orange"
-        )
-
 class Foyer(Room):
     """
     Effet : Active un flag (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Foyer",
-            image=pygame.image.load("assets/rooms/Orange/Foyer.png"),
-            doors=["up", "down"],
-            gem_cost=2,
-            item_pool=[Or(3), Cles(1), Casier()],
-            rarity=2,
-            placement_condition="any",
-            color="orange"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -896,18 +623,7 @@ class SecretPassage(Room):
     """
     Effet : Active un flag (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="SecretPassage",
-            image=pygame.image.load("assets/rooms/Orange/Secret_Passage.png"),
-            doors=["down"],
-            item_pool=[Gemmes(1), Des(1), Casier()],
-            rarity=3,
-            placement_condition="any",
-            color="orange"
-        )
-        self.effect_triggered = False
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -927,18 +643,7 @@ class LockerRoom(Room):
     """
     Effet : Répartit des clés (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="LockerRoom",
-            image=pygame.image.load("assets/rooms/Blue/Locker_Room.png"),
-            doors=["up", "down"],
-            item_pool=[Or(3), Gemmes(2), Cles(4), Casier(), KitCrochetage()],
-            rarity=1,
-            placement_condition="any",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -972,19 +677,7 @@ class Vault(Room):
     """
     Effet : Donne +40 Or (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Vault",
-            image=pygame.image.load("assets/rooms/Blue/Vault.png"),
-            doors=["down"],  # cul-de-sac
-            gem_cost=3,
-            item_pool=[Or(40), Gemmes(3), Cles(1), Coffre()],
-            rarity=3,
-            placement_condition="edge",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1000,18 +693,7 @@ class Workshop(Room):
     """
     Effet : Donne un objet permanent (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Workshop",
-            image=pygame.image.load("assets/rooms/Blue/Workshop.png"),
-            doors=["up", "down"],
-            item_pool=[Pelle(), Marteau(), DetecteurMetaux(), PatteLapin(), KitCrochetage(), Casier()],
-            rarity=2,
-            placement_condition="center",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1029,17 +711,7 @@ class BoilerRoom(Room):
     """
     Effet : Donne +3 pas (RÉPÉTABLE).
     """
-    def __init__(self):
-        super().__init__(
-            name="BoilerRoom",
-            image=pygame.image.load("assets/rooms/Blue/Boiler_Room.png"),
-            doors=["left", "down", "right"],
-            item_pool=[EndroitCreuser(), DetecteurMetaux(), Or(3), Pelle(), KitCrochetage()],
-            rarity=2,
-            placement_condition="center",
-            color="blue"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
@@ -1052,18 +724,7 @@ class ConferenceRoom(Room):
     """
     Effet : Active un 'aimant' (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="ConferenceRoom",
-            image=pygame.image.load("assets/rooms/Blue/Conference_Room.png"),
-            doors=["down", "left", "right"],
-            item_pool=[Or(4), Gemmes(1), Cles(1), DetecteurMetaux(), Pelle(), KitCrochetage()],
-            rarity=2,
-            placement_condition="center",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1080,18 +741,7 @@ class Gallery(Room):
     """
     Effet : Donne +1 gemme (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Gallery",
-            image=pygame.image.load("assets/rooms/Blue/Gallery.png"),
-            doors=["up", "down"],
-            item_pool=[Gemmes(1), Or(2)],
-            rarity=1,
-            placement_condition="center",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1107,18 +757,7 @@ class Garage(Room):
     """
     Effet : Donne +3 clés (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Garage",
-            image=pygame.image.load("assets/rooms/Blue/Garage.png"),
-            doors=["down"],
-            item_pool=[Or(2), KitCrochetage()],
-            rarity=1,
-            placement_condition="any",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return
         
@@ -1134,17 +773,7 @@ class Library(Room):
     """
     Effet : Augmente le bonus de rareté (RÉPÉTABLE).
     """
-    def __init__(self):
-        super().__init__(
-            name="Library",
-            image=pygame.image.load("assets/rooms/Blue/Library.png"),
-            doors=["left", "down"],
-            item_pool=[Gemmes(1), Des(1), PatteLapin()],
-            rarity=1,
-            placement_condition="any",
-            color="blue"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
@@ -1158,18 +787,7 @@ class RumpusRoom(Room):
     """
     Effet : Donne +8 Or (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="RumpusRoom",
-            image=pygame.image.load("assets/rooms/Blue/Rumpus_Room.png"),
-            doors=["up", "down"],
-            item_pool=[Or(8), Banane(), Des(2), Cles(2), Gemmes(1), Sandwich()],
-            rarity=1,
-            placement_condition="any",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1185,18 +803,7 @@ class Pantry(Room):
     """
     Effet : Donne +4 Or (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Pantry",
-            image=pygame.image.load("assets/rooms/Blue/Pantry.png"),
-            doors=["left", "down"],
-            item_pool=[Or(4), Pomme(), Banane(), Gateau(), Sandwich()],
-            rarity=0,
-            placement_condition="any",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1212,18 +819,7 @@ class Room8(Room):
     """
     Effet : Donne +1 gemme (UNE SEULE FOIS).
     """
-    def __init__(self):
-        super().__init__(
-            name="Room8",
-            image=pygame.image.load("assets/rooms/Blue/Room_8.png"),
-            doors=["left", "down"],
-            item_pool=[Or(5), Gemmes(2), Banane(), Cles(1)],
-            rarity=1,
-            placement_condition="any",
-            color="blue"
-        )
-        self.effect_triggered = False 
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         if self.effect_triggered: return 
         
@@ -1239,28 +835,13 @@ class Rotunda(Room):
     """
     Effet : Fait tourner les portes (RÉPÉTABLE).
     """
-    def __init__(self):
-        super().__init__(
-            name="Rotunda",
-            image=pygame.image.load("assets/rooms/Blue/Rotunda.png"),
-            doors=["down", "left"],
-            gem_cost=3,
-            item_pool=[Or(4), Gemmes(1)],
-            rarity=2,
-            placement_condition="center",
-            color="blue"
-        )
-
+    __slots__ = ()
     def apply_effect_on_enter(self, player):
         # Generate loot with player luck
         self.generate_loot_on_enter(player)
         
         # rotation des portes : up->right->down->left
-        new_doors = []
-        mapping = {"up": "right", "right": "down", "down": "left", "left": "up"}
-        for d in self.doors:
-            new_doors.append(mapping.get(d, d))  # Rotate each existing door clockwise
-        self.doors = new_doors
+        self.doors = rotate_doors(self.doors, 1)
         player.add_message("Rotunda: les portes ont tourné")
         
 
@@ -1268,214 +849,639 @@ class Rotunda(Room):
 # ==============================
 # YELLOW ROOMS (Magasins unifiés)
 # ==============================
+class ShopRoom(ShopEffect, Room):
+    """Yellow shop room: Bookshop, Commissary, Kitchen, LaundryRoom, Locksmith,
+    GiftShop, Showroom and Armory only differ by their spec.
 
-class Bookshop(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="Bookshop",
-            image=pygame.image.load("assets/rooms/Yellow/Bookshop.png"),
-            doors=["left", "down"],
-            rarity=1,
-            placement_condition="any",
-            color="yellow"
-        )
+    Effect: opens the shared shop menu (ShopEffect).
+    """
+    __slots__ = ()
 
+# ==============================
+# Catalogue / Factory
+# ==============================
+def build_room(spec):
+    """Build the Room described by a RoomSpec.
 
-class Commissary(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="Commissary",
-            image=pygame.image.load("assets/rooms/Yellow/Commissary.png"),
-            doors=["left", "down"],
-            rarity=1,
-            placement_condition="any",
-            color="yellow"
-        )
+    Parameters:
+    - spec: room_specs.RoomSpec
 
+    Returns:
+    - Room: instance of the spec's hook class (rooms with their own effect
+      code) or of Room itself for rooms fully described by their spec
+    """
+    cls = ROOM_HOOKS[spec.hook] if spec.hook else Room
+    return cls(
+        name=spec.name,
+        image_path=spec.image_path,
+        doors=door_mask(spec.doors),
+        gem_cost=spec.gem_cost,
+        item_pool=spec.item_pool,  # Tuple de prototypes partagé, jamais modifié
+        rarity=spec.rarity,
+        placement_condition=spec.placement_condition,
+        color=spec.color,
+        base_weight=spec.base_weight,
+    )
 
-class Kitchen(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="Kitchen",
-            image=pygame.image.load("assets/rooms/Yellow/Kitchen.png"),
-            doors=["down", "left"],
-            rarity=0,
-            placement_condition="any",
-            color="yellow"
-        )
 
+def build_room_catalog():
+    """Build fresh room catalog for a new game.
+    
+    Returns:
+    - list[Room]: Complete set of room instances
+    
+    Creates new instances to avoid state mutation between runs.
+    Includes duplicates for common rooms to adjust draw probabilities
+    and to be able to draw rooms multiple times: spec.copies entries per
+    kind of the room spec table, in table order.
+    """
+    catalog = []
+    for spec in get_room_table():
+        room = build_room(spec)
+        catalog.append(room)
+        catalog.extend(room.clone() for _ in range(spec.copies - 1))
+    return catalog
 
-class LaundryRoom(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="LaundryRoom",
-            image=pygame.image.load("assets/rooms/Yellow/Laundry_Room.png"),
-            doors=["down"],
-            rarity=1,
-            placement_condition="any",
-            color="yellow"
-        )
+_shared_catalog = None
 
 
-class Locksmith(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="Locksmith",
-            image=pygame.image.load("assets/rooms/Yellow/Locksmith.png"),
-            doors=["down"],
-            rarity=2,
-            placement_condition="any",
-            color="yellow"
-        )
+def get_room_catalog():
+    """Return the shared read-only room catalog, building it on first use.
 
+    Returns:
+    - list[Room]: catalog built once per process by build_room_catalog()
 
-class GiftShop(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="GiftShop",
-            image=pygame.image.load("assets/rooms/Yellow/Mount_Holly_Gift_Shop.png"),
-            doors=["left", "down", "right"],
-            rarity=1,
-            placement_condition="any",
-            color="yellow"
-        )
+    Importing this module builds nothing; the catalog only exists once a
+    caller actually asks for it. It is the template every Manor clones its
+    rooms from (Room.clone), so it must never be mutated.
+    """
+    global _shared_catalog
+    if _shared_catalog is None:
+        _shared_catalog = build_room_catalog()
+    return _shared_catalog
 
 
-class Showroom(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="Showroom",
-            image=pygame.image.load("assets/rooms/Yellow/Showroom.png"),
-            doors=["up", "down"],
-            rarity=2,
-            placement_condition="any",
-            color="yellow"
-        )
+FIXED_ROOMS = ("EntranceHall", "Antechamber")  # Placées par Manor, jamais tirées
+_start_catalog = None  # (catalogue partagé, RoomCatalog de début de partie construit depuis lui)
 
 
-class Armory(ShopEffect, Room):
-    def __init__(self):
-        super().__init__(
-            name="Armory",
-            image=pygame.image.load("assets/rooms/Yellow/The_Armory.png"),
-            doors=["down", "left"],
-            rarity=2,
-            placement_condition="any",
-            color="yellow"
-        )
+def get_start_catalog():
+    """Return the RoomCatalog every run starts from, built once from the shared catalog.
+
+    Returns:
+    - RoomCatalog: the copies of every kind except FIXED_ROOMS; never drawn
+      from (a Manor draws from a copy(), see RoomCatalog.copy)
+    """
+    global _start_catalog
+    templates = get_room_catalog()
+    if _start_catalog is None or _start_catalog[0] is not templates:
+        _start_catalog = (templates, RoomCatalog(t for t in templates if t.name not in FIXED_ROOMS))
+    return _start_catalog[1]
 
 
+def room_kinds():
+    """Return the room kind (name) of every catalog image, for memory_report().
+
+    Returns:
+    - dict: normalized image path -> room name (read from the spec table,
+      no Room is built)
+    """
+    table = get_room_table()
+    return {os.path.normpath(path): name  # Même clé que ImageCache.normalize
+            for path, name in zip(table.column("image_path"), table.column("name")) if path}
+
+
+def __getattr__(name):
+    # Garder ROOM_CATALOG accessible (construit paresseusement au premier accès)
+    if name == "ROOM_CATALOG":
+        return get_room_catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class RoomCatalog:
+    """Multiset of available rooms: one shared definition and a count per kind.
+
+    The definition of a kind is a template Room (from the shared catalog)
+    that is never placed nor mutated; drafted rooms are fresh copies of it.
+    Adding, removing and checking the availability of a kind are O(1), and
+    iterating yields each available kind once, however many copies remain.
+    """
+
+    def __init__(self, rooms=()):
+        """Count rooms by name, keeping the first of each name as definition.
+
+        Parameters:
+        - rooms: iterable of Room, one entry per available copy
+        """
+        self.definitions = {}  # name -> Room modèle (partagé, jamais modifié)
+        self.counts = {}  # name -> exemplaires encore disponibles
+        self.total = 0
+        self.origin = None  # catalogue dont celui-ci est une copie (copy())
+        self.draft_bases = {}  # (largeur, hauteur) -> pools de début de partie des copies (DraftPools)
+        self.room_weights = RoomWeightCache()  # Poids de tirage, partagés avec les copies
+        for room in rooms:
+            self.add(room)
+
+    def copy(self):
+        """Return a catalog with the same counts and definitions, whose origin is self.
+
+        Runs draw from a copy of a shared start catalog (get_start_catalog),
+        which is never drawn from itself and holds what the runs share
+        (draft_bases; room_weights, which the copy uses as its own).
+        """
+        catalog = RoomCatalog()
+        catalog.definitions = dict(self.definitions)
+        catalog.counts = dict(self.counts)
+        catalog.total = self.total
+        catalog.origin = self
+        catalog.room_weights = self.room_weights
+        return catalog
+
+    def add(self, room, count=1):
+        """Make count more copies of room's kind available."""
+        self.definitions.setdefault(room.name, room)
+        self.counts[room.name] = self.counts.get(room.name, 0) + count
+        self.total += count
+
+    def remove(self, name):
+        """Take one copy of a kind out of the catalog.
+
+        Parameters:
+        - name: str, room name
+
+        Returns:
+        - bool: False if no copy of that kind was available
+        """
+        count = self.counts.get(name, 0)
+        if count <= 0:
+            return False
+        if count == 1:
+            del self.counts[name]
+        else:
+            self.counts[name] = count - 1
+        self.total -= 1
+        return True
+
+    def count(self, name):
+        """Return the number of available copies of a kind."""
+        return self.counts.get(name, 0)
+
+    def definition(self, name):
+        """Return the shared template of a kind (must not be modified)."""
+        return self.definitions[name]
+
+    def new_room(self, name):
+        """Return a fresh Room of that kind, ready to be placed."""
+        return self.definitions[name].clone()
+
+    def __contains__(self, name):
+        return name in self.counts
+
+    def __iter__(self):
+        # Un modèle par type encore disponible, dans l'ordre du catalogue
+        return (self.definitions[name] for name in self.counts)
+
+    def __len__(self):
+        return self.total
+
 
 # ==============================
-# Catalogue / Factory
+# Index de compatibilité de placement
 # ==============================
-def build_room_catalog():
-    """Build fresh room catalog for a new game.
-    
+# Classes de case acceptées par chaque placement_condition (une condition inconnue accepte tout)
+CELL_CLASSES = ("top", "bottom", "edge", "center")
+PLACEMENT_CELL_CLASSES = {
+    "any": frozenset(CELL_CLASSES),
+    "edge": frozenset(("top", "bottom", "edge")),
+    "center": frozenset(("center",)),
+    "top": frozenset(("top",)),
+    "bottom": frozenset(("bottom",)),
+}
+
+
+def cell_class(x, y, width, height):
+    """Return the placement class of a grid cell.
+
     Returns:
-    - list[Room]: Complete set of room instances
-    
-    Creates new instances to avoid state mutation between runs.
-    Includes duplicates for common rooms to adjust draw probabilities
-    and to be able to draw rooms multiple times.
+    - str: "top" (first row), "bottom" (last row), "edge" (first or last
+      column) or "center"; "top" and "bottom" cells are also edge cells
     """
-    return [
-        EntranceHall(),
-        Antechamber(),
-
-        # ---- GREEN ----
-        Greenhouse(),
-        Greenhouse(),
-        MorningRoom(),
-        MorningRoom(),
-        SecretGarden(),
-        SecretGarden(),
-        Veranda(),
-        Veranda(),
-        Cloister(),
-        Cloister(),
-        Courtyard(),
-        Courtyard(),
-        Patio(),
-        Patio(),
-        Terrace(),
-        Terrace(),
-
-        # ---- PURPLE ----
-        HerLadyshipsChamber(),
-        HerLadyshipsChamber(),
-        MasterBedroom(),
-        MasterBedroom(),
-        Nursery(),
-        Nursery(),
-        ServantsQuarters(),
-        ServantsQuarters(),
-        Bedroom(),
-        Bedroom(),
-        Boudoir(),
-        Boudoir(),
-        BunkRoom(),
-        BunkRoom(),
-        GuestBedroom(),
-        GuestBedroom(),
-
-        # ---- ORANGE ROOMS ----
-        Corridor(),
-        Corridor(),
-        EastWingHall(),
-        EastWingHall(),
-        WestWingHall(),
-        WestWingHall(),
-        Hallway(),
-        Hallway(),
-        Passageway(),
-        Passageway(),
-        GreatHall(),
-        GreatHall(),
-        Foyer(),
-        Foyer(),
-        SecretPassage(),
-        SecretPassage(),
-
-        # Blue rooms
-        LockerRoom(),
-        LockerRoom(),
-        Vault(),
-        Vault(),
-        Workshop(),
-        Workshop(),
-        BoilerRoom(),
-        BoilerRoom(),
-        ConferenceRoom(),
-        ConferenceRoom(),
-        Gallery(),
-        Gallery(),
-        Garage(),
-        Garage(),
-        Library(),
-        Library(),
-        RumpusRoom(),
-        RumpusRoom(),
-        Pantry(),
-        Pantry(),
-        Room8(),
-        Room8(),
-        Rotunda(),
-        Rotunda(),
-
-        # Yellow
-        Bookshop(),
-        Commissary(),
-        Kitchen(),
-        LaundryRoom(),
-        Locksmith(),
-        GiftShop(),
-        Showroom(),
-        Armory(),
-    ]
+    if y == 0:
+        return "top"
+    if y == height - 1:
+        return "bottom"
+    if x in (0, width - 1):
+        return "edge"
+    return "center"
+
+
+def in_bounds_mask(x, y, width, height):
+    """Return the door mask of the directions leading inside the grid from a cell."""
+    mask = 0
+    for bit, (dx, dy) in DOOR_OFFSETS.items():
+        if 0 <= x + dx < width and 0 <= y + dy < height:
+            mask |= bit
+    return mask
+
 
-# Garder un catalogue initial si besoin ailleurs (non utilisé pour les nouvelles parties)
-ROOM_CATALOG = build_room_catalog()
+_cell_tables = {}  # (largeur, hauteur) -> (classes, masques) par case
+_placement_tables = {}  # (largeur, hauteur) -> table construite par _build_placement_table
+_draft_entries = {}  # (largeur, hauteur, situation, classe du joueur) -> [(type, rotation)]
+
+
+def get_cell_tables(width, height):
+    """Return the class and in-bounds door mask of every cell, built once per grid size.
+
+    Returns:
+    - tuple[list, list]: grids indexed [y][x] of cell_class() strings and of
+      in_bounds_mask() ints (shared, must not be modified)
+    """
+    tables = _cell_tables.get((width, height))
+    if tables is None:
+        tables = _cell_tables[(width, height)] = (
+            [[cell_class(x, y, width, height) for x in range(width)] for y in range(height)],
+            [[in_bounds_mask(x, y, width, height) for x in range(width)] for y in range(height)],
+        )
+    return tables
+
+
+def _build_placement_table(width, height):
+    """Compute, for every placement situation of the grid, the kinds that fit it.
+
+    A situation is (target cell class, required door bit, in-bounds door
+    mask of the target cell). A kind fits in its first rotation (0-3 quarter turns
+    clockwise) that has the required door and only doors pointing inside the
+    grid, provided its placement_condition accepts the target cell class.
+
+    Returns:
+    - dict: situation -> list of (kind, rotation, player_cell_classes), in
+      catalog order; player_cell_classes is the frozenset of cell classes
+      the placement_condition accepts (also checked on the player's cell)
+    """
+    classes_grid, masks_grid = get_cell_tables(width, height)
+    situations = {(classes_grid[y][x], masks_grid[y][x]) for y in range(height) for x in range(width)}
+    table = {}
+    seen = set()
+    for template in get_room_catalog():
+        if template.name in seen:
+            continue  # Plusieurs exemplaires du même type : une seule entrée
+        seen.add(template.name)
+        classes = PLACEMENT_CELL_CLASSES.get(template.placement_condition, PLACEMENT_CELL_CLASSES["any"])
+        masks = [rotate_doors(template.original_doors, rotation) for rotation in range(4)]
+        for target_class, bounds in situations:
+            if target_class not in classes:
+                continue
+            for door in DOOR_OFFSETS:
+                for rotation, mask in enumerate(masks):
+                    if mask & door and not mask & ~bounds:  # Porte requise, aucune porte hors de la grille
+                        table.setdefault((target_class, door, bounds), []).append((template.name, rotation, classes))
+                        break
+    return table
+
+
+def get_placement_table(width, height):
+    """Return the placement table of the shared catalog, built once per grid size."""
+    table = _placement_tables.get((width, height))
+    if table is None:
+        table = _placement_tables[(width, height)] = _build_placement_table(width, height)
+    return table
+
+
+def get_draft_entries(width, height, situation, player_class):
+    """Return the (kind, rotation) fitting a situation seen from a player cell class.
+
+    Same entries as the placement table, keeping those whose
+    placement_condition also accepts the player's cell; built once per
+    (grid size, situation, player class) and shared between runs.
+    """
+    key = (width, height, situation, player_class)
+    entries = _draft_entries.get(key)
+    if entries is None:
+        entries = _draft_entries[key] = [(kind, rotation) for kind, rotation, classes
+                                         in get_placement_table(width, height).get(situation, ())
+                                         if player_class in classes]
+    return entries
+
+
+class PlacementIndex:
+    """Which available kinds fit which placement situation, for one run.
+
+    Starts from the shared placement table (see _build_placement_table)
+    restricted to the kinds of a RoomCatalog, then forgets a kind as soon as
+    its last copy is placed (discard). A draft only looks up its situation
+    instead of rotating and checking the whole catalog. It also counts the
+    available kinds having each door, which is all can_advance needs.
+    """
+
+    def __init__(self, room_catalog, width, height):
+        """Index the kinds available in room_catalog.
+
+        Parameters:
+        - room_catalog: RoomCatalog of the run
+        - width, height: int, grid size
+        """
+        self.room_catalog = room_catalog
+        self.entries = {}  # situation -> [(type, rotation, classes du joueur)]
+        self.keys_by_kind = {}  # type -> situations où il apparaît
+        counts = room_catalog.counts
+        for key, entries in get_placement_table(width, height).items():
+            available = [entry for entry in entries if entry[0] in counts]
+            self.entries[key] = available
+            for entry in available:
+                self.keys_by_kind.setdefault(entry[0], []).append(key)
+        self.kinds = set(room_catalog.counts)
+        self.door_kinds = dict.fromkeys(DOOR_OFFSETS, 0)  # bit de porte -> types disponibles qui l'ont (sans rotation)
+        for template in room_catalog:
+            self._count_doors(template.original_doors, 1)
+
+    def _count_doors(self, doors, delta):
+        for bit in self.door_kinds:
+            if doors & bit:
+                self.door_kinds[bit] += delta
+
+    def candidates(self, target_class, required_door, mask):
+        """Return the (kind, rotation, player_cell_classes) fitting a situation.
+
+        Parameters:
+        - target_class: str, cell_class() of the target cell
+        - required_door: int, door bit the new room needs towards the player
+        - mask: int, in_bounds_mask() of the target cell
+
+        Returns:
+        - list: entries in catalog order (must not be modified)
+        """
+        return self.entries.get((target_class, required_door, mask), [])
+
+    def discard(self, kind):
+        """Forget a kind whose last copy left the catalog."""
+        if kind not in self.kinds:
+            return
+        self.kinds.discard(kind)
+        for key in self.keys_by_kind.pop(kind, ()):
+            self.entries[key] = [entry for entry in self.entries[key] if entry[0] != kind]
+        self._count_doors(self.room_catalog.definition(kind).original_doors, -1)
+
+    def has_door(self, door):
+        """Return True if some available kind has that door bit in its base orientation."""
+        return self.door_kinds.get(door, 0) > 0
+
+
+class RoomView:
+    """A catalog template seen in one orientation, as offered in a draft.
+
+    Drafting only reads its candidates (name, doors, cost, weight), so it
+    evaluates (template, quarter turns) pairs and hands the three offered
+    ones out as views instead of Room copies. The menu draws them like
+    rooms; the Room itself is only built by materialize() when the chosen
+    view is placed (Manor.place_room). Every attribute not defined here is
+    read from the template.
+    """
+    __slots__ = ("room", "turns", "gem_cost")
+
+    def __init__(self, room, turns=0, gem_cost=None):
+        """Parameters:
+        - room: Room, catalog template (never modified through the view)
+        - turns: int, quarter turns clockwise (0-3)
+        - gem_cost: int or None, cost of this offer (None = template's cost);
+          Terrace or the forced free room change it without touching the template
+        """
+        self.room = room
+        self.turns = turns
+        self.gem_cost = room.gem_cost if gem_cost is None else gem_cost
+
+    def __getattr__(self, name):
+        # Appelé seulement pour les attributs absents de la vue : lecture sur le modèle
+        if name == "room":
+            raise AttributeError(name)  # Vue pas encore initialisée (copy, pickle...)
+        return getattr(self.room, name)
+
+    @property
+    def doors(self):
+        """Door mask of the template in this orientation."""
+        return rotate_doors(self.room.original_doors, self.turns)
+
+    @property
+    def rotation(self):
+        """Orientation in degrees (0, 90, 180, 270), like Room.rotation."""
+        return self.turns * 90
+
+    def materialize(self):
+        """Build the Room this view stands for.
+
+        Returns:
+        - Room: fresh copy of the template (clone() or create_rotated_copy())
+          with this view's orientation and gem cost
+        """
+        room = self.room.create_rotated_copy(self.turns) if self.turns else self.room.clone()
+        room.gem_cost = self.gem_cost
+        return room
+
+
+def room_base_weight(room):
+    """Return the draw weight of a room without manor bonuses: base_weight × (1/3)^rarity."""
+    return room.base_weight * (1.0 / 3.0) ** room.rarity
+
+
+class RoomWeightCache:
+    """Draw weights of the room kinds, shared by every run drawing from the same catalog.
+
+    A weight only depends on the kind's template and on the manor bonuses
+    that apply to it, so it is stored under (kind, green bonus, rarity
+    bias) where a bonus that does not apply to the kind counts as 0 (see
+    Manor.room_weight_key). A bonus change therefore only moves the kinds it
+    scales to new keys, and the weights of the start of a run (no bonus)
+    are computed once per process. The table is held by the start catalog
+    (RoomCatalog.room_weights), its size bounded by the bonus values met.
+    Hit/miss counters show how often drafts reuse a weight.
+    """
+
+    def __init__(self):
+        self.weights = {}  # (type, bonus vert, biais de rareté) -> poids
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the weight stored under key, or None (counted as a miss)."""
+        weight = self.weights.get(key)
+        if weight is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return weight
+
+    def put(self, key, weight):
+        """Store the weight under key and return it."""
+        self.weights[key] = weight
+        return weight
+
+    def stats(self):
+        """Return hit/miss counters, hit rate and number of stored weights.
+
+        Returns:
+        - dict: {"hits", "misses", "hit_rate", "entries"}
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.weights)}
+
+    def reset_stats(self):
+        """Reset hit/miss counters without dropping stored weights."""
+        self.hits = 0
+        self.misses = 0
+
+
+class DraftPool:
+    """The candidates of one draft situation and their two samplers.
+
+    Slots follow catalog order and never move: a kind whose last copy is
+    placed keeps its slot with weight 0.
+    """
+    __slots__ = ("entries", "slots", "weights", "free", "live", "synced")
+
+    def __init__(self, entries, leaves):
+        """Parameters:
+        - entries: list of (template, quarter turns), in catalog order
+        - leaves: list of (weight, free_weight) per entry, see DraftPools.leaves
+        """
+        self.entries = entries
+        self.slots = {template.name: slot for slot, (template, _) in enumerate(entries)}
+        self.weights = WeightedSampler(weight for weight, _ in leaves)  # poids du type x exemplaires
+        self.free = WeightedSampler(free for _, free in leaves)  # exemplaires des types gratuits
+        self.live = sum(1 for weight, _ in leaves if weight > 0)  # types encore disponibles
+        self.synced = 0  # changements de DraftPools.changes déjà appliqués
+
+    def copy(self):
+        """Return a pool with the same entries (shared) and copies of the samplers."""
+        pool = DraftPool.__new__(DraftPool)
+        pool.entries, pool.slots = self.entries, self.slots
+        pool.weights, pool.free = self.weights.copy(), self.free.copy()
+        pool.live, pool.synced = self.live, self.synced
+        return pool
+
+    def update(self, slot, weight, free):
+        """Change the leaves of one slot in O(log n)."""
+        self.live += (weight > 0) - (self.weights.weight(slot) > 0)
+        self.weights.set(slot, weight)
+        self.free.set(slot, free)
+
+
+class DraftPools:
+    """Draft candidates of every situation met in a run, with their draw weights.
+
+    A pool (DraftPool) holds the (template, rotation) candidates of one
+    draft situation (placement situation and class of the player's cell)
+    and two WeightedSampler over them: room weight x copies left, and
+    copies left of the rooms offered for free. Pools are built on first
+    use; after that only the slots of a kind are updated, in O(log n), when
+    its count (place_room) or its weight or cost (Greenhouse, Library,
+    Terrace) changed, so a draft no longer rebuilds weights for the whole
+    candidate list.
+
+    Changes are only logged (refresh); a pool applies the ones it has not
+    seen yet when a draft uses it, so effects and placements cost nothing
+    for the situations no draft meets again. Runs drawing from copies of
+    the same catalog share the start-of-run pools, kept on that origin
+    catalog (RoomCatalog.draft_bases): a run copies them and applies its
+    changes since it started.
+    """
+
+    def __init__(self, manor, room_catalog, start=False):
+        """Parameters:
+        - manor: Manor, gives weights (get_room_weight) and costs (offer_cost)
+        - room_catalog: RoomCatalog the counts are read from
+        - start: bool, True for a fresh run: room_catalog is an untouched
+          copy() of its origin and the manor has no bonus yet, so its
+          pools may come from the origin's start-of-run pools
+        """
+        self.manor = manor
+        self.room_catalog = room_catalog
+        self.size = (manor.WIDTH, manor.HEIGHT)
+        self.pools = {}  # (situation, classe du joueur) -> DraftPool ; (None, None) = toute la pioche
+        self.changes = []  # types dont les feuilles ont changé, dans l'ordre (journal)
+        self.leaf_cache = {}  # type -> (poids, poids gratuit) courants
+        # Pools partagés : seulement pour une copie du catalogue d'origine, identifié par identité
+        self.origin = room_catalog.origin if start else None
+        self.bases = self.origin.draft_bases.setdefault(self.size, {}) if self.origin is not None else None
+
+    def leaves(self, template):
+        """Return the (weight, free_weight) leaves of a kind in the samplers (cached per kind)."""
+        leaves = self.leaf_cache.get(template.name)
+        if leaves is None:
+            count = self.room_catalog.count(template.name)
+            if not count:
+                leaves = (0.0, 0)
+            else:
+                leaves = (self.manor.get_room_weight(template) * count,
+                          count if self.manor.offer_cost(template) == 0 else 0)
+            self.leaf_cache[template.name] = leaves
+        return leaves
+
+    def start_leaves(self, template):
+        """Return the leaves of a kind at the start of a run (origin counts, no manor bonus)."""
+        count = self.origin.count(template.name)
+        return room_base_weight(template) * count, count if template.gem_cost == 0 else 0
+
+    def pool(self, situation, player_class):
+        """Return the pool of a draft situation, building it on first use.
+
+        Parameters:
+        - situation: tuple (target_class, required_door, mask) as in
+          PlacementIndex.candidates, or None for the whole catalog
+          (rotation 0, player_class ignored)
+        - player_class: str, cell_class() of the player's cell
+
+        Returns:
+        - DraftPool: candidates fitting both cells, available or not;
+          call sync() before drawing from it
+        """
+        key = (situation, player_class) if situation is not None else (None, None)
+        pool = self.pools.get(key)
+        if pool is not None:
+            return pool
+
+        definitions = self.room_catalog.definitions
+        if situation is None:
+            entries = [(template, 0) for template in definitions.values()]
+        else:
+            entries = [(definitions[kind], rotation)
+                       for kind, rotation in get_draft_entries(*self.size, *key)
+                       if kind in definitions]
+        if self.bases is not None and situation is not None:
+            # Copie du pool de début de partie, puis mise à jour des seuls types modifiés depuis
+            base = self.bases.get(key)
+            if base is None:
+                base = self.bases[key] = DraftPool(entries, [self.start_leaves(template) for template, _ in entries])
+            pool = base.copy()  # Tout le journal reste à appliquer (synced = 0)
+        else:
+            pool = DraftPool(entries, [self.leaves(template) for template, _ in entries])
+            pool.synced = len(self.changes)
+        self.pools[key] = pool
+        return pool
+
+    def sync(self, pool):
+        """Apply to a pool the changes logged since its last use, in O(log n) per kind."""
+        if pool.synced == len(self.changes):
+            return
+        for kind in set(self.changes[pool.synced:]):
+            slot = pool.slots.get(kind)
+            if slot is not None:
+                pool.update(slot, *self.leaves(self.room_catalog.definition(kind)))
+        pool.synced = len(self.changes)
+
+    def refresh(self, kinds):
+        """Log that the leaves of some kinds changed (applied by sync).
+
+        Parameters:
+        - kinds: iterable of str, kinds whose count, weight or cost changed
+        """
+        for kind in kinds:
+            self.leaf_cache.pop(kind, None)
+            self.changes.append(kind)
+
+    def refresh_where(self, predicate):
+        """Refresh the kinds whose template matches predicate (see refresh)."""
+        self.refresh([kind for kind, room in self.room_catalog.definitions.items() if predicate(room)])
 
 
 # ==============================
@@ -1505,22 +1511,38 @@ class Manor:
         
         Sets up:
         - 5x9 grid initialized to None
-        - Fresh room catalog (excluding EntranceHall and Antechamber)
+        - Room catalog (excluding EntranceHall and Antechamber) as a copy of
+          the shared start RoomCatalog (get_start_catalog), and its
+          PlacementIndex
+        - RoomWeightCache of the catalog (shared between runs) and DraftPools
+          (draw weights kept up to date)
         - Global effect flags for room bonuses
         - Fixed placement of EntranceHall (2, 8) and Antechamber (2, 0)
         """
         # Grille de pièces
         self.grid = [[None for _ in range(self.WIDTH)] for _ in range(self.HEIGHT)]
 
-        # Catalogue frais pour cette instance
-        fresh_catalog = build_room_catalog()
-        self.room_catalog = [r for r in fresh_catalog if r.name not in ("EntranceHall", "Antechamber")]
+        # Catalogue de cette partie : copie des compteurs de départ, définitions partagées avec le modèle
+        self.room_catalog = get_start_catalog().copy()
+        fixed_rooms = {}
+        for template in get_room_catalog():
+            if template.name in FIXED_ROOMS:
+                fixed_rooms.setdefault(template.name, template)
         self.pioche = self.room_catalog
+        # Classe et masque des portes dans la grille de chaque case (partagés entre parties)
+        self.cell_classes, self.bounds_masks = get_cell_tables(self.WIDTH, self.HEIGHT)
+        # Types compatibles par situation de placement, tenu à jour par place_room
+        self.placement_index = PlacementIndex(self.room_catalog, self.WIDTH, self.HEIGHT)
+        # Poids de chaque type par valeur des bonus, partagés entre parties par le catalogue
+        self.room_weights = self.room_catalog.room_weights
+        # Poids de tirage par situation, mis à jour au placement et quand un effet change les poids
+        self.draft_pools = DraftPools(self, self.room_catalog, start=True)
 
         # Effets globaux liés aux pièces vertes
-        self.green_draw_bonus = 0      # utilisé pour favoriser les pièces vertes
-        self.green_item_bonus = False  # futur bonus d'objets dans les pièces vertes
-        self.green_rooms_free = False  # si True, les pièces vertes coûtent 0 gemme
+        # (green_draw_bonus, green_rooms_free et rarity_bias sont des propriétés qui tiennent draft_pools à jour)
+        self._green_draw_bonus = 0      # utilisé pour favoriser les pièces vertes
+        self.green_item_bonus = False   # futur bonus d'objets dans les pièces vertes
+        self._green_rooms_free = False  # si True, les pièces vertes coûtent 0 gemme
 
         # Effets globaux liés aux pièces violetes
         self.bonus_next_boudoir_steps = 0
@@ -1535,7 +1557,7 @@ class Manor:
         self.redirect_spread_to_conference = None
 
         # Biais de rareté (Library)
-        self.rarity_bias = 0
+        self._rarity_bias = 0
 
         self.found_permanents = set()
 
@@ -1543,8 +1565,8 @@ class Manor:
 
         # Placement fixe du Hall d'entrée et de l'Antechamber
         # Placer de nouvelles instances fraîches (pas celles du catalogue supprimées)
-        self.place_room(2, 8, EntranceHall())
-        self.place_room(2, 0, Antechamber())
+        self.place_room(2, 8, fixed_rooms["EntranceHall"].clone())
+        self.place_room(2, 0, fixed_rooms["Antechamber"].clone())
 
     # ---------------- utilitaires de grille ----------------
     def in_bounds(self, x, y):
@@ -1579,25 +1601,89 @@ class Manor:
         Parameters:
         - x: int, column
         - y: int, row
-        - room: Room instance to place
-        
+        - room: Room instance to place, or RoomView from draw_three_rooms
+          (materialized into a Room here)
+
+        Returns:
+        - Room: the room now at (x, y)
+
         Side effects:
         - Sets grid[y][x] to room
-        - Removes original room from room_catalog by name
+        - Takes one copy of the room's kind out of room_catalog (O(1)),
+          drops the kind from placement_index once no copy is left and
+          logs the change of its draw weights in draft_pools
         
         Raises:
         - ValueError: if position out of bounds
         """
         if not self.in_bounds(x, y):
             raise ValueError("Position hors limites.")
+        if isinstance(room, RoomView):
+            room = room.materialize()  # Seule la pièce choisie devient une vraie Room
         self.grid[y][x] = room
-        
-        # Remove the original room from room_catalog (not rotated copies)
-        # Find the original room by name in the catalog
-        for catalog_room in self.room_catalog[:]:  # Use slice to iterate over copy
-            if catalog_room.name == room.name:
-                self.room_catalog.remove(catalog_room)  # Remove single matching instance; other duplicates remain available
-                break
+        self.room_catalog.remove(room.name)  # Other copies of the same kind remain available
+        if room.name not in self.room_catalog:
+            self.placement_index.discard(room.name)
+        self.draft_pools.refresh((room.name,))  # Un exemplaire de moins : poids du type mis à jour
+        return room
+
+    # ---------------- effets qui changent les tirages ----------------
+    @property
+    def green_draw_bonus(self):
+        """Greenhouse bonus on the weight of green rooms (see get_room_weight)."""
+        return self._green_draw_bonus
+
+    @green_draw_bonus.setter
+    def green_draw_bonus(self, value):
+        if value != self._green_draw_bonus:
+            self._green_draw_bonus = value
+            self.draft_pools.refresh_where(lambda room: room.color == "green")
+
+    @property
+    def rarity_bias(self):
+        """Library bias on the weight of rooms of rarity >= 2 (see get_room_weight)."""
+        return self._rarity_bias
+
+    @rarity_bias.setter
+    def rarity_bias(self, value):
+        if value != self._rarity_bias:
+            self._rarity_bias = value
+            self.draft_pools.refresh_where(lambda room: room.rarity >= 2)
+
+    @property
+    def green_rooms_free(self):
+        """Terrace effect: green rooms are offered for 0 gem (see offer_cost)."""
+        return self._green_rooms_free
+
+    @green_rooms_free.setter
+    def green_rooms_free(self, value):
+        if value != self._green_rooms_free:
+            self._green_rooms_free = value
+            self.draft_pools.refresh_where(lambda room: room.color == "green")
+
+    def offer_cost(self, room):
+        """Return the gem cost of a room when offered in a draft.
+
+        Parameters:
+        - room: Room, catalog template
+
+        Returns:
+        - int: 0 for green rooms under the Terrace effect, else room.gem_cost
+        """
+        if self.green_rooms_free and room.color == "green":
+            return 0
+        return room.gem_cost
+
+    def room_weight_key(self, room):
+        """Return the key of a room's weight in room_weights.
+
+        Returns:
+        - tuple: (name, green_draw_bonus, rarity_bias), each bonus replaced
+          by 0 when it does not apply to the room (not green, rarity < 2)
+        """
+        return (room.name,
+                self._green_draw_bonus if room.color == "green" else 0,
+                self._rarity_bias if room.rarity >= 2 else 0)
 
     def get_room_weight(self, room):
         """Calculate weighted probability for room draw.
@@ -1606,23 +1692,30 @@ class Manor:
         - room: Room instance
         
         Returns:
-        - float: weight = base_weight × (1/3)^rarity × bonuses
+        - float: weight = base_weight × (1/3)^rarity × bonuses, computed once
+          per kind and bonus values (see room_weights)
         
         Bonuses:
         - Greenhouse: green rooms get (1 + green_draw_bonus) multiplier
         - Library: rarity ≥ 2 rooms get (1 + rarity_bias) multiplier
         """
-        w = room.base_weight * (1.0 / 3.0) ** room.rarity
+        key = self.room_weight_key(room)
+        w = self.room_weights.get(key)
+        if w is not None:
+            return w
+
+        _, green_bonus, rarity_bias = key
+        w = room_base_weight(room)
 
         # Bonus Greenhouse
-        if getattr(self, "green_draw_bonus", 0) > 0 and room.color == "green":
-            w *= (1 + self.green_draw_bonus)  # Linear scaling per Greenhouse visit
+        if green_bonus > 0:
+            w *= (1 + green_bonus)  # Linear scaling per Greenhouse visit
 
         # Bonus Library (pièces rarity >= 2)
-        if getattr(self, "rarity_bias", 0) > 0 and room.rarity >= 2:
-            w *= (1 + self.rarity_bias)  # Library bias makes rare rooms more likely cumulatively
+        if rarity_bias > 0:
+            w *= (1 + rarity_bias)  # Library bias makes rare rooms more likely cumulatively
 
-        return w
+        return self.room_weights.put(key, w)
 
 
 
@@ -1633,17 +1726,23 @@ class Manor:
         Parameters:
         - current_pos: tuple[int, int], player's (x, y) position
         - direction: str, direction player is opening ("up"/"down"/"left"/"right")
-        - room_catalog: list[Room], available rooms
+        - room_catalog: RoomCatalog, available rooms
         
         Returns:
-        - list[Room]: up to 3 room instances (may include rotations)
+        - list[RoomView]: up to 3 candidates (template + rotation), never two
+          of the same kind; place_room() turns the chosen one into a Room
         
-        Filtering rules:
+        Filtering rules (looked up in placement_index, see PlacementIndex):
         - Rooms must have compatible door (opposite of direction)
         - All room doors must point within manor bounds
         - Respects placement_condition (edge/center/top/bottom)
-        - No duplicate room names in draw
+        - No duplicate room names in draw (first fitting rotation of each kind)
         - Guarantees at least one free room (gem_cost == 0)
+
+        Sampling (draft_pools, see DraftPools): the free room and the two
+        others are drawn without replacement from WeightedSampler trees
+        kept up to date, in O(log n) each, instead of rebuilding the
+        weights of every candidate.
         
         Weight modifiers:
         - Terrace effect: green rooms become free
@@ -1655,110 +1754,48 @@ class Manor:
         nx, ny = x + dx, y + dy
         # (nx, ny) is the target placement coordinate for the new room
         
-        # Get all possible room rotations that match the required door
-        required_door = self.opposite_direction[direction]
-        possible_rooms = []
-        
-        for room in room_catalog:
-            # Try all rotations; keep only the first rotation whose door layout matches to avoid duplicate same room names
-            for rotated_room in room.get_all_rotations():
-                if required_door in rotated_room.doors:
-                    # Check placement condition on TARGET position (nx, ny)
-                    cond = rotated_room.placement_condition
-                    
-                    if cond == "edge" and not (nx in (0, self.WIDTH - 1) or ny in (0, self.HEIGHT - 1)):
-                        continue
-                    if cond == "center" and (nx in (0, self.WIDTH - 1) or ny in (0, self.HEIGHT - 1)):
-                        continue
-                    if cond == "top" and ny != 0:
-                        continue
-                    if cond == "bottom" and ny != self.HEIGHT - 1:
-                        continue
-                    
-                    # Check that no rotated door would point outside the manor bounds from target cell
-                    valid_doors = True
-                    for door in rotated_room.doors:
-                        door_dx, door_dy = self.get_direction_offset(door)
-                        check_x, check_y = nx + door_dx, ny + door_dy
-                        if not self.in_bounds(check_x, check_y):
-                            valid_doors = False
-                            break
-                    
-                    if not valid_doors:
-                        continue
-                    
-                    possible_rooms.append(rotated_room)
-                    break  # Only add one rotation per room to avoid duplicates
-
-        # Filtrer selon les conditions de placement
-        filtered_rooms = []
-        for room in possible_rooms:
-            cond = room.placement_condition
-
-            if cond == "edge" and not (x in (0, self.WIDTH - 1) or y in (0, self.HEIGHT - 1)):
-                continue
-            if cond == "center" and (x in (0, self.WIDTH - 1) or y in (0, self.HEIGHT - 1)):
-                continue
-            if cond == "top" and y != 0:
-                continue
-            if cond == "bottom" and y != self.HEIGHT - 1:
-                continue
-
-            filtered_rooms.append(room)
+        # Types compatibles avec la case cible (condition, porte requise, portes dans la grille)
+        if not self.in_bounds(nx, ny):
+            return []
+        required_door = OPPOSITE_BITS[direction]
+        index, pools = self.placement_index, self.draft_pools
+        if room_catalog is not self.room_catalog:
+            index = PlacementIndex(room_catalog, self.WIDTH, self.HEIGHT)
+            pools = DraftPools(self, room_catalog)
+        situation = (self.cell_classes[ny][nx], required_door, self.bounds_masks[ny][nx])
+        if not index.candidates(*situation):
+            return []  # Aucune pièce compatible : rien à tirer
+
+        # Candidats = (modèle, quarts de tour) filtrés selon les conditions de placement
+        # (aussi vérifiées sur la case du joueur) ; leurs poids sont tenus à jour dans le pool
+        pool = pools.pool(situation, self.cell_classes[y][x])
+        pools.sync(pool)
 
         # Si aucune pièce compatible, on propose la pioche complète
-        if not filtered_rooms:
-            filtered_rooms = self.pioche.copy()
-
-        # Effet Terrace : toutes les pièces vertes deviennent gratuites
-        if self.green_rooms_free:
-            for r in filtered_rooms:
-                if getattr(r, "color", "") == "green":
-                    r.gem_cost = 0
-
-        # Assurer au moins une pièce gratuite
-        free_rooms = [r for r in filtered_rooms if r.gem_cost == 0]
-        if not free_rooms:
+        if not pool.live:
+            pool = pools.pool(None, None)
+            pools.sync(pool)
+
+        # garantir une pièce gratuite (chaque exemplaire disponible compte pour une chance)
+        first_pick = pool.free.sample(random)
+        forced_free = first_pick is None
+        if forced_free:
             # Si vraiment aucune gratuite, on force la première à coûter 0
             # (choix arbitraire mais conforme à la règle du projet)
-            filtered_rooms[0].gem_cost = 0
-            free_rooms = [filtered_rooms[0]]
-
-        # garantir une pièce gratuite
-        choices = []
-        first_pick = random.choice(free_rooms)
-        choices.append(first_pick)
-
-        # calcul des poids
-        pool = [r for r in filtered_rooms if r not in choices]
-        weights = [self.get_room_weight(r) for r in pool]
-
-        # tirage des 2 autres rooms
-        for _ in range(2):
-            if not pool:
-                break
-            total_w = sum(weights)
-            r = random.random() * total_w
-
-            cum = 0
-            idx = 0
-            for i, w in enumerate(weights):
-                cum += w
-                if r <= cum:
-                    idx = i
-                    break
-
-            # Ajouter la pièce tirée
-            choices.append(pool[idx])
-
-            # Retirer du pool
-            del pool[idx]
-            del weights[idx]
-        # If no compatible rooms (original possible_rooms list empty), return empty set
-        if not possible_rooms:
-            return []
-
-        return choices[:3]  # Weighted selection result
+            first_pick = pool.weights.find(0.0)
+        choices = [first_pick]
+
+        # tirage des 2 autres rooms sans remise : poids du type x nombre d'exemplaires restants
+        while len(choices) < min(3, pool.live):
+            choices.append(pool.weights.sample(random, choices))
+
+        # Seules les pièces proposées deviennent des vues (la Room est construite par place_room)
+        views = []
+        for slot in choices:
+            template, turns = pool.entries[slot]
+            cost = 0 if forced_free and slot == first_pick else self.offer_cost(template)
+            views.append(RoomView(template, turns, cost))
+        return views
     
     def get_direction_offset(self, direction):
         """Convert direction string to grid offset.
@@ -1785,10 +1822,11 @@ class Manor:
         Parameters:
         - position: tuple[int, int], current (x, y)
         - direction: str, movement direction
-        - room_catalog: list[Room], available rooms
+        - room_catalog: RoomCatalog, available rooms
         
         Returns:
-        - list[Room]: rooms with compatible opposite door
+        - list[Room]: one definition per available kind with a compatible
+          opposite door (read-only templates)
         
         Requirements:
         - Target cell must be empty and in bounds
@@ -1801,8 +1839,8 @@ class Manor:
         if not self.in_bounds(nx, ny) or self.get_room(nx, ny):
             return []
 
-        required_door = self.opposite_direction[direction]
-        return [r for r in room_catalog if required_door in getattr(r, "doors", [])]
+        required_door = OPPOSITE_BITS[direction]
+        return [r for r in room_catalog if r.doors & required_door]
 
     def can_advance(self):
         """Check if any movement is possible (for game over condition).
@@ -1813,15 +1851,16 @@ class Manor:
         Scans all placed rooms (except Antechamber) for available expansions.
         """
         for y in range(self.HEIGHT):
+            row = self.grid[y]
+            masks = self.bounds_masks[y]
             for x in range(self.WIDTH):
-                room = self.get_room(x, y)
-                if isinstance(room, Antechamber):
+                room = row[x]
+                if room is None or room.name == "Antechamber":
                     continue
-                if room:
-                    for direction in room.doors:
-                        dx, dy = self.get_direction_offset(direction)
-                        nx, ny = x + dx, y + dy
-                        if self.in_bounds(nx, ny) and not self.get_room(nx, ny):
-                            if self.get_possible_rooms((x, y), direction, self.room_catalog):
-                                return True
-        return False
\ No newline at end of file
+                open_doors = room.doors & masks[x]  # Portes qui mènent dans la grille
+                for bit, (dx, dy) in DOOR_OFFSETS.items():
+                    if open_doors & bit and self.grid[y + dy][x + dx] is None:
+                        # Même test que get_possible_rooms, sans construire la liste
+                        if self.placement_index.has_door(OPPOSITE_DOOR[bit]):
+                            return True
+        return False
@@ -0,0 +1,34 @@
+import argparse
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from blueprince.assetpack import PACK_PATH, build_pack, load_pack
+
+
+# Construit le pack binaire des sprites de pièces (à lancer depuis la racine du projet)
+def main():
+    parser = argparse.ArgumentParser(description="Build the pre-baked room sprite pack")
+    parser.add_argument("--output", default=PACK_PATH)
+    parser.add_argument("--check", action="store_true",
+                        help="only report whether the existing pack is up to date")
+    args = parser.parse_args()
+
+    if args.check:
+        pack = load_pack(args.output)
+        if pack is None:
+            print(f"{args.output}: missing or unreadable")
+            raise SystemExit(1)
+        if pack.is_stale():
+            print(f"{args.output}: stale sources: {', '.join(sorted(pack.stale_sources))}")
+            raise SystemExit(1)
+        print(f"{args.output}: up to date ({len(pack.entries)} sprites)")
+        return
+
+    summary = build_pack(args.output)
+    print(f"{args.output}: {summary['sources']} sources, {summary['entries']} sprites, "
+          f"{summary['bytes'] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
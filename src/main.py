@@ -1,11 +1,41 @@
-from blueprince.game import Game
+import argparse
+import json
+import os
+
 
 # Main entry point for the Blue Prince game
 def main():
+    parser = argparse.ArgumentParser(description="Blue Prince")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="time each startup phase and print a JSON report instead of playing")
+    parser.add_argument("--profile-output", metavar="FILE",
+                        help="write the --profile-startup report to FILE instead of stdout")
+    parser.add_argument("--simulate", type=int, metavar="RUNS",
+                        help="play RUNS random runs without window (no pygame needed) and print a JSON summary")
+    parser.add_argument("--seed", type=int, help="random seed for --simulate")
+    args = parser.parse_args()
+
+    if args.simulate is not None:
+        from blueprince.simulate import simulate
+        print(json.dumps(simulate(args.simulate, seed=args.seed), indent=2))
+        return
+
+    if args.profile_startup:
+        # Rien de blueprince importé avant : les coûts d'import sont mesurés par le profileur
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout = JSON uniquement
+        from blueprince.profiling import profile_startup
+        report = json.dumps(profile_startup(), indent=2)
+        if args.profile_output:
+            with open(args.profile_output, "w", encoding="utf-8") as f:
+                f.write(report + "\n")
+        else:
+            print(report)
+        return
+
+    from blueprince.game import Game
     game = Game()
     game.run()
 
 
 if __name__ == "__main__":
     main()
- 
\ No newline at end of file